@@ -0,0 +1,59 @@
+import numpy as np
+
+from qflow.hamiltonian import get_heisenberg_hamiltonian, get_maxcut_hamiltonian
+from qflow.hamiltonian.utils_hamiltonian import get_eigenvalues_hamiltonian
+from qflow.utils.maxcut_utils import get_maxcut_graph
+
+
+class HeisenbergHamiltonian:
+    params = [3, 5, 8]
+    param_names = ["n_spins"]
+
+    def time_get_heisenberg_hamiltonian(self, n_spins):
+        get_heisenberg_hamiltonian(n_spins, periodic=True)
+
+
+class EigenvaluesDiagonal:
+    params = [8, 12, 16]
+    param_names = ["num_nodes"]
+
+    def setup(self, num_nodes):
+        self.H = get_maxcut_hamiltonian(get_maxcut_graph(num_nodes, seed=0))
+
+    def time_get_eigenvalues_hamiltonian(self, num_nodes):
+        get_eigenvalues_hamiltonian(self.H)
+
+    def peakmem_get_eigenvalues_hamiltonian(self, num_nodes):
+        get_eigenvalues_hamiltonian(self.H)
+
+
+class EigenvaluesDense:
+    params = [2, 3]
+    param_names = ["n_spins"]
+
+    def setup(self, n_spins):
+        self.H = get_heisenberg_hamiltonian(n_spins)
+
+    def time_get_eigenvalues_hamiltonian(self, n_spins):
+        get_eigenvalues_hamiltonian(self.H)
+
+
+class MolecularHamiltonian:
+    # linear hydrogen chains, 2 * num_atoms qubits in sto-6g
+    params = [2, 4]
+    param_names = ["num_atoms"]
+    number = 1
+    repeat = 2
+
+    def setup(self, num_atoms):
+        try:
+            import pyscf  # noqa: F401
+        except ImportError:
+            raise NotImplementedError("pyscf is not installed.")
+        self.symbols = ["H"] * num_atoms
+        self.coordinates = np.array([[0.0, 0.0, 1.4 * k] for k in range(num_atoms)])
+
+    def time_molecular_hamiltonian(self, num_atoms):
+        from qflow.hamiltonian.molecule import molecular_hamiltonian
+
+        molecular_hamiltonian(self.symbols, self.coordinates, cache=False)
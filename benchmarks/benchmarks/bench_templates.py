@@ -0,0 +1,44 @@
+import pennylane as qml
+
+from qflow.templates.examples import barren_plateau_example, maxcut_qaoa_example
+from qflow.templates.state_preparation import DickeState
+
+
+class DickeStateInit:
+    params = ([8, 12, 16, 20], ["statevector", "gates"])
+    param_names = ["num_qubits", "method"]
+
+    def time_dicke_state_init(self, num_qubits, method):
+        DickeState(num_qubits, num_qubits // 2, method=method)
+
+    def peakmem_dicke_state_init(self, num_qubits, method):
+        DickeState(num_qubits, num_qubits // 2, method=method)
+
+
+class TemplateExecution:
+    params = ([4, 8, 12], ["maxcut_qaoa", "barren_plateau"])
+    param_names = ["num_qubits", "example"]
+
+    def setup(self, num_qubits, example):
+        if example == "maxcut_qaoa":
+            circuit, H, _ = maxcut_qaoa_example(num_layers=2, num_nodes=num_qubits)
+        else:
+            circuit, H, _ = barren_plateau_example(num_layers=2, num_qubits=num_qubits)
+        dev = qml.device("default.qubit", wires=circuit.wires)
+
+        @qml.qnode(dev)
+        def cost_fn(params):
+            circuit(params)
+            return qml.expval(H)
+
+        self.cost_fn = cost_fn
+        self.params = circuit.init(0)
+        self.grad_fn = qml.grad(cost_fn)
+        # compile the circuit outside of the timing
+        cost_fn(self.params)
+
+    def time_forward(self, num_qubits, example):
+        self.cost_fn(self.params)
+
+    def time_gradient(self, num_qubits, example):
+        self.grad_fn(self.params)
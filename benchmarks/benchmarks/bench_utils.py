@@ -0,0 +1,33 @@
+from qflow.utils.maxcut_utils import get_maxcut_costs, get_maxcut_graph
+from qflow.utils.utils import get_all_bitstrings
+
+
+class GetAllBitstrings:
+    params = [10, 14, 18]
+    param_names = ["n_bits"]
+
+    def time_get_all_bitstrings(self, n_bits):
+        get_all_bitstrings(n_bits)
+
+    def peakmem_get_all_bitstrings(self, n_bits):
+        get_all_bitstrings(n_bits)
+
+
+class GetMaxcutCosts:
+    params = [12, 16, 20]
+    param_names = ["num_nodes"]
+
+    def setup(self, num_nodes):
+        self.graph = get_maxcut_graph(num_nodes, seed=0)
+
+    def time_get_maxcut_costs(self, num_nodes):
+        get_maxcut_costs(self.graph)
+
+    def peakmem_get_maxcut_costs(self, num_nodes):
+        get_maxcut_costs(self.graph)
+
+    def track_cost_bytes(self, num_nodes):
+        # the output alone, the intermediates are covered by peakmem
+        return get_maxcut_costs(self.graph).nbytes
+
+    track_cost_bytes.unit = "bytes"
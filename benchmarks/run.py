@@ -0,0 +1,295 @@
+"""Run the asv style benchmarks without asv, store baselines and compare against them.
+
+The benchmark classes in benchmarks/bench_*.py follow the asv conventions:
+`params` and `param_names`, an optional `setup`, and methods prefixed with
+time_ (seconds per call), peakmem_ (peak traced allocation in bytes) or
+track_ (the returned value). They also run with `asv run` from this directory.
+
+Example:
+$ python benchmarks/run.py --save reference        # store a baseline
+$ python benchmarks/run.py --compare reference     # report regressions
+$ python benchmarks/run.py -b maxcut --compare reference --factor 1.5
+
+A benchmark regresses if its value grows by more than `factor` with respect
+to the baseline. Since absolute timings depend on the machine, the growth
+between consecutive sizes of the first parameter is compared as well: an
+accidental O(4^n) intermediate in an O(2^n) function doubles the growth per
+qubit on any machine and is reported as a scaling regression.
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = os.path.join(BENCHMARK_DIR, "baselines")
+PREFIXES = {"time_": "seconds", "peakmem_": "bytes", "track_": None}
+# timings below this are dominated by noise and never flagged
+MIN_SECONDS = 1e-5
+
+
+def discover() -> List[type]:
+    """Import benchmarks/bench_*.py and return the benchmark classes."""
+    sys.path.insert(0, BENCHMARK_DIR)
+    package = os.path.join(BENCHMARK_DIR, "benchmarks")
+    classes = []
+    for filename in sorted(os.listdir(package)):
+        if filename.startswith("bench_") and filename.endswith(".py"):
+            module = importlib.import_module(f"benchmarks.{filename[:-3]}")
+            classes.extend(
+                obj
+                for _, obj in inspect.getmembers(module, inspect.isclass)
+                if obj.__module__ == module.__name__
+            )
+    return classes
+
+
+def _param_grid(cls: type) -> List[tuple]:
+    params = getattr(cls, "params", [])
+    if not params:
+        return [()]
+    if len(getattr(cls, "param_names", [])) > 1:
+        return list(itertools.product(*params))
+    return [(value,) for value in params]
+
+
+def _time(fn, args: tuple, number: Optional[int], repeat: int, sample_time: float):
+    """The minimum and median seconds per call, calibrated as in timeit."""
+    # the first call also warms up caches and lazy imports
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    if number is None:
+        number = max(1, int(sample_time / max(elapsed, 1e-9)))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        samples.append((time.perf_counter() - start) / number)
+    samples.sort()
+    return samples[0], samples[len(samples) // 2]
+
+
+def _peakmem(fn, args: tuple) -> int:
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(
+    pattern: str = "", repeat: Optional[int] = None, sample_time: float = 0.05
+) -> Dict[str, Any]:
+    """Run the benchmarks whose name matches the pattern.
+
+    Args:
+        pattern (str, optional): A regular expression of the benchmark names
+            module.Class.method. Defaults to "", i.e. all benchmarks.
+        repeat (int, optional): The number of timing samples, overrides the
+            `repeat` attribute of the classes. Defaults to 5.
+        sample_time (float, optional): The minimum duration of a timing sample
+            in seconds, used unless a class sets `number`. Defaults to 0.05.
+
+    Returns:
+        Dict[str, Any]: The machine, commit and per benchmark its unit,
+            parameter names and the value per parameter combination.
+    """
+    results = dict()
+    for cls in discover():
+        for name, method in inspect.getmembers(cls, inspect.isfunction):
+            prefix = next((p for p in PREFIXES if name.startswith(p)), None)
+            full_name = f"{cls.__module__.split('.')[-1]}.{cls.__name__}.{name}"
+            if prefix is None or not re.search(pattern, full_name):
+                continue
+            entry = results[full_name] = {
+                "unit": PREFIXES[prefix] or getattr(method, "unit", None),
+                "param_names": list(getattr(cls, "param_names", [])),
+                "values": dict(),
+            }
+            for args in _param_grid(cls):
+                key = json.dumps(list(args))
+                instance = cls()
+                try:
+                    if hasattr(instance, "setup"):
+                        instance.setup(*args)
+                except NotImplementedError:
+                    entry["values"][key] = None
+                    continue
+                fn = getattr(instance, name)
+                if prefix == "time_":
+                    value, median = _time(
+                        fn,
+                        args,
+                        getattr(cls, "number", None),
+                        repeat or getattr(cls, "repeat", 5),
+                        sample_time,
+                    )
+                    print(
+                        f"{full_name}{list(args)}: {value:.3g} s (median {median:.3g} s)"
+                    )
+                elif prefix == "peakmem_":
+                    value = _peakmem(fn, args)
+                    print(f"{full_name}{list(args)}: {value / 2**20:.3g} MiB")
+                else:
+                    value = fn(*args)
+                    print(f"{full_name}{list(args)}: {value}")
+                entry["values"][key] = value
+                if hasattr(instance, "teardown"):
+                    instance.teardown(*args)
+    return {"machine": _machine(), "commit": _commit(), "results": results}
+
+
+def _machine() -> Dict[str, Any]:
+    return {
+        "node": platform.node(),
+        "python": platform.python_version(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARK_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _significant(value: Optional[float], unit: Optional[str]) -> bool:
+    return value is not None and (unit != "seconds" or value >= MIN_SECONDS)
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    factor: float = 2.0,
+    scaling_factor: float = 2.0,
+) -> List[Dict[str, Any]]:
+    """Compare results against a baseline.
+
+    Args:
+        baseline (Dict[str, Any]): The baseline, see `run_benchmarks`.
+        current (Dict[str, Any]): The new results.
+        factor (float, optional): The ratio current / baseline above which a
+            value is a regression. Defaults to 2.0.
+        scaling_factor (float, optional): The ratio of the growth between
+            consecutive sizes above which a benchmark scales worse than the
+            baseline. Defaults to 2.0.
+
+    Returns:
+        List[Dict[str, Any]]: One row per benchmark and parameter combination
+            with the baseline and current value, their ratio and the status
+            "ok", "regression", "improvement", "scaling" or "new".
+    """
+    rows = []
+    for name, entry in current["results"].items():
+        unit = entry["unit"]
+        reference = baseline["results"].get(name, {"values": dict()})["values"]
+        for key, value in entry["values"].items():
+            base = reference.get(key)
+            row = {"name": name, "params": key, "baseline": base, "current": value}
+            if not (_significant(base, unit) and _significant(value, unit)):
+                row.update(ratio=None, status="new" if base is None else "ok")
+            else:
+                ratio = value / base if base else float("inf")
+                status = "ok"
+                if ratio > factor:
+                    status = "regression"
+                elif ratio < 1 / factor:
+                    status = "improvement"
+                row.update(ratio=ratio, status=status)
+            rows.append(row)
+
+        # the growth along the first parameter, with the others fixed
+        keys = [json.loads(key) for key in entry["values"]]
+        for a, b in itertools.combinations(keys, 2):
+            if a[1:] != b[1:] or not all(
+                isinstance(x[0], (int, float)) for x in (a, b)
+            ):
+                continue
+            a, b = sorted([a, b])
+            if any(k for k in keys if k[1:] == a[1:] and a[0] < k[0] < b[0]):
+                continue
+            values = [entry["values"][json.dumps(k)] for k in (a, b)]
+            bases = [reference.get(json.dumps(k)) for k in (a, b)]
+            if not all(_significant(v, unit) for v in values + bases):
+                continue
+            growth = (values[1] / values[0]) / (bases[1] / bases[0])
+            if growth > scaling_factor:
+                rows.append(
+                    {
+                        "name": name,
+                        "params": f"{json.dumps(a)} -> {json.dumps(b)}",
+                        "baseline": bases[1] / bases[0],
+                        "current": values[1] / values[0],
+                        "ratio": growth,
+                        "status": "scaling",
+                    }
+                )
+    return rows
+
+
+def _format(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3g}"
+
+
+def report(rows: List[Dict[str, Any]]) -> str:
+    """Format the comparison as a table, the regressions first."""
+    order = {"scaling": 0, "regression": 1, "improvement": 2, "new": 3, "ok": 4}
+    rows = sorted(rows, key=lambda row: (order[row["status"]], row["name"]))
+    lines = [f"{'status':<12} {'ratio':>8} {'baseline':>10} {'current':>10}  benchmark"]
+    for row in rows:
+        lines.append(
+            f"{row['status']:<12} {_format(row['ratio']):>8} "
+            f"{_format(row['baseline']):>10} {_format(row['current']):>10}  "
+            f"{row['name']} {row['params']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-b", "--bench", default="", help="Regex of benchmark names.")
+    parser.add_argument("--repeat", type=int, default=None, help="Timing samples.")
+    parser.add_argument("--save", help="Store the results as baselines/SAVE.json.")
+    parser.add_argument("--compare", help="Compare with baselines/COMPARE.json.")
+    parser.add_argument("--factor", type=float, default=2.0)
+    parser.add_argument("--scaling-factor", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.bench, repeat=args.repeat)
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(os.path.join(BASELINE_DIR, f"{args.save}.json"), "w") as f:
+            json.dump(results, f, indent=1)
+    if not args.compare:
+        return 0
+
+    with open(os.path.join(BASELINE_DIR, f"{args.compare}.json")) as f:
+        baseline = json.load(f)
+    rows = compare(baseline, results, args.factor, args.scaling_factor)
+    print(report(rows))
+    return int(any(row["status"] in ("regression", "scaling") for row in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
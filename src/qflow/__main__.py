@@ -0,0 +1,55 @@
+import argparse
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """The qflow command line interface.
+
+    Example:
+    $ qflow sweep sweep.toml --max-workers 4
+    $ python -m qflow sweep sweep.json --dry-run
+    """
+    parser = argparse.ArgumentParser(prog="qflow")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sweep = commands.add_parser(
+        "sweep", help="Run a grid of optimizations from a .json or .toml config."
+    )
+    sweep.add_argument("config", help="The path of the sweep config.")
+    sweep.add_argument(
+        "--max-workers", type=int, default=None, help="The number of parallel jobs."
+    )
+    sweep.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the jobs in schedule order without running them.",
+    )
+    args = parser.parse_args(argv)
+
+    from qflow.sweep import (
+        estimate_job_cost,
+        expand_grid,
+        job_id,
+        load_sweep_config,
+        run_sweep,
+    )
+
+    config = load_sweep_config(args.config)
+    if args.dry_run:
+        for job in sorted(expand_grid(config), key=estimate_job_cost, reverse=True):
+            print(job_id(job), job)
+        return 0
+
+    summary = run_sweep(config, max_workers=args.max_workers)
+    print(
+        f"{len(summary.completed)} completed, {len(summary.skipped)} skipped, "
+        f"{len(summary.failed)} failed, results in {config['output_dir']}"
+    )
+    for failed_id, reason in summary.failed.items():
+        print(f"{failed_id} failed: {reason}", file=sys.stderr)
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def attach(
+    package: str, submodules: Dict[str, List[str]]
+) -> Tuple[Callable, Callable, List[str]]:
+    """Export the names of submodules from a package without importing them.
+
+    The submodule of a name is imported on first access through the module
+    level `__getattr__` of the package (PEP 562), e.g. `from qflow.hamiltonian
+    import get_maxcut_hamiltonian` does not import pyscf. The attribute is
+    then cached on the package.
+
+    Args:
+        package (str): The `__name__` of the package.
+        submodules (Dict[str, List[str]]): Per absolute submodule name, the
+            names it exports.
+
+    Returns:
+        Tuple[Callable, Callable, List[str]]: The `__getattr__`, `__dir__` and
+            `__all__` of the package.
+
+    Example:
+    >>> __getattr__, __dir__, __all__ = attach(
+    ...     __name__, {"qflow.hamiltonian.maxcut": ["get_maxcut_hamiltonian"]}
+    ... )
+    """
+    owners = {name: module for module, names in submodules.items() for name in names}
+    names = sorted(owners)
+
+    def __getattr__(name: str):
+        if name not in owners:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(owners[name]), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return names
+
+    return __getattr__, __dir__, names
@@ -3,9 +3,9 @@ from typing import Callable
 
 import numpy as np
 
+from qflow.instrumentation import count, phase
+
 
-# TODO Should there be a function step_and_cost? It returns the params and
-# the value of the objective function.
 class AbstractOptimizer(abc.ABC):
     """
     Abstract class for an optimizer.
@@ -19,5 +19,26 @@ class AbstractOptimizer(abc.ABC):
     def step(self, fun: Callable, x0: np.ndarray):
         pass
 
+    def step_and_cost(self, fun: Callable, x0: np.ndarray, *args, **kwargs):
+        """Update the parameters with one step and evaluate the cost at the new parameters.
+
+        The step and the cost evaluation are timed as the phases "step" and
+        "cost" of an active `Profiler`.
+
+        Args:
+            fun (Callable): The objective function.
+            x0 (np.ndarray): The current parameters.
+            *args, **kwargs: Passed to `step`.
+
+        Returns:
+            Tuple[np.ndarray, float]: The new parameters and their cost.
+        """
+        count("steps")
+        with phase("step"):
+            params = self.step(fun, x0, *args, **kwargs)
+        with phase("cost"):
+            cost = fun(params)
+        return params, cost
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}"
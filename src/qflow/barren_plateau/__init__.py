@@ -0,0 +1,13 @@
+from qflow._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "qflow.barren_plateau.simulator": ["barren_plateau_gradients"],
+        "qflow.barren_plateau.study": [
+            "GradientVarianceResult",
+            "RunningStats",
+            "gradient_variance_study",
+        ],
+    },
+)
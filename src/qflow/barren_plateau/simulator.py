@@ -0,0 +1,100 @@
+from typing import Tuple
+
+import numpy as np
+
+from qflow.utils.utils import pairwise
+
+_PAULIS = np.array(
+    [
+        [[0, 1], [1, 0]],  # RX
+        [[0, -1j], [1j, 0]],  # RY
+        [[1, 0], [0, -1]],  # RZ
+    ],
+    dtype=np.complex128,
+)
+
+
+def _rotations(gate_codes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """Return the (..., 2, 2) matrices exp(-i theta / 2 P) of the coded rotations."""
+    cos = np.cos(params / 2)[..., None, None]
+    sin = np.sin(params / 2)[..., None, None]
+    return cos * np.eye(2) - 1j * sin * _PAULIS[gate_codes]
+
+
+def _apply_1q(state: np.ndarray, matrices: np.ndarray, wire: int) -> np.ndarray:
+    """Apply one (B, 2, 2) matrix per batch element to a (B, 2, ..., 2) state."""
+    batch = state.shape[0]
+    state = state.reshape(batch, 2**wire, 2, -1)
+    state = np.einsum("bij,bajc->baic", matrices, state)
+    return state.reshape(batch, -1)
+
+
+def _entangler_phases(num_qubits: int) -> np.ndarray:
+    """The diagonal of the CZ gates of one layer of `BarrenPlateauCircuit`."""
+    bits = (
+        np.arange(2**num_qubits)[:, None] >> np.arange(num_qubits - 1, -1, -1)
+    ) & 1
+    wires = list(range(num_qubits))
+    pairs = list(pairwise(wires)) + list(pairwise(np.roll(wires, -1)))
+    parity = np.zeros(2**num_qubits, dtype=np.int64)
+    for u, v in pairs:
+        parity ^= bits[:, u] & bits[:, v]
+    return 1 - 2 * parity
+
+
+def barren_plateau_gradients(
+    gate_codes: np.ndarray, params: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute <Z0 Z1> and its gradient for a batch of barren plateau circuits.
+
+    The circuits are those of `BarrenPlateauCircuit`: RY(pi/4) on all qubits,
+    followed by layers of random rotations and CZ entanglers. All instances
+    are simulated at once as a (B, 2^n) statevector and the gradients are
+    computed with the adjoint method, i.e. with one backward sweep instead of
+    two shifted circuits per parameter.
+
+    Args:
+        gate_codes (np.ndarray): The (B, L, n) gate codes, see `sample_gate_codes`.
+        params (np.ndarray): The (B, L, n) rotation angles.
+
+    Raises:
+        ValueError: If there are less than two qubits.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (B,) energies and the (B, L, n)
+            gradients.
+    """
+    batch, num_layers, num_qubits = gate_codes.shape
+    if num_qubits < 2:
+        raise ValueError("The cost Z0 Z1 needs at least two qubits.")
+    index = np.arange(2**num_qubits)
+    cost = 1 - 2 * (((index >> (num_qubits - 1)) ^ (index >> (num_qubits - 2))) & 1)
+    phases = _entangler_phases(num_qubits)
+    rotations = _rotations(gate_codes, params)
+    paulis = _PAULIS[gate_codes]
+    ry = _rotations(np.ones(batch, dtype=np.int64), np.full(batch, np.pi / 4))
+
+    state = np.zeros((batch, 2**num_qubits), dtype=np.complex128)
+    state[:, 0] = 1.0
+    for wire in range(num_qubits):
+        state = _apply_1q(state, ry, wire)
+    for layer in range(num_layers):
+        for wire in range(num_qubits):
+            state = _apply_1q(state, rotations[:, layer, wire], wire)
+        state = state * phases
+
+    energies = np.einsum("bk,k,bk->b", state.conj(), cost, state).real
+    adjoint = state * cost
+    grads = np.zeros((batch, num_layers, num_qubits))
+    for layer in reversed(range(num_layers)):
+        state = state * phases
+        adjoint = adjoint * phases
+        for wire in reversed(range(num_qubits)):
+            generated = _apply_1q(state, paulis[:, layer, wire], wire)
+            grads[:, layer, wire] = np.einsum(
+                "bk,bk->b", adjoint.conj(), generated
+            ).imag
+            inverse = rotations[:, layer, wire].conj().transpose(0, 2, 1)
+            state = _apply_1q(state, inverse, wire)
+            adjoint = _apply_1q(adjoint, inverse, wire)
+    return energies, grads
@@ -0,0 +1,267 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Tuple
+
+import numpy as np
+import pennylane as qml
+from scipy import stats
+
+from qflow.barren_plateau.simulator import barren_plateau_gradients
+from qflow.templates.circuits.barren_plateau_circuit import (
+    BarrenPlateauCircuit,
+    sample_gate_codes,
+)
+
+
+class RunningStats:
+    """Mean and variance of a stream of samples (Welford's algorithm).
+
+    Batches are combined with the parallel update of Chan et al., so that
+    partial statistics of different workers can be merged without keeping
+    the samples.
+        https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+
+    Example:
+    >>> running = RunningStats().update([1.0, 2.0])
+    >>> running = running.merge(RunningStats().update([3.0, 4.0]))
+    >>> running.count, running.mean, running.variance
+    (4, 2.5, 1.6666666666666667)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        total = self.count + count
+        if total == 0:
+            return
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta**2 * self.count * count / total
+        self.count = total
+
+    def update(self, values: Iterable[float]) -> "RunningStats":
+        """Add a batch of samples and return self."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) > 0:
+            mean = float(np.mean(values))
+            self._combine(len(values), mean, float(np.sum((values - mean) ** 2)))
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Add the samples summarized by another `RunningStats` and return self."""
+        self._combine(other.count, other.mean, other.m2)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """The unbiased sample variance."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    def mean_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """The Student-t confidence interval of the mean."""
+        half_width = stats.t.ppf(0.5 + confidence / 2, self.count - 1) * np.sqrt(
+            self.variance / self.count
+        )
+        return self.mean - half_width, self.mean + half_width
+
+    def variance_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """The chi-squared confidence interval of the variance.
+
+        The interval assumes normally distributed samples and is therefore
+        only approximate for the bounded gradients of a circuit.
+        """
+        dof = self.count - 1
+        lower = stats.chi2.ppf(0.5 + confidence / 2, dof)
+        upper = stats.chi2.ppf(0.5 - confidence / 2, dof)
+        return self.m2 / lower, self.m2 / upper
+
+
+@dataclass(frozen=True)
+class GradientVarianceResult:
+    """The gradient statistics of one circuit size.
+
+    Attributes:
+        num_qubits (int): The number of qubits.
+        num_layers (int): The number of layers.
+        num_samples (int): The number of sampled circuits.
+        mean (float): The mean of the sampled derivatives.
+        variance (float): The variance of the sampled derivatives.
+        mean_ci (Tuple[float, float]): The confidence interval of the mean.
+        variance_ci (Tuple[float, float]): The confidence interval of the variance.
+    """
+
+    num_qubits: int
+    num_layers: int
+    num_samples: int
+    mean: float
+    variance: float
+    mean_ci: Tuple[float, float]
+    variance_ci: Tuple[float, float]
+
+
+def _pennylane_gradients(
+    gate_codes: np.ndarray, params: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Reference backend of `barren_plateau_gradients`, one qnode per circuit."""
+    _, num_layers, num_qubits = gate_codes.shape
+    circuit = BarrenPlateauCircuit(num_layers, num_qubits)
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def cost_fn(params):
+        circuit(params)
+        return qml.expval(circuit.H)
+
+    energies, grads = [], []
+    for codes, angles in zip(gate_codes, params):
+        circuit.gate_codes = codes
+        angles = qml.numpy.array(angles.ravel(), requires_grad=True)
+        energies.append(cost_fn(angles))
+        grads.append(qml.grad(cost_fn)(angles).reshape(num_layers, num_qubits))
+    return np.array(energies), np.array(grads)
+
+
+_BACKENDS = {
+    "numpy": barren_plateau_gradients,
+    "pennylane": _pennylane_gradients,
+}
+
+
+def _sample_chunk(
+    num_qubits: int,
+    num_layers: int,
+    num_samples: int,
+    batch_size: int,
+    seed: np.random.SeedSequence,
+    param_index: int,
+    backend: str,
+) -> RunningStats:
+    """Sample random circuits in batches and summarize one derivative."""
+    rng = np.random.default_rng(seed)
+    gradients = _BACKENDS[backend]
+    layer, wire = divmod(param_index, num_qubits)
+    running = RunningStats()
+    for start in range(0, num_samples, batch_size):
+        batch = min(batch_size, num_samples - start)
+        gate_codes = sample_gate_codes(num_layers, num_qubits, batch, seed=rng)
+        params = rng.uniform(-np.pi, np.pi, size=gate_codes.shape)
+        _, grads = gradients(gate_codes, params)
+        running.update(grads[:, layer, wire])
+    return running
+
+
+def gradient_variance_study(
+    num_qubits_list: Iterable[int],
+    num_layers_list: Iterable[int],
+    num_samples: int = 1000,
+    batch_size: int = 256,
+    max_workers: int = None,
+    seed: int = 0,
+    param_index: int = 0,
+    confidence: float = 0.95,
+    backend: str = "numpy",
+) -> Iterator[GradientVarianceResult]:
+    """Estimate the gradient variance of random barren plateau circuits.
+
+    For every number of qubits and layers, `num_samples` random circuits
+    (gate layouts and angles) of `BarrenPlateauCircuit` are drawn and the
+    derivative of <Z0 Z1> with respect to one parameter is computed. The
+    samples are split into chunks of `batch_size` circuits, which are
+    simulated batch-wise in a pool of worker processes; every chunk returns
+    only its running statistics, which are merged per circuit size.
+        https://arxiv.org/pdf/1803.11173.pdf
+
+    Every chunk has its own seed derived from (seed, qubits, layers, chunk),
+    so the results do not depend on `max_workers`.
+
+    Args:
+        num_qubits_list (Iterable[int]): The numbers of qubits (at least two).
+        num_layers_list (Iterable[int]): The numbers of layers.
+        num_samples (int, optional): The number of circuits per size.
+            Defaults to 1000.
+        batch_size (int, optional): The number of circuits simulated at once.
+            Defaults to 256.
+        max_workers (int, optional): The number of worker processes.
+            Defaults to the number of CPUs.
+        seed (int, optional): The root seed. Defaults to 0.
+        param_index (int, optional): The flat index of the differentiated
+            parameter. Defaults to 0.
+        confidence (float, optional): The confidence level of the intervals.
+            Defaults to 0.95.
+        backend (str, optional): "numpy" for the batched adjoint simulator or
+            "pennylane" for one qnode per circuit. Defaults to "numpy".
+
+    Yields:
+        GradientVarianceResult: The statistics of every circuit size, as soon
+            as all of its chunks are done, i.e. not in input order.
+
+    Raises:
+        ValueError: If the backend is unknown.
+
+    Example:
+    >>> for result in gradient_variance_study([2, 4, 6], [50], num_samples=200):
+    ...     print(result.num_qubits, result.variance, result.variance_ci)
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown backend {backend}, expected one of {list(_BACKENDS)}."
+        )
+
+    tasks = []
+    for num_qubits in num_qubits_list:
+        for num_layers in num_layers_list:
+            chunks = np.array_split(
+                np.arange(num_samples), max(1, int(np.ceil(num_samples / batch_size)))
+            )
+            for k, chunk in enumerate(chunks):
+                chunk_seed = np.random.SeedSequence([seed, num_qubits, num_layers, k])
+                tasks.append(
+                    (num_qubits, num_layers, len(chunk), batch_size, chunk_seed)
+                )
+    if not tasks:
+        return
+
+    remaining: Dict[Tuple[int, int], int] = dict()
+    merged: Dict[Tuple[int, int], RunningStats] = dict()
+    for num_qubits, num_layers, *_ in tasks:
+        key = (num_qubits, num_layers)
+        remaining[key] = remaining.get(key, 0) + 1
+        merged[key] = RunningStats()
+
+    def _result(key: Tuple[int, int]) -> GradientVarianceResult:
+        running = merged.pop(key)
+        return GradientVarianceResult(
+            num_qubits=key[0],
+            num_layers=key[1],
+            num_samples=running.count,
+            mean=running.mean,
+            variance=running.variance,
+            mean_ci=running.mean_interval(confidence),
+            variance_ci=running.variance_interval(confidence),
+        )
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if max_workers == 1:
+        for task in tasks:
+            key = task[:2]
+            merged[key].merge(_sample_chunk(*task, param_index, backend))
+            remaining[key] -= 1
+            if remaining[key] == 0:
+                yield _result(key)
+        return
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures = {
+            executor.submit(_sample_chunk, *task, param_index, backend): task[:2]
+            for task in tasks
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            merged[key].merge(future.result())
+            remaining[key] -= 1
+            if remaining[key] == 0:
+                yield _result(key)
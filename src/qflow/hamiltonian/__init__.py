@@ -1,8 +1,16 @@
-from qflow.hamiltonian.h2o_hamiltonian import get_h2o_hamiltonian
-from qflow.hamiltonian.h4_hamiltonian import get_h4_hamiltonian
-from qflow.hamiltonian.heisenberg import get_heisenberg_hamiltonian
-from qflow.hamiltonian.lih_hamiltonian import get_lih_hamiltonian
-from qflow.hamiltonian.maxcut import get_maxcut_hamiltonian
-from qflow.hamiltonian.transverse_field_ising import (
-    get_transverse_field_ising_hamiltonian,
+from qflow._lazy import attach
+
+# the molecular builders import pyscf and openfermion, load them on first use
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "qflow.hamiltonian.h2o_hamiltonian": ["get_h2o_hamiltonian"],
+        "qflow.hamiltonian.h4_hamiltonian": ["get_h4_hamiltonian"],
+        "qflow.hamiltonian.heisenberg": ["get_heisenberg_hamiltonian"],
+        "qflow.hamiltonian.lih_hamiltonian": ["get_lih_hamiltonian"],
+        "qflow.hamiltonian.maxcut": ["get_maxcut_hamiltonian"],
+        "qflow.hamiltonian.transverse_field_ising": [
+            "get_transverse_field_ising_hamiltonian"
+        ],
+    },
 )
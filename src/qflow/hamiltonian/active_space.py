@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ActiveSpace:
+    """An active space and its simulation cost.
+
+    Attributes:
+        active_electrons (int): The number of active electrons.
+        active_orbitals (int): The number of active spatial orbitals.
+        num_core (int): The number of doubly occupied core orbitals.
+        discarded_occupation (float): The summed deviation of the inactive
+            orbitals from integer occupation, sum_core (2 - n_i) + sum_virtual n_i.
+    """
+
+    active_electrons: int
+    active_orbitals: int
+    num_core: int
+    discarded_occupation: float
+
+    @property
+    def num_qubits(self) -> int:
+        """The number of qubits of the Jordan-Wigner Hamiltonian."""
+        return 2 * self.active_orbitals
+
+    @property
+    def statevector_bytes(self) -> int:
+        """The memory of a complex128 statevector on all qubits."""
+        return 16 * 2**self.num_qubits
+
+
+def select_active_space(
+    no_occ: np.ndarray,
+    num_electrons: int,
+    threshold: float = 0.02,
+    max_orbitals: Optional[int] = None,
+) -> ActiveSpace:
+    """Select the smallest active space from natural orbital occupations.
+
+    Orbitals outside of the active space are either doubly occupied (core) or
+    empty (virtual), and the active space holds at least one electron and one
+    hole. For every size, the window of orbitals with the smallest
+    discarded occupation is considered, and the smallest window whose
+    discarded occupation is at most `threshold` is returned. The orbitals are
+    taken in the order of decreasing occupation, i.e. the active space is
+    meant for `qchem.active_space`, which keeps the lowest orbitals as core.
+
+    Args:
+        no_occ (np.ndarray): The natural orbital occupations in [0, 2].
+        num_electrons (int): The total number of electrons.
+        threshold (float, optional): The maximal discarded occupation.
+            Defaults to 0.02.
+        max_orbitals (int, optional): The maximal number of active orbitals.
+            Defaults to all orbitals.
+
+    Returns:
+        ActiveSpace: The selected active space.
+
+    Raises:
+        ValueError: If no active space within `max_orbitals` meets the threshold.
+
+    Example:
+    >>> select_active_space([2.0, 1.97, 1.9, 0.1, 0.005, 0.0], num_electrons=6)
+    ActiveSpace(active_electrons=4, active_orbitals=3, num_core=1, discarded_occupation=0.005)
+    """
+    occ = np.sort(np.asarray(no_occ, dtype=np.float64))[::-1]
+    num_orbitals = len(occ)
+    max_orbitals = num_orbitals if max_orbitals is None else max_orbitals
+
+    # core_deficit[c] = sum_{i < c} (2 - n_i), virtual_occ[j] = sum_{i >= j} n_i
+    core_deficit = np.concatenate([[0.0], np.cumsum(2.0 - occ)])
+    virtual_occ = np.concatenate([np.cumsum(occ[::-1])[::-1], [0.0]])
+
+    for size in range(1, max_orbitals + 1):
+        num_core = np.arange(num_orbitals - size + 1)
+        active_electrons = num_electrons - 2 * num_core
+        valid = (active_electrons > 0) & (active_electrons < 2 * size)
+        if not np.any(valid):
+            continue
+        discarded = core_deficit[num_core] + virtual_occ[num_core + size]
+        discarded = np.where(valid, discarded, np.inf)
+        best = int(np.argmin(discarded))
+        if discarded[best] <= threshold:
+            return ActiveSpace(
+                active_electrons=int(active_electrons[best]),
+                active_orbitals=size,
+                num_core=best,
+                discarded_occupation=float(discarded[best]),
+            )
+
+    raise ValueError(
+        f"No active space with at most {max_orbitals} orbitals has a discarded "
+        f"occupation below {threshold}."
+    )
+
+
+def get_active_space(
+    no_occ: np.ndarray, num_electrons: int, num_core: int, active_orbitals: int
+) -> ActiveSpace:
+    """Return a given active space with its discarded occupation.
+
+    Args:
+        no_occ (np.ndarray): The natural orbital occupations in [0, 2].
+        num_electrons (int): The total number of electrons.
+        num_core (int): The number of doubly occupied core orbitals.
+        active_orbitals (int): The number of active orbitals.
+
+    Returns:
+        ActiveSpace: The active space, see `select_active_space`.
+    """
+    occ = np.sort(np.asarray(no_occ, dtype=np.float64))[::-1]
+    discarded = np.sum(2.0 - occ[:num_core]) + np.sum(occ[num_core + active_orbitals :])
+    return ActiveSpace(
+        active_electrons=num_electrons - 2 * num_core,
+        active_orbitals=active_orbitals,
+        num_core=num_core,
+        discarded_occupation=float(discarded),
+    )
@@ -0,0 +1,255 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
+from pennylane.operation import Tensor
+
+from qflow.utils.utils import CACHE_DIR_ENV, get_cache_root
+
+CACHE_MAX_BYTES_ENV = "QFLOW_CACHE_MAX_BYTES"
+DEFAULT_CACHE_MAX_BYTES = 2**30
+CACHE_FORMAT_VERSION = 3
+
+_PAULI_LETTERS = {"Identity": "I", "PauliX": "X", "PauliY": "Y", "PauliZ": "Z"}
+_PAULI_OPS = {
+    "I": qml.Identity,
+    "X": qml.PauliX,
+    "Y": qml.PauliY,
+    "Z": qml.PauliZ,
+}
+
+
+def get_cache_dir() -> str:
+    """Return the directory of the Hamiltonian cache.
+
+    Hamiltonians are stored in the "hamiltonian" subdirectory of
+    `get_cache_root()`, i.e. of QFLOW_CACHE_DIR (default: ~/.cache/qflow).
+    """
+    return os.path.join(get_cache_root(), "hamiltonian")
+
+
+def get_cache_max_bytes() -> int:
+    """Return the size cap of the cache in bytes (env QFLOW_CACHE_MAX_BYTES)."""
+    return int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_CACHE_MAX_BYTES))
+
+
+def _canonical(value: Any) -> Any:
+    """Convert arguments to a canonical json-serializable form."""
+    if isinstance(value, (np.ndarray, list, tuple)) and not isinstance(value, str):
+        array = np.asarray(value)
+        if array.dtype.kind in "fc":
+            # round away the last-digit noise of trigonometric geometry builders
+            return np.round(array.astype(np.float64), 10).tolist()
+        return [_canonical(v) for v in array.tolist()]
+    if isinstance(value, (np.floating, float)):
+        return round(float(value), 10)
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=str)}
+    if value is None or isinstance(value, (str, int, bool)):
+        return value
+    return repr(value)
+
+
+def hamiltonian_cache_key(**kwargs) -> str:
+    """Return a content hash for the full argument set of a Hamiltonian.
+
+    Args:
+        **kwargs: The arguments that determine the Hamiltonian, e.g. symbols,
+            coordinates, charge, mult, basis, active space, mapping and frozen.
+
+    Returns:
+        str: The sha256 hex digest of the canonical arguments.
+    """
+    payload = {key: _canonical(value) for key, value in sorted(kwargs.items())}
+    payload["_version"] = CACHE_FORMAT_VERSION
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _encode_terms(H: qml.Hamiltonian) -> np.ndarray:
+    """Encode each Pauli term as a json string of (letter, wire) pairs."""
+    terms = []
+    for op in H.ops:
+        factors = op.obs if isinstance(op, Tensor) else [op]
+        terms.append(
+            json.dumps([[_PAULI_LETTERS[f.name], f.wires.labels[0]] for f in factors])
+        )
+    return np.array(terms)
+
+
+def _decode_terms(terms: np.ndarray) -> list:
+    """Inverse of `_encode_terms`."""
+    ops = []
+    for term in terms:
+        factors = [_PAULI_OPS[letter](wires=wire) for letter, wire in json.loads(term)]
+        ops.append(factors[0] if len(factors) == 1 else Tensor(*factors))
+    return ops
+
+
+def _cache_path(key: str, cache_dir: Optional[str] = None) -> str:
+    return os.path.join(cache_dir or get_cache_dir(), f"{key}.npz")
+
+
+def load_hamiltonian(
+    key: str, cache_dir: Optional[str] = None, return_stats: bool = False
+) -> Optional[Tuple[qml.Hamiltonian, int, float, np.ndarray, np.ndarray]]:
+    """Load a cached Hamiltonian.
+
+    Args:
+        key (str): The cache key, see `hamiltonian_cache_key`.
+        cache_dir (str, optional): The cache directory. Defaults to `get_cache_dir()`.
+        return_stats (bool, optional): Whether to append the stored
+            statistics (a dict or None) to the result. Defaults to False.
+
+    Returns:
+        Tuple or None: (Hamiltonian, number of qubits, exact energy, Hartree-Fock
+            occupancy, natural orbital occupancy), or None on a cache miss.
+    """
+    path = _cache_path(key, cache_dir)
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            H = qml.Hamiltonian(data["coeffs"], _decode_terms(data["terms"]))
+            result = (
+                H,
+                int(data["num_qubits"]),
+                float(data["energy"]),
+                pnp.array(data["hf_occ"]),
+                pnp.array(data["no_occ"]),
+            )
+            if return_stats:
+                stats = json.loads(str(data["stats"])) if "stats" in data else None
+                result = result + (stats,)
+    except (FileNotFoundError, OSError, KeyError, ValueError):
+        return None
+
+    try:
+        # the modification time is the recency of the LRU eviction
+        os.utime(path)
+    except OSError:
+        pass
+    return result
+
+
+def load_orbitals(
+    key: str, cache_dir: Optional[str] = None
+) -> Optional[Dict[str, np.ndarray]]:
+    """Load the SCF orbitals stored with a cached Hamiltonian.
+
+    Args:
+        key (str): The cache key, see `hamiltonian_cache_key`.
+        cache_dir (str, optional): The cache directory. Defaults to `get_cache_dir()`.
+
+    Returns:
+        Dict[str, np.ndarray] or None: The orbitals by name, e.g. mo_coeff,
+            mo_occ, mo_energy and e_tot, or None if the entry has none.
+    """
+    prefix = "orbitals_"
+    try:
+        with np.load(_cache_path(key, cache_dir), allow_pickle=False) as data:
+            orbitals = {
+                name[len(prefix) :]: data[name]
+                for name in data.files
+                if name.startswith(prefix)
+            }
+    except (FileNotFoundError, OSError, ValueError):
+        return None
+    return orbitals or None
+
+
+def save_hamiltonian(
+    key: str,
+    H: qml.Hamiltonian,
+    num_qubits: int,
+    energy: float,
+    hf_occ: np.ndarray,
+    no_occ: np.ndarray,
+    cache_dir: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    stats: Optional[dict] = None,
+    orbitals: Optional[Dict[str, np.ndarray]] = None,
+) -> str:
+    """Store a Hamiltonian in the cache.
+
+    The file is written to a temporary file and atomically renamed, so
+    concurrent workers never observe partially written entries. Afterwards the
+    least recently used entries are evicted until the cache fits `max_bytes`.
+
+    Args:
+        key (str): The cache key, see `hamiltonian_cache_key`.
+        H (qml.Hamiltonian): The Hamiltonian.
+        num_qubits (int): The number of qubits.
+        energy (float): The exact energy.
+        hf_occ (np.ndarray): The Hartree-Fock occupancy.
+        no_occ (np.ndarray): The natural orbital occupancy.
+        cache_dir (str, optional): The cache directory. Defaults to `get_cache_dir()`.
+        max_bytes (int, optional): The size cap. Defaults to `get_cache_max_bytes()`.
+        stats (dict, optional): The statistics stored with the entry, see
+            `HamiltonianStats`.
+        orbitals (Dict[str, np.ndarray], optional): The SCF orbitals stored
+            with the entry, see `load_orbitals`.
+
+    Returns:
+        str: The path of the cache entry.
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _cache_path(key, cache_dir)
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(
+                f,
+                coeffs=np.array(qml.math.toarray(H.coeffs), dtype=np.float64),
+                terms=_encode_terms(H),
+                num_qubits=num_qubits,
+                energy=float(energy),
+                hf_occ=np.asarray(hf_occ, dtype=np.float64),
+                no_occ=np.asarray(no_occ, dtype=np.float64),
+                **({} if stats is None else {"stats": json.dumps(stats)}),
+                **{f"orbitals_{k}": v for k, v in (orbitals or dict()).items()},
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    evict(cache_dir, get_cache_max_bytes() if max_bytes is None else max_bytes)
+    return path
+
+
+def evict(cache_dir: str, max_bytes: int) -> None:
+    """Remove the least recently used entries until the cache fits max_bytes.
+
+    Args:
+        cache_dir (str): The cache directory.
+        max_bytes (int): The size cap in bytes.
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if not entry.name.endswith(".npz"):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # another worker evicted it concurrently
+            pass
+        total -= size
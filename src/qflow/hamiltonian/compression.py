@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+import pennylane as qml
+
+from qflow.hamiltonian.pauli_sum import PauliSum
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    """Summary of a Hamiltonian compression.
+
+    Attributes:
+        num_terms (int): The number of terms before the compression.
+        num_merged (int): The number of terms removed by merging equal Pauli strings.
+        num_dropped (int): The number of terms dropped by the threshold.
+        error_bound (float): An upper bound on the spectral norm of the
+            difference to the uncompressed Hamiltonian, i.e. on the energy error.
+    """
+
+    num_terms: int
+    num_merged: int
+    num_dropped: int
+    error_bound: float
+
+    @property
+    def num_terms_compressed(self) -> int:
+        return self.num_terms - self.num_merged - self.num_dropped
+
+
+def compress_hamiltonian(
+    H: qml.Hamiltonian, threshold: float = 0.0
+) -> Tuple[qml.Hamiltonian, CompressionStats]:
+    """Merge equal Pauli terms and drop terms with small coefficients.
+
+    The identity term is always kept, it is free to evaluate. Since every
+    Pauli string has unit norm, the sum of the dropped |coefficients| bounds
+    the error of every energy.
+
+    Args:
+        H (qml.Hamiltonian): A Hamiltonian of Pauli strings.
+        threshold (float, optional): Terms with |coeff| <= threshold are
+            dropped after merging. Defaults to 0.0.
+
+    Returns:
+        Tuple[qml.Hamiltonian, CompressionStats]: The compressed Hamiltonian
+            and the compression statistics.
+
+    Example:
+    >>> H = qml.Hamiltonian([0.5, 0.5, 1e-4], [qml.PauliZ(0), qml.PauliZ(0), qml.PauliX(1)])
+    >>> H_small, stats = compress_hamiltonian(H, threshold=1e-3)
+    >>> stats.num_terms_compressed, stats.error_bound
+    (1, 0.0001)
+    """
+    terms = PauliSum.from_hamiltonian(H)
+    merged = terms.simplify(atol=-1.0)
+    is_identity = ~np.any(merged.codes, axis=1)
+    drop = (np.abs(merged.coeffs) <= threshold) & ~is_identity
+
+    compressed = PauliSum(merged.coeffs[~drop], merged.codes[~drop], merged.wires)
+    stats = CompressionStats(
+        num_terms=len(terms),
+        num_merged=len(terms) - len(merged),
+        num_dropped=int(np.count_nonzero(drop)),
+        error_bound=float(np.sum(np.abs(merged.coeffs[drop]))),
+    )
+    return compressed.to_hamiltonian(), stats
@@ -0,0 +1,188 @@
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pennylane as qml
+from pennylane.operation import Observable, Tensor
+
+from qflow.utils.utils import parity
+
+DIAGONAL_OBSERVABLES = ("PauliZ", "Identity")
+
+
+def _term_factors(op: Observable) -> List[Observable]:
+    """Return the single-qubit factors of a Hamiltonian term."""
+    if isinstance(op, Tensor):
+        return op.obs
+    return [op]
+
+
+def is_diagonal_hamiltonian(H: qml.Hamiltonian) -> bool:
+    """Check whether a Hamiltonian only consists of Z strings.
+
+    Such a Hamiltonian is diagonal in the computational basis, e.g. the MaxCut,
+    the barren plateau (Z0 Z1) and the Ising ZZ Hamiltonians.
+
+    Args:
+        H (qml.Hamiltonian): The Hamiltonian.
+
+    Returns:
+        bool: True if every term is a product of PauliZ and Identity operators.
+    """
+    return all(
+        factor.name in DIAGONAL_OBSERVABLES
+        for op in H.ops
+        for factor in _term_factors(op)
+    )
+
+
+def get_z_masks(
+    H: qml.Hamiltonian, wires: Optional[Sequence] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode a diagonal Hamiltonian as integer Z masks.
+
+    The wire at position i of `wires` corresponds to bit (n - 1 - i) of the
+    computational basis index, i.e. the first wire is the most significant bit.
+    This matches the ordering of `qml.probs` and `get_all_bitstrings`.
+
+    Args:
+        H (qml.Hamiltonian): A Hamiltonian consisting of Z strings only.
+        wires (Sequence, optional): The wire order. Defaults to `H.wires`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The coefficients and the unique masks.
+        Terms acting on the same set of wires are merged.
+
+    Raises:
+        ValueError: If the Hamiltonian is not diagonal or acts on wires that
+            are not in `wires`.
+    """
+    wires = H.wires if wires is None else qml.wires.Wires(wires)
+    num_wires = len(wires)
+    wire_map = {w: i for i, w in enumerate(wires)}
+
+    masks = np.zeros(len(H.ops), dtype=np.uint64)
+    for k, op in enumerate(H.ops):
+        for factor in _term_factors(op):
+            if factor.name not in DIAGONAL_OBSERVABLES:
+                raise ValueError(
+                    f"The Hamiltonian is not diagonal (found {factor.name})."
+                )
+            if factor.name == "Identity":
+                continue
+            wire = factor.wires[0]
+            if wire not in wire_map:
+                raise ValueError(f"Wire {wire} is not in the wire order {wires}.")
+            masks[k] ^= np.uint64(1) << np.uint64(num_wires - 1 - wire_map[wire])
+
+    coeffs = np.array(qml.math.toarray(H.coeffs), dtype=np.float64)
+    unique_masks, inverse = np.unique(masks, return_inverse=True)
+    merged_coeffs = np.bincount(inverse, weights=coeffs, minlength=len(unique_masks))
+    return merged_coeffs, unique_masks
+
+
+def get_diagonal_hamiltonian(
+    H: qml.Hamiltonian, wires: Optional[Sequence] = None
+) -> np.ndarray:
+    """Build the diagonal of a Z-only Hamiltonian from bit parities.
+
+    Each Z string contributes c * (-1)^parity(index & mask), which is evaluated
+    for all basis states at once. No per-term observable matrices are built.
+
+    Args:
+        H (qml.Hamiltonian): A Hamiltonian consisting of Z strings only.
+        wires (Sequence, optional): The wire order. Defaults to `H.wires`.
+
+    Returns:
+        np.ndarray: The 2^n diagonal entries of the Hamiltonian.
+
+    Example:
+        >>> H = qml.Hamiltonian([1.0], [qml.PauliZ(0) @ qml.PauliZ(1)])
+        >>> get_diagonal_hamiltonian(H)
+        array([ 1., -1., -1.,  1.])
+    """
+    wires = H.wires if wires is None else qml.wires.Wires(wires)
+    coeffs, masks = get_z_masks(H, wires)
+    return get_diagonal_from_z_masks(coeffs, masks, len(wires))
+
+
+def get_diagonal_from_z_masks(
+    coeffs: np.ndarray, masks: np.ndarray, num_wires: int
+) -> np.ndarray:
+    """Build the diagonal sum_m c_m (-1)^parity(index & mask_m) for all indices.
+
+    Args:
+        coeffs (np.ndarray): The coefficients of the Z strings.
+        masks (np.ndarray): The Z strings as integer masks, see `get_z_masks`.
+        num_wires (int): The number of wires.
+
+    Returns:
+        np.ndarray: The 2^num_wires diagonal entries.
+    """
+    index = np.arange(2**num_wires, dtype=np.uint64)
+    diagonal = np.zeros(len(index), dtype=np.float64)
+    for coeff, mask in zip(coeffs, np.asarray(masks, dtype=np.uint64)):
+        if mask == 0:
+            diagonal += coeff
+        else:
+            diagonal += coeff * (1 - 2 * parity(index & mask).astype(np.float64))
+    return diagonal
+
+
+def get_diagonal_expval_fn(
+    circuit: Callable,
+    H: qml.Hamiltonian,
+    device: Optional[qml.Device] = None,
+    **qnode_kwargs,
+) -> Callable:
+    """Return a cost function that evaluates <H> from the circuit probabilities.
+
+    The diagonal is built once. Every evaluation only measures `qml.probs` and
+    dots them with the diagonal, so no per-term expectation values are needed.
+    The returned function is differentiable with the interface of the qnode.
+
+    Args:
+        circuit (AbstractCircuit): The circuit, called as `circuit(params)`.
+        H (qml.Hamiltonian): A Hamiltonian consisting of Z strings only.
+        device (qml.Device, optional): The device. Defaults to "default.qubit"
+            on the circuit wires.
+        **qnode_kwargs: Keyword arguments passed to `qml.qnode`.
+
+    Returns:
+        Callable: The function params -> <H>.
+    """
+    wires = qml.wires.Wires(list(circuit.wires))
+    diagonal = get_diagonal_hamiltonian(H, wires)
+    if device is None:
+        device = qml.device("default.qubit", wires=wires)
+
+    @qml.qnode(device, **qnode_kwargs)
+    def probs_fn(params):
+        circuit(params)
+        return qml.probs(wires=wires)
+
+    def expval_fn(params):
+        return qml.math.dot(probs_fn(params), diagonal)
+
+    expval_fn.probs_fn = probs_fn
+    expval_fn.diagonal = diagonal
+    return expval_fn
+
+
+def sample_diagonal_hamiltonian(
+    probs: np.ndarray, diagonal: np.ndarray, shots: int, seed: Optional[int] = None
+) -> np.ndarray:
+    """Draw shot samples of the energy of a diagonal Hamiltonian.
+
+    Args:
+        probs (np.ndarray): The probabilities of the computational basis states.
+        diagonal (np.ndarray): The diagonal of the Hamiltonian.
+        shots (int): The number of samples.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        np.ndarray: The sampled energies, their mean estimates <H>.
+    """
+    rng = np.random.default_rng(seed)
+    probs = np.asarray(probs, dtype=np.float64)
+    samples = rng.choice(len(diagonal), size=shots, p=probs / probs.sum())
+    return diagonal[samples]
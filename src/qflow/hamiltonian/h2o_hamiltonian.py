@@ -10,6 +10,7 @@ from qflow.hamiltonian.molecule import molecular_hamiltonian
 def get_h2o_hamiltonian(
     distance: float = 1.32,
     angle: float = 104.5,
+    **kwargs,
 ) -> Tuple[qml.Hamiltonian, int, float, np.ndarray, np.ndarray]:
     """
     Calculates the Hamiltonian for the water (H2O) molecule at a given distance and angle.
@@ -17,6 +18,7 @@ def get_h2o_hamiltonian(
     Args:
         distance (float): The distance between the O and H atoms in angstroms. Default: 1.32.
         angle (float): The H-O-H bond angle in degrees. Default: 104.5.
+        **kwargs: Further keyword arguments of `molecular_hamiltonian`, e.g. cache or chkfile.
 
     Returns:
         A tuple containing the following values:
@@ -25,6 +27,7 @@ def get_h2o_hamiltonian(
         - min_energy (float): The minimum energy of the molecule.
         - hf_occ (np.ndarray): The Hartree-Fock occupation numbers.
         - no_occ (np.ndarray): The natural orbital occupation numbers.
+        - stats (HamiltonianStats): Only with return_stats=True.
     """
     name = "h2o"
     symbols = ["O", "H", "H"]
@@ -37,12 +40,12 @@ def get_h2o_hamiltonian(
 
     coordinates = pnp.array([[0.0, 0.0, 0.0], [x, y, 0.0], [x, -y, 0.0]])
 
-    (H, num_qubits, min_energy, hf_occ, no_occ) = molecular_hamiltonian(
+    return molecular_hamiltonian(
         symbols=symbols,
         coordinates=coordinates,
         name=name,
         frozen=frozen,
         active_electrons=active_electrons,
         active_orbitals=active_orbitals,
+        **kwargs,
     )
-    return H, num_qubits, min_energy, hf_occ, no_occ
@@ -11,6 +11,7 @@ from qflow.hamiltonian.molecule import molecular_hamiltonian
 def get_h4_hamiltonian(
     distance: float = 1.0,
     angle: float = 90.0,
+    **kwargs,
 ) -> Tuple[qml.Hamiltonian, int, float, np.ndarray, np.ndarray]:
     """
     Calculates the Hamiltonian for the hydrogen (H4) molecule at a given distance and angle.
@@ -18,6 +19,7 @@ def get_h4_hamiltonian(
     Args:
         distance (float): The distance between the H atoms in angstroms. Default: 1.0.
         angle (float): The angle between adjacent H atoms in degrees. Default: 90.0.
+        **kwargs: Further keyword arguments of `molecular_hamiltonian`, e.g. cache or chkfile.
 
     Returns:
         A tuple containing the following values:
@@ -26,6 +28,7 @@ def get_h4_hamiltonian(
         - min_energy (float): The minimum energy of the molecule.
         - hf_occ (np.ndarray): The Hartree-Fock occupation numbers.
         - no_occ (np.ndarray): The natural orbital occupation numbers.
+        - stats (HamiltonianStats): Only with return_stats=True.
     """
     name = "H4"
     symbols = ["H", "H", "H", "H"]
@@ -38,19 +41,12 @@ def get_h4_hamiltonian(
 
     coordinates = pnp.array([[x, y, 0.0], [x, -y, 0.0], [-x, -y, 0.0], [-x, y, 0.0]])
 
-    (
-        H,
-        num_qubits,
-        min_energy,
-        hf_occ,
-        no_occ,
-    ) = molecular_hamiltonian(
+    return molecular_hamiltonian(
         symbols=symbols,
         coordinates=coordinates,
         name=name,
         frozen=frozen,
         active_electrons=active_electrons,
         active_orbitals=active_orbitals,
+        **kwargs,
     )
-
-    return H, num_qubits, min_energy, hf_occ, no_occ
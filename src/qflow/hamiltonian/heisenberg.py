@@ -1,8 +1,7 @@
-import pennylane as qml
-import networkx as nx
+from qflow.hamiltonian.lattice import grid_edges, heisenberg_pauli_sum
 
 
-def get_heisenberg_hamiltonian(n_spins: int):
+def get_heisenberg_hamiltonian(n_spins: int, periodic: bool = False):
     """
     Builds a heisenberg model on a square lattice of dim (n_spins, n_spins).
 
@@ -12,19 +11,15 @@ def get_heisenberg_hamiltonian(n_spins: int):
 
     H=∑⟨𝑖,𝑗⟩[𝑋𝑖𝑋𝑗+𝑌𝑖𝑌𝑗+𝑍𝑖𝑍𝑗]
 
+    The terms are built as arrays with `heisenberg_pauli_sum`; use it directly
+    to keep large lattices in the compact `PauliSum` form.
+
+    Args:
+        n_spins (int): The side length of the lattice.
+        periodic (bool, optional): Whether to use periodic boundaries. Defaults to False.
+
+    Returns:
+        qml.Hamiltonian: The Heisenberg Hamiltonian.
     """
-    graph = nx.generators.lattice.grid_2d_graph(n_spins, n_spins)
-    graph = nx.relabel.convert_node_labels_to_integers(graph)
-    obs = []
-    coeffs = []
-    for u, v in graph.edges():
-        coeffs.extend([1.0 for _ in range(n_spins)])
-        obs.extend(
-            [
-                qml.PauliX(u) @ qml.PauliX(v),
-                qml.PauliY(u) @ qml.PauliY(v),
-                qml.PauliZ(u) @ qml.PauliZ(v),
-            ]
-        )
-    hamiltonian_heisenberg = qml.Hamiltonian(coeffs, obs)
-    return hamiltonian_heisenberg
+    edges = grid_edges(n_spins, n_spins, periodic=periodic)
+    return heisenberg_pauli_sum(edges, n_spins * n_spins).to_hamiltonian()
@@ -0,0 +1,130 @@
+from typing import List, Optional, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+
+from qflow.hamiltonian.pauli_sum import PauliSum
+from qflow.utils.maxcut_utils import get_maxcut_edges
+
+
+def chain_edges(num_sites: int, periodic: bool = False) -> np.ndarray:
+    """Return the nearest neighbour edges of a chain.
+
+    Args:
+        num_sites (int): The number of sites.
+        periodic (bool, optional): Whether to connect the last and the first
+            site (only added for more than two sites). Defaults to False.
+
+    Returns:
+        np.ndarray: The (M, 2) edge array.
+    """
+    sites = np.arange(num_sites, dtype=np.int64)
+    edges = np.stack([sites[:-1], sites[1:]], axis=1)
+    if periodic and num_sites > 2:
+        edges = np.concatenate([edges, [[num_sites - 1, 0]]])
+    return edges.reshape(-1, 2)
+
+
+def grid_edges(
+    rows: int, cols: Optional[int] = None, periodic: bool = False
+) -> np.ndarray:
+    """Return the nearest neighbour edges of a square lattice.
+
+    Site (i, j) has the index i * cols + j, the same labels as
+    `nx.convert_node_labels_to_integers(nx.grid_2d_graph(rows, cols))`.
+
+    Args:
+        rows (int): The number of rows.
+        cols (int, optional): The number of columns. Defaults to rows.
+        periodic (bool, optional): Whether to use periodic boundaries (only
+            added along dimensions with more than two sites). Defaults to False.
+
+    Returns:
+        np.ndarray: The (M, 2) edge array.
+    """
+    cols = rows if cols is None else cols
+    index = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+    pairs = [(index[:, :-1], index[:, 1:]), (index[:-1, :], index[1:, :])]
+    if periodic and cols > 2:
+        pairs.append((index[:, -1], index[:, 0]))
+    if periodic and rows > 2:
+        pairs.append((index[-1, :], index[0, :]))
+    return np.concatenate(
+        [np.stack([u.reshape(-1), v.reshape(-1)], axis=1) for u, v in pairs]
+    )
+
+
+def graph_edges(graph: nx.Graph) -> Tuple[np.ndarray, List]:
+    """Return the edges of a networkx graph as an array of node positions.
+
+    Args:
+        graph (nx.Graph): The graph.
+
+    Returns:
+        Tuple[np.ndarray, List]: The (M, 2) edge array and the nodes, which
+            are the wires of the lattice Hamiltonians.
+    """
+    edges, _, _ = get_maxcut_edges(graph)
+    return edges, list(graph.nodes)
+
+
+def _two_site_codes(edges: np.ndarray, num_sites: int, paulis: Sequence[int]):
+    """Build the codes of P_u P_v for every edge (u, v) and Pauli code P."""
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    terms = np.arange(len(edges) * len(paulis)).reshape(len(edges), len(paulis))
+    codes = np.zeros((terms.size, num_sites), dtype=np.int8)
+    for k, pauli in enumerate(paulis):
+        codes[terms[:, k], edges[:, 0]] = pauli
+        codes[terms[:, k], edges[:, 1]] = pauli
+    return codes
+
+
+def heisenberg_pauli_sum(
+    edges: np.ndarray,
+    num_sites: int,
+    coupling: float = 1.0,
+    wires: Optional[Sequence] = None,
+) -> PauliSum:
+    """Build the Heisenberg model H = J sum_<i,j> [X_i X_j + Y_i Y_j + Z_i Z_j].
+
+    Args:
+        edges (np.ndarray): The (M, 2) edge array, e.g. from `grid_edges`.
+        num_sites (int): The number of sites.
+        coupling (float, optional): The coupling J. Defaults to 1.0.
+        wires (Sequence, optional): The wires of the sites. Defaults to range(num_sites).
+
+    Returns:
+        PauliSum: The Hamiltonian with the terms XX, YY, ZZ of every edge.
+    """
+    codes = _two_site_codes(edges, num_sites, (1, 2, 3))
+    return PauliSum(np.full(len(codes), float(coupling)), codes, wires)
+
+
+def transverse_field_ising_pauli_sum(
+    edges: np.ndarray,
+    num_sites: int,
+    transverse_field: float,
+    coupling: float = 1.0,
+    wires: Optional[Sequence] = None,
+) -> PauliSum:
+    """Build the transverse field Ising model H = -J sum_<i,j> Z_i Z_j - h sum_i X_i.
+
+    Args:
+        edges (np.ndarray): The (M, 2) edge array, e.g. from `chain_edges`.
+        num_sites (int): The number of sites.
+        transverse_field (float): The field strength h.
+        coupling (float, optional): The coupling J. Defaults to 1.0.
+        wires (Sequence, optional): The wires of the sites. Defaults to range(num_sites).
+
+    Returns:
+        PauliSum: The Hamiltonian with the ZZ terms followed by the X terms.
+    """
+    zz_codes = _two_site_codes(edges, num_sites, (3,))
+    x_codes = np.diag(np.ones(num_sites, dtype=np.int8))
+    coeffs = np.concatenate(
+        [
+            np.full(len(zz_codes), -float(coupling)),
+            np.full(num_sites, -float(transverse_field)),
+        ]
+    )
+    return PauliSum(coeffs, np.concatenate([zz_codes, x_codes]), wires)
@@ -12,6 +12,7 @@ def get_lih_hamiltonian(
     frozen: int = 1,
     active_electrons: int = 2,
     active_orbitals: int = 5,
+    **kwargs,
 ) -> Tuple[qml.Hamiltonian, int, float, np.ndarray, np.ndarray]:
     """
     Calculates the Hamiltonian for the lithium hydride (LiH) molecule at a given distance.
@@ -21,6 +22,7 @@ def get_lih_hamiltonian(
         frozen (int): The number of frozen molecular orbitals. Default: 1.
         active_electrons (int): The number of active electrons in the molecule. Default: 2.
         active_orbitals (int): The number of active molecular orbitals. Default: 5.
+        **kwargs: Further keyword arguments of `molecular_hamiltonian`, e.g. cache or chkfile.
 
     Returns:
         A tuple containing the following values:
@@ -29,24 +31,18 @@ def get_lih_hamiltonian(
         - min_energy (float): The minimum energy of the molecule.
         - hf_occ (np.ndarray): The Hartree-Fock occupation numbers.
         - no_occ (np.ndarray): The natural orbital occupation numbers.
+        - stats (HamiltonianStats): Only with return_stats=True.
     """
     name = "LiH"
     symbols = ["Li", "H"]
     coordinates = pnp.array([[0.0, 0.0, 0.0], [0.0, 0.0, distance]])
 
-    (
-        H,
-        num_qubits,
-        min_energy,
-        hf_occ,
-        no_occ,
-    ) = molecular_hamiltonian(
+    return molecular_hamiltonian(
         symbols=symbols,
         coordinates=coordinates,
         name=name,
         frozen=frozen,
         active_electrons=active_electrons,
         active_orbitals=active_orbitals,
+        **kwargs,
     )
-
-    return H, num_qubits, min_energy, hf_occ, no_occ
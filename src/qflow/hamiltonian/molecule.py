@@ -1,4 +1,8 @@
-from typing import List, Tuple
+import dataclasses
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pennylane as qml
@@ -9,7 +13,52 @@ from pennylane import Hamiltonian
 from pennylane import numpy as np
 from pennylane import qchem
 from pennylane.qchem.convert import import_operator
-from pyscf import cc, fci, scf
+from pyscf import cc, fci, gto, scf
+
+from qflow.hamiltonian.active_space import (
+    ActiveSpace,
+    get_active_space,
+    select_active_space,
+)
+from qflow.hamiltonian.cache import (
+    hamiltonian_cache_key,
+    load_hamiltonian,
+    load_orbitals,
+    save_hamiltonian,
+)
+from qflow.hamiltonian.compression import CompressionStats, compress_hamiltonian
+
+
+@dataclass(frozen=True)
+class HamiltonianStats:
+    """The active space and compression of a molecular Hamiltonian.
+
+    Attributes:
+        active_space (ActiveSpace): The active space of the Hamiltonian.
+        compression (CompressionStats, optional): The statistics of the
+            compression, None if the Hamiltonian is not compressed.
+    """
+
+    active_space: ActiveSpace
+    compression: Optional[CompressionStats] = None
+
+    @property
+    def num_qubits(self) -> int:
+        """The number of qubits of the Hamiltonian."""
+        return self.active_space.num_qubits
+
+    @property
+    def statevector_bytes(self) -> int:
+        """The memory of a complex128 statevector on all qubits."""
+        return self.active_space.statevector_bytes
+
+    @classmethod
+    def from_dict(cls, stats: dict) -> "HamiltonianStats":
+        compression = stats.get("compression")
+        return cls(
+            ActiveSpace(**stats["active_space"]),
+            None if compression is None else CompressionStats(**compression),
+        )
 
 
 def molecular_hamiltonian(
@@ -25,6 +74,11 @@ def molecular_hamiltonian(
     mapping: str = "jordan_wigner",
     wires: int = None,
     frozen: int = 0,
+    cache: bool = True,
+    chkfile: str = None,
+    threshold: float = None,
+    return_stats: bool = False,
+    active_space_threshold: float = None,
 ) -> Tuple[Hamiltonian, int, float, np.ndarray, np.ndarray]:
     """Compute the molecular Hamiltonian, the number of qubits, the exact energy, and orbital occupancies.
 
@@ -41,25 +95,156 @@ def molecular_hamiltonian(
     mapping: str, the qubit mapping used for the Hamiltonian (default: 'jordan_wigner').
     wires: int, the number of wires for the Hamiltonian (default: None).
     frozen: int, the number of orbitals to freeze (default: 0).
+    cache: bool, whether to use the on-disk Hamiltonian cache, see
+        `qflow.hamiltonian.cache` (default: True).
+    chkfile: str, a pyscf checkpoint file. If it exists, the SCF is started from
+        the orbitals stored in it, and the converged orbitals are written back
+        to it. On cache hits, the orbitals stored with the entry are written
+        without an SCF. Used for warm starts along a scan (default: None).
+    threshold: float, merge equal Pauli terms and drop terms with |coeff| <= threshold,
+        see `compress_hamiltonian` (default: None, no compression).
+    return_stats: bool, whether to append the `HamiltonianStats`, i.e. the
+        active space with its qubit count and statevector memory and the
+        `CompressionStats`, to the result (default: False).
+    active_space_threshold: float, select the smallest active space whose discarded
+        natural orbital occupation is at most this threshold, see
+        `select_active_space`. Overrides active_electrons and active_orbitals
+        (default: None).
 
     Returns:
     Tuple: (Hamiltonian, number of qubits, exact energy, Hartree-Fock occupancy, natural orbital occupancy)
 
+    """
+    if cache:
+        key = hamiltonian_cache_key(
+            symbols=symbols,
+            coordinates=coordinates,
+            charge=charge,
+            mult=mult,
+            basis=basis,
+            method=method,
+            active_electrons=active_electrons,
+            active_orbitals=active_orbitals,
+            mapping=mapping,
+            wires=wires,
+            frozen=frozen,
+            threshold=threshold,
+            active_space_threshold=active_space_threshold,
+        )
+        cached = load_hamiltonian(key, return_stats=True)
+        if cached is not None:
+            orbitals = load_orbitals(key) if chkfile is not None else None
+            if orbitals is not None:
+                # keep the warm start chain of a scan going on cache hits
+                _write_chkfile(
+                    symbols, coordinates, charge, mult, basis, chkfile, orbitals
+                )
+            *result, stats = cached
+            stats = HamiltonianStats.from_dict(stats)
+            return (*result, stats) if return_stats else tuple(result)
+
+    # The meanfield data is written to a private directory such that concurrent
+    # workers do not overwrite each other's files.
+    with tempfile.TemporaryDirectory() as outpath:
+        result = _molecular_hamiltonian(
+            symbols,
+            coordinates,
+            name,
+            charge,
+            mult,
+            basis,
+            method,
+            active_electrons,
+            active_orbitals,
+            mapping,
+            wires,
+            frozen,
+            outpath,
+            chkfile,
+            active_space_threshold,
+        )
+    *result, space, orbitals = result
+
+    compression = None
+    if threshold is not None:
+        result[0], compression = compress_hamiltonian(result[0], threshold)
+    stats = HamiltonianStats(space, compression)
+
+    if cache:
+        save_hamiltonian(
+            key, *result, stats=dataclasses.asdict(stats), orbitals=orbitals
+        )
+    return (*result, stats) if return_stats else tuple(result)
+
+
+def _write_chkfile(
+    symbols, coordinates, charge, mult, basis, chkfile, orbitals
+) -> None:
+    """Write cached SCF orbitals to a chkfile without running the SCF."""
+    coordinates = np.asarray(coordinates, dtype=float).reshape(len(symbols), 3)
+    pyscf_molecule = gto.M(
+        atom=[
+            (symbol, tuple(float(x) for x in xyz))
+            for symbol, xyz in zip(symbols, coordinates)
+        ],
+        # qchem.meanfield takes the coordinates in atomic units
+        unit="Bohr",
+        basis=basis,
+        charge=charge,
+        spin=mult - 1,
+        verbose=0,
+    )
+    scf.chkfile.dump_scf(
+        pyscf_molecule,
+        chkfile,
+        float(orbitals["e_tot"]),
+        orbitals["mo_energy"],
+        orbitals["mo_coeff"],
+        orbitals["mo_occ"],
+    )
+
+
+def _molecular_hamiltonian(
+    symbols,
+    coordinates,
+    name,
+    charge,
+    mult,
+    basis,
+    method,
+    active_electrons,
+    active_orbitals,
+    mapping,
+    wires,
+    frozen,
+    outpath,
+    chkfile,
+    active_space_threshold=None,
+):
+    """Compute the molecular Hamiltonian, see `molecular_hamiltonian`.
+
+    Returns the tuple of `molecular_hamiltonian`, the `ActiveSpace` and the
+    converged SCF orbitals.
     """
     if len(coordinates) == len(symbols) * 3:
         geometry_hf = coordinates
     elif len(coordinates) == len(symbols):
         geometry_hf = coordinates.flatten()
     hf_file = qchem.meanfield(
-        symbols, geometry_hf, name, charge, mult, basis, method, "."
+        symbols, geometry_hf, name, charge, mult, basis, method, outpath
     )
     molecule = MolecularData(filename=hf_file)
     # addition to get the FCI energy directly
     pyscf_molecule = prepare_pyscf_molecule(molecule)
     if pyscf_molecule.spin:
-        pyscf_scf = scf.ROHF(pyscf_molecule).run()
+        pyscf_scf = scf.ROHF(pyscf_molecule)
     else:
-        pyscf_scf = scf.RHF(pyscf_molecule).run()
+        pyscf_scf = scf.RHF(pyscf_molecule)
+    if chkfile is not None:
+        if os.path.exists(chkfile):
+            pyscf_scf.init_guess = "chkfile"
+        pyscf_scf.chkfile = chkfile
+    pyscf_scf.run()
     if frozen > 0:
         mycc = cc.CCSD(pyscf_scf, frozen=frozen).run()
         et = mycc.ccsd_t()
@@ -75,6 +260,14 @@ def molecular_hamiltonian(
         )
         hf_occ = np.diag(rdm)
         no_occ = np.linalg.eigh(rdm)[0][::-1]
+    if active_space_threshold is not None:
+        space = select_active_space(
+            no_occ, molecule.n_electrons, active_space_threshold
+        )
+        active_electrons, active_orbitals = (
+            space.active_electrons,
+            space.active_orbitals,
+        )
     core, active = qchem.active_space(
         molecule.n_electrons,
         molecule.n_orbitals,
@@ -82,6 +275,7 @@ def molecular_hamiltonian(
         active_electrons,
         active_orbitals,
     )
+    space = get_active_space(no_occ, molecule.n_electrons, len(core), len(active))
     # openfermion version of hamiltonian
     h_of, qubits = (
         qchem.decompose(hf_file, mapping, core, active),
@@ -90,4 +284,10 @@ def molecular_hamiltonian(
 
     h_pl = import_operator(h_of, wires=wires)
     H = Hamiltonian(h_pl.coeffs, h_pl.ops)
-    return H, qubits, fci_energy, hf_occ, no_occ
+    orbitals = {
+        "mo_coeff": pyscf_scf.mo_coeff,
+        "mo_occ": pyscf_scf.mo_occ,
+        "mo_energy": pyscf_scf.mo_energy,
+        "e_tot": np.array(pyscf_scf.e_tot),
+    }
+    return H, qubits, fci_energy, hf_occ, no_occ, space, orbitals
@@ -0,0 +1,214 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import pennylane as qml
+import scipy.sparse as sp
+from pennylane.operation import Tensor
+
+from qflow.hamiltonian.diagonal import _term_factors, get_diagonal_from_z_masks
+
+PAULI_CODES = {"Identity": 0, "PauliX": 1, "PauliY": 2, "PauliZ": 3}
+_PAULI_OPS = (qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ)
+
+
+class PauliSum:
+    """An array-backed sum of Pauli strings.
+
+    Term t is coeffs[t] * prod_i P(codes[t, i]) acting on wires[i], where the
+    codes 0, 1, 2, 3 stand for I, X, Y, Z. Large lattice Hamiltonians are built
+    and combined as arrays and only converted to a `qml.Hamiltonian` on demand.
+    The object is cheap to pickle to worker processes.
+
+    Args:
+        coeffs (Sequence[float]): The (T,) real coefficients.
+        codes (np.ndarray): The (T, n) Pauli codes.
+        wires (Sequence, optional): The n wires. Defaults to range(n).
+
+    Example:
+    >>> H = PauliSum([1.0, 0.5], [[3, 3], [1, 0]])
+    >>> H.to_hamiltonian()
+    <Hamiltonian: terms=2, wires=[0, 1]>
+    """
+
+    def __init__(
+        self,
+        coeffs: Sequence[float],
+        codes: np.ndarray,
+        wires: Optional[Sequence] = None,
+    ):
+        self.coeffs = np.asarray(coeffs, dtype=np.float64).reshape(-1)
+        self.codes = np.atleast_2d(np.asarray(codes, dtype=np.int8))
+        if wires is None:
+            wires = range(self.codes.shape[1])
+        self.wires = qml.wires.Wires(list(wires))
+
+        if len(self.coeffs) != len(self.codes):
+            raise ValueError(
+                f"Number of coefficients ({len(self.coeffs)}) does not match the "
+                f"number of terms ({len(self.codes)})."
+            )
+        if len(self.wires) != self.codes.shape[1]:
+            raise ValueError(
+                f"Number of wires ({len(self.wires)}) does not match the codes "
+                f"({self.codes.shape[1]})."
+            )
+        if np.any((self.codes < 0) | (self.codes > 3)):
+            raise ValueError("Pauli codes must be 0 (I), 1 (X), 2 (Y) or 3 (Z).")
+
+    @property
+    def num_terms(self) -> int:
+        return len(self.coeffs)
+
+    @property
+    def num_wires(self) -> int:
+        return len(self.wires)
+
+    def __len__(self) -> int:
+        return self.num_terms
+
+    def __repr__(self) -> str:
+        return f"<PauliSum: terms={self.num_terms}, wires={self.wires.tolist()}>"
+
+    def __add__(self, other: "PauliSum") -> "PauliSum":
+        if not isinstance(other, PauliSum):
+            return NotImplemented
+        if other.wires != self.wires:
+            raise ValueError("Can only add PauliSums on the same wires.")
+        return PauliSum(
+            np.concatenate([self.coeffs, other.coeffs]),
+            np.concatenate([self.codes, other.codes]),
+            self.wires,
+        )
+
+    def __mul__(self, scalar: float) -> "PauliSum":
+        if not np.isscalar(scalar):
+            return NotImplemented
+        return PauliSum(scalar * self.coeffs, self.codes, self.wires)
+
+    __rmul__ = __mul__
+
+    @classmethod
+    def from_hamiltonian(
+        cls, H: qml.Hamiltonian, wires: Optional[Sequence] = None
+    ) -> "PauliSum":
+        """Encode a Hamiltonian of Pauli strings.
+
+        Args:
+            H (qml.Hamiltonian): The Hamiltonian.
+            wires (Sequence, optional): The wire order. Defaults to `H.wires`.
+
+        Returns:
+            PauliSum: The array representation.
+
+        Raises:
+            ValueError: If a term is not a Pauli string on `wires`.
+        """
+        wires = H.wires if wires is None else qml.wires.Wires(wires)
+        wire_map = {w: i for i, w in enumerate(wires)}
+        codes = np.zeros((len(H.ops), len(wires)), dtype=np.int8)
+        for t, op in enumerate(H.ops):
+            for factor in _term_factors(op):
+                if factor.name not in PAULI_CODES:
+                    raise ValueError(f"{factor.name} is not a Pauli operator.")
+                wire = factor.wires[0]
+                if wire not in wire_map:
+                    raise ValueError(f"Wire {wire} is not in the wire order {wires}.")
+                if codes[t, wire_map[wire]] != 0:
+                    raise ValueError(f"Term {op} acts twice on wire {wire}.")
+                codes[t, wire_map[wire]] = PAULI_CODES[factor.name]
+        return cls(qml.math.toarray(H.coeffs), codes, wires)
+
+    def to_hamiltonian(self) -> qml.Hamiltonian:
+        """Convert to a `qml.Hamiltonian`, building one observable per term."""
+        ops = []
+        for row in self.codes:
+            (support,) = np.nonzero(row)
+            factors = [_PAULI_OPS[row[i]](wires=self.wires[i]) for i in support]
+            if not factors:
+                ops.append(qml.Identity(wires=self.wires[0]))
+            elif len(factors) == 1:
+                ops.append(factors[0])
+            else:
+                ops.append(Tensor(*factors))
+        return qml.Hamiltonian(self.coeffs, ops)
+
+    def simplify(self, atol: float = 1e-12) -> "PauliSum":
+        """Merge equal Pauli strings and drop terms with |coeff| <= atol."""
+        codes, inverse = np.unique(self.codes, axis=0, return_inverse=True)
+        coeffs = np.bincount(
+            inverse.reshape(-1), weights=self.coeffs, minlength=len(codes)
+        )
+        keep = np.abs(coeffs) > atol
+        return PauliSum(coeffs[keep], codes[keep], self.wires)
+
+    def _masks(self, selected: np.ndarray) -> np.ndarray:
+        """Pack a (T, n) boolean array into integer masks, first wire = MSB."""
+        if self.num_wires > 64:
+            raise ValueError("Bit masks are limited to 64 wires.")
+        weights = np.left_shift(
+            np.uint64(1), np.arange(self.num_wires - 1, -1, -1, dtype=np.uint64)
+        )
+        return (selected.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+
+    @property
+    def x_masks(self) -> np.ndarray:
+        """The bit flips of each term (X or Y)."""
+        return self._masks((self.codes == 1) | (self.codes == 2))
+
+    @property
+    def z_masks(self) -> np.ndarray:
+        """The phase flips of each term (Z or Y)."""
+        return self._masks((self.codes == 2) | (self.codes == 3))
+
+    @property
+    def is_diagonal(self) -> bool:
+        """Whether all terms are Z strings."""
+        return not np.any((self.codes == 1) | (self.codes == 2))
+
+    def diagonal(self) -> np.ndarray:
+        """The 2^n diagonal entries, see `get_diagonal_hamiltonian`."""
+        diagonal_terms = ~np.any((self.codes == 1) | (self.codes == 2), axis=1)
+        return get_diagonal_from_z_masks(
+            self.coeffs[diagonal_terms],
+            self.z_masks[diagonal_terms],
+            self.num_wires,
+        )
+
+    def sparse_matrix(self) -> sp.csr_matrix:
+        """The sparse matrix in the computational basis of `wires`.
+
+        A Pauli string maps |k> to i^{#Y} (-1)^{parity(k & z)} |k ^ x>. Terms
+        with the same x mask share their nonzero pattern, so each group is a
+        single permuted diagonal built from bit parities.
+
+        Returns:
+            sp.csr_matrix: The 2^n x 2^n matrix.
+        """
+        dim = 2**self.num_wires
+        index = np.arange(dim, dtype=np.uint64)
+        phases = (1j) ** np.count_nonzero(self.codes == 2, axis=1)
+        x_masks, z_masks = self.x_masks, self.z_masks
+
+        rows, cols, values = [], [], []
+        for x_mask in np.unique(x_masks):
+            group = x_masks == x_mask
+            coeffs = self.coeffs[group] * phases[group]
+            value = get_diagonal_from_z_masks(
+                coeffs.real, z_masks[group], self.num_wires
+            ).astype(np.complex128)
+            if np.any(coeffs.imag):
+                value += 1j * get_diagonal_from_z_masks(
+                    coeffs.imag, z_masks[group], self.num_wires
+                )
+            rows.append((index ^ x_mask).astype(np.int64))
+            cols.append(index.astype(np.int64))
+            values.append(value)
+
+        if not values:
+            return sp.csr_matrix((dim, dim), dtype=np.complex128)
+        matrix = sp.coo_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(dim, dim),
+        ).tocsr()
+        matrix.eliminate_zeros()
+        return matrix
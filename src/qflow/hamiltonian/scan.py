@@ -0,0 +1,115 @@
+import multiprocessing as mp
+import os
+import queue
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+def _as_point(point: Any) -> Tuple:
+    """Return a grid point as a tuple of positional builder arguments."""
+    if np.ndim(point) == 0:
+        return (point,)
+    return tuple(point)
+
+
+def _scan_chunk(
+    builder: Callable,
+    chunk: List[Tuple[int, Tuple]],
+    chkfile: Optional[str],
+    results: Any,
+    kwargs: dict,
+) -> None:
+    """Evaluate consecutive grid points, each one seeded by its predecessor."""
+    for index, point in chunk:
+        try:
+            if chkfile is not None:
+                result = builder(*point, chkfile=chkfile, **kwargs)
+            else:
+                result = builder(*point, **kwargs)
+        except Exception as error:
+            results.put((index, None, error))
+            return
+        results.put((index, result, None))
+
+
+def scan_geometries(
+    builder: Callable,
+    grid: Iterable,
+    max_workers: Optional[int] = None,
+    warm_start: bool = True,
+    **kwargs,
+) -> Iterator[Tuple[int, Tuple, Any]]:
+    """Evaluate a Hamiltonian builder on a grid of geometries in parallel.
+
+    The grid is split into contiguous chunks, one per worker process. Within a
+    chunk, the SCF of each geometry is started from the pyscf checkpoint of the
+    previous (neighbouring) geometry. The results are yielded as soon as they
+    are computed, i.e. not in grid order.
+
+    Args:
+        builder (Callable): A Hamiltonian builder such as `get_lih_hamiltonian`
+            or `get_h2o_hamiltonian`. It is called as `builder(*point, **kwargs)`
+            and must accept the keyword `chkfile` if `warm_start` is True.
+        grid (Iterable): The geometries, e.g. a list of distances or a list of
+            (distance, angle) tuples. Neighbouring points should be close.
+        max_workers (int, optional): The number of worker processes.
+            Defaults to the number of CPUs.
+        warm_start (bool, optional): Whether to seed the SCF from the
+            neighbouring geometry. Defaults to True.
+        **kwargs: Further keyword arguments passed to the builder.
+
+    Yields:
+        Tuple[int, Tuple, Any]: The grid index, the grid point and the result
+            of the builder.
+
+    Example:
+    >>> distances = np.linspace(1.0, 4.0, 50)
+    >>> for index, (distance,), result in scan_geometries(get_lih_hamiltonian, distances):
+    ...     H, num_qubits, min_energy, hf_occ, no_occ = result
+    """
+    points = [_as_point(point) for point in grid]
+    if not points:
+        return
+    max_workers = min(max_workers or os.cpu_count() or 1, len(points))
+    chunks = [
+        [(int(i), points[i]) for i in chunk]
+        for chunk in np.array_split(np.arange(len(points)), max_workers)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        chkfiles = [
+            os.path.join(tmpdir, f"chunk_{k}.chk") if warm_start else None
+            for k in range(len(chunks))
+        ]
+
+        if max_workers == 1:
+            for index, point in chunks[0]:
+                if warm_start:
+                    result = builder(*point, chkfile=chkfiles[0], **kwargs)
+                else:
+                    result = builder(*point, **kwargs)
+                yield index, point, result
+            return
+
+        with mp.Manager() as manager, ProcessPoolExecutor(max_workers) as executor:
+            results = manager.Queue()
+            futures = [
+                executor.submit(_scan_chunk, builder, chunk, chkfile, results, kwargs)
+                for chunk, chkfile in zip(chunks, chkfiles)
+            ]
+            for _ in range(len(points)):
+                while True:
+                    try:
+                        index, result, error = results.get(timeout=1.0)
+                        break
+                    except queue.Empty:
+                        # surface crashed workers instead of waiting forever
+                        for future in futures:
+                            if future.done() and future.exception() is not None:
+                                raise future.exception()
+                if error is not None:
+                    raise error
+                yield index, points[index], result
@@ -0,0 +1,56 @@
+import warnings
+from typing import Tuple
+
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
+
+
+def taper_hamiltonian(
+    H: qml.Hamiltonian, num_electrons: int, num_qubits: int = None
+) -> Tuple[qml.Hamiltonian, pnp.ndarray]:
+    """Remove the qubits of the Z2 symmetries of a molecular Hamiltonian.
+
+    The Z2 symmetries (e.g. the particle number and spin parities) are found
+    from the Hamiltonian, the sector is chosen such that it contains the
+    Hartree-Fock state and every symmetry removes one qubit.
+        https://arxiv.org/abs/1701.08213
+
+    Args:
+        H (qml.Hamiltonian): The qubit Hamiltonian (Jordan-Wigner mapping).
+        num_electrons (int): The number of active electrons.
+        num_qubits (int, optional): The number of qubits. Defaults to len(H.wires).
+
+    Returns:
+        Tuple[qml.Hamiltonian, pnp.ndarray]: The tapered Hamiltonian and the
+            tapered Hartree-Fock state. The remaining qubits are relabelled to
+            the wires 0, ..., k - 1, such that both can be passed to
+            `MolecularBasicEntangler` and `MolecularStrongEntangler`.
+
+    Example:
+    >>> H, num_qubits, min_energy, hf_occ, no_occ = get_lih_hamiltonian()
+    >>> H_tapered, initial_state = taper_hamiltonian(H, num_electrons=2)
+    >>> len(initial_state)
+    6
+    """
+    num_qubits = len(H.wires) if num_qubits is None else num_qubits
+
+    with warnings.catch_warnings():
+        # the symmetry finder builds Tensors on overlapping wires internally
+        warnings.simplefilter("ignore", UserWarning)
+        generators = qml.symmetry_generators(H)
+        paulixops = qml.paulix_ops(generators, num_qubits)
+        sector = qml.qchem.optimal_sector(H, generators, num_electrons)
+        H_tapered = qml.taper(H, generators, paulixops, sector)
+        initial_state = qml.qchem.taper_hf(
+            generators, paulixops, sector, num_electrons, num_qubits
+        )
+
+    tapered_wires = {op.wires[0] for op in paulixops}
+    wires = [wire for wire in range(num_qubits) if wire not in tapered_wires]
+    coeffs = np.real(qml.math.toarray(H_tapered.coeffs))
+    H_tapered = qml.map_wires(
+        qml.Hamiltonian(coeffs, H_tapered.ops),
+        {wire: i for i, wire in enumerate(wires)},
+    )
+    return H_tapered, pnp.array(initial_state, requires_grad=False)
@@ -1,6 +1,7 @@
-import numpy as np
 import pennylane as qml
 
+from qflow.hamiltonian.lattice import chain_edges, transverse_field_ising_pauli_sum
+
 
 def get_transverse_field_ising_hamiltonian(
     n_spins: int, transverse_field: float
@@ -10,6 +11,9 @@ def get_transverse_field_ising_hamiltonian(
 
     The transverse field Ising model is a simplified model of interacting spins used to study quantum phase transitions and quantum magnetism. The model consists of a chain of N spins, each coupled to its nearest neighbor with a ferromagnetic interaction strength J and subject to a transverse magnetic field B.
 
+    The spins form a periodic chain, see `transverse_field_ising_pauli_sum` for
+    other lattices.
+
     Args:
         n_spins (int): The number of spins in the chain.
         transverse_field (float): The strength of the transverse magnetic field.
@@ -27,15 +31,6 @@ def get_transverse_field_ising_hamiltonian(
     if transverse_field < 0:
         raise ValueError("Transverse field strength must be non-negative.")
 
-    # transverse field
-    coeffs = [-transverse_field for _ in range(n_spins)]
-    obs = [qml.PauliX(np.pi / 2) for _ in range(n_spins)]
-    h_x = qml.Hamiltonian(coeffs, obs)
-
-    # spin chain
-    couplings = [(i, (i + 1) % n_spins) for i in range(n_spins)]
-    coeffs = [-1 for _ in range(n_spins)]
-    obs = [qml.PauliZ(i) @ qml.PauliZ(j) for i, j in couplings]
-    h_zz = qml.Hamiltonian(coeffs, obs)
-
-    return h_zz + h_x
+    edges = chain_edges(n_spins, periodic=True)
+    H = transverse_field_ising_pauli_sum(edges, n_spins, transverse_field)
+    return H.to_hamiltonian()
@@ -1,8 +1,48 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pennylane as qml
-from scipy.linalg import eig, inv
+from scipy.linalg import eig, eigvalsh, inv
+from scipy.sparse.linalg import eigsh
+
+from qflow.hamiltonian.diagonal import get_diagonal_hamiltonian, is_diagonal_hamiltonian
+
+_SPECTRUM_CACHE: Dict[Tuple, "ReferenceSpectrum"] = {}
+_SPECTRUM_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class ReferenceSpectrum:
+    """Extremal eigenvalues of a Hamiltonian.
+
+    Attributes:
+        min_energy (float): The lowest eigenvalue (ground state energy).
+        max_energy (float): The highest eigenvalue.
+        gap (float): The distance from the ground energy to the first
+            distinct level above it, 0 if all eigenvalues are equal.
+        degeneracy (int): The number of eigenvalues at the ground energy,
+            e.g. at least 2 for Max-Cut Hamiltonians with their Z2 symmetry.
+    """
+
+    min_energy: float
+    max_energy: float
+    gap: float
+    degeneracy: int = 1
+
+
+def _ground_levels(eigenvalues: np.ndarray) -> Tuple[float, int, bool]:
+    """The gap and degeneracy of the ground level in sorted lowest eigenvalues.
+
+    Eigenvalues within a relative tolerance of 1e-8 of the ground energy
+    count as degenerate. The last value tells whether a distinct level was
+    found among the given eigenvalues.
+    """
+    tol = 1e-8 * max(1.0, abs(eigenvalues[0]))
+    degeneracy = int(np.count_nonzero(eigenvalues <= eigenvalues[0] + tol))
+    if degeneracy == len(eigenvalues):
+        return 0.0, degeneracy, False
+    return float(eigenvalues[degeneracy] - eigenvalues[0]), degeneracy, True
 
 
 def get_eigenvalues_hamiltonian(H: qml.Hamiltonian) -> np.ndarray:
@@ -12,12 +52,13 @@ def get_eigenvalues_hamiltonian(H: qml.Hamiltonian) -> np.ndarray:
         hamiltonian (qml.Hamiltonian): The cost hamiltonian.
 
     Returns:
-        eigenvalues (np.ndarray): An array with the eigenvalues of the cost hamiltonian.
+        eigenvalues (np.ndarray): An array with the eigenvalues of the cost
+            hamiltonian in ascending order.
     """
-    Hmat = qml.utils.sparse_hamiltonian(H)
-    Hmat = Hmat.toarray()
-    eigenvalues, eigenvectors = eig(Hmat)
-    return eigenvalues
+    if is_diagonal_hamiltonian(H):
+        return np.sort(get_diagonal_hamiltonian(H))
+    Hmat = H.sparse_matrix(wire_order=H.wires).toarray()
+    return eigvalsh(Hmat)
 
 
 def get_eigenvalues_hermitian(H: qml.Hamiltonian) -> np.ndarray:
@@ -32,3 +73,78 @@ def get_eigenvalues_hermitian(H: qml.Hamiltonian) -> np.ndarray:
     Hmat = H.matrix()
     eigenvalues, eigenvectors = eig(Hmat)
     return eigenvalues
+
+
+def _hamiltonian_key(H: qml.Hamiltonian, wires: Sequence) -> Tuple:
+    """Return a hashable representation of a Hamiltonian on given wires."""
+    coeffs = np.round(np.array(qml.math.toarray(H.coeffs), dtype=np.float64), 12)
+    return (tuple(coeffs), tuple(str(op) for op in H.ops), tuple(wires))
+
+
+def get_reference_spectrum(
+    H: qml.Hamiltonian,
+    wires: Optional[Sequence] = None,
+    dense_max_qubits: int = 10,
+) -> ReferenceSpectrum:
+    """Compute the lowest and highest eigenvalue, the spectral gap and the ground degeneracy.
+
+    Diagonal (Z-only) Hamiltonians are read off their diagonal. Small
+    Hamiltonians are diagonalized densely with a Hermitian solver, larger ones
+    with the sparse Lanczos solver `eigsh`, which only needs the extremal part
+    of the spectrum. Results are memoized per Hamiltonian.
+
+    Args:
+        H (qml.Hamiltonian): The Hamiltonian.
+        wires (Sequence, optional): The wires of the Hilbert space. Defaults to `H.wires`.
+        dense_max_qubits (int, optional): Up to this number of qubits the
+            Hamiltonian is diagonalized densely. Defaults to 10.
+
+    Returns:
+        ReferenceSpectrum: The extremal eigenvalues and the gap.
+
+    Example:
+    >>> H = qml.Hamiltonian([1.0, 0.5], [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliX(0)])
+    >>> get_reference_spectrum(H).min_energy
+    -1.118033988749895
+    """
+    wires = H.wires if wires is None else qml.wires.Wires(wires)
+    key = _hamiltonian_key(H, wires)
+    if key in _SPECTRUM_CACHE:
+        return _SPECTRUM_CACHE[key]
+
+    if is_diagonal_hamiltonian(H):
+        diagonal = get_diagonal_hamiltonian(H, wires)
+        min_energy, highest = np.min(diagonal), np.max(diagonal)
+        degenerate = diagonal <= min_energy + 1e-8 * max(1.0, abs(min_energy))
+        degeneracy = int(np.count_nonzero(degenerate))
+        gap = np.min(diagonal[~degenerate]) - min_energy if not degenerate.all() else 0
+    else:
+        Hmat = H.sparse_matrix(wire_order=wires)
+        dim = Hmat.shape[0]
+        if len(wires) <= dense_max_qubits:
+            eigenvalues = eigvalsh(Hmat.toarray())
+            gap, degeneracy, _ = _ground_levels(eigenvalues)
+            min_energy, highest = eigenvalues[0], eigenvalues[-1]
+        else:
+            # double the number of Lanczos eigenvalues until one lies above
+            # the degenerate ground level
+            k = 2
+            while True:
+                lowest = np.sort(
+                    eigsh(Hmat, k=k, which="SA", return_eigenvectors=False)
+                )
+                gap, degeneracy, found = _ground_levels(lowest)
+                if found or 2 * k >= dim - 1:
+                    break
+                k *= 2
+            min_energy = lowest[0]
+            highest = eigsh(Hmat, k=1, which="LA", return_eigenvectors=False)[0]
+
+    spectrum = ReferenceSpectrum(
+        float(min_energy), float(highest), float(gap), int(degeneracy)
+    )
+
+    if len(_SPECTRUM_CACHE) >= _SPECTRUM_CACHE_SIZE:
+        _SPECTRUM_CACHE.pop(next(iter(_SPECTRUM_CACHE)))
+    _SPECTRUM_CACHE[key] = spectrum
+    return spectrum
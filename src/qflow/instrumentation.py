@@ -0,0 +1,204 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# the profilers that are entered, the innermost one records
+_ACTIVE: List["Profiler"] = []
+_NULL_PHASE = contextlib.nullcontext()
+
+
+def active_profiler() -> Optional["Profiler"]:
+    """Return the innermost entered profiler, or None if profiling is off."""
+    return _ACTIVE[-1] if _ACTIVE else None
+
+
+def phase(name: str):
+    """Time a phase with the active profiler, a no-op context if profiling is off."""
+    return _ACTIVE[-1].phase(name) if _ACTIVE else _NULL_PHASE
+
+
+def count(name: str, value: int = 1):
+    """Increase a counter of the active profiler, a no-op if profiling is off."""
+    if _ACTIVE:
+        _ACTIVE[-1].counters[name] += value
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start", "children")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.children = 0
+        self.profiler._stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        profiler = self.profiler
+        profiler._stack.pop()
+        duration = end - self.start
+        stats = profiler._phases.get(self.name)
+        if stats is None:
+            stats = profiler._phases[self.name] = [0, 0, 0]
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] += duration - self.children
+        if profiler._stack:
+            profiler._stack[-1].children += duration
+        if profiler.trace:
+            profiler._events.append((self.name, self.start, duration))
+
+
+class Profiler:
+    """Count and time the phases of circuit evaluations and optimizer steps.
+
+    Profiling is opt-in: while a profiler is entered, `AbstractOptimizer`,
+    `QNG2Optimizer` and `AbstractCircuit` record their phases (step, cost,
+    gradient, metric_tensor, linear_solve, circuit and compile) and counters
+    (steps, circuit calls, compilations, metric tensor evaluations). Outside
+    of a profiler, the hooks cost a single list lookup.
+
+    Every phase records its number of calls, its total time and its self
+    time, i.e. without the nested phases, so the self times add up to the
+    time spent in phases and the rest of the wall time is spent outside of
+    the instrumented code. If a device is
+    given, its executions are counted with a `qml.Tracker` and attributed to
+    the innermost phase, e.g. the shifted circuits of a parameter-shift
+    gradient to "gradient".
+
+    Args:
+        device (qml.Device, optional): The device whose executions are
+            counted. Defaults to None.
+        trace (bool, optional): Whether to keep every phase as a trace event
+            for `export_chrome_trace`. Defaults to False.
+
+    Attributes:
+        counters (Counter): The counters by name.
+
+    Example:
+    >>> dev = qml.device("default.qubit", wires=circuit.wires)
+    >>> optimizer = QNG2Optimizer(stepsize=0.01)
+    >>> with Profiler(dev, trace=True) as profiler:
+    ...     for _ in range(10):
+    ...         params, energy = optimizer.step_and_cost(cost_fn, params)
+    >>> profiler.summary()["phases"]["metric_tensor"]
+    >>> profiler.export_chrome_trace("qng.trace.json")  # open in Perfetto
+    """
+
+    def __init__(self, device=None, trace: bool = False):
+        self.device = device
+        self.trace = trace
+        self.counters = Counter()
+        self._phases: Dict[str, List[int]] = dict()
+        self._stack: List[_Phase] = []
+        self._events: List[tuple] = []
+        self._executions: List[tuple] = []
+        self._tracker = None
+        self._start = None
+        self._wall_time = 0
+
+    def phase(self, name: str) -> _Phase:
+        """Return a context manager that times a phase."""
+        return _Phase(self, name)
+
+    def _on_update(self, totals, history, latest):
+        executions = latest.get("executions")
+        if not executions:
+            return
+        self.counters["executions"] += executions
+        if self._stack:
+            self.counters[f"executions.{self._stack[-1].name}"] += executions
+        if self.trace:
+            self._executions.append(
+                (time.perf_counter_ns(), self.counters["executions"])
+            )
+
+    def __enter__(self) -> "Profiler":
+        if self.device is not None:
+            import pennylane as qml
+
+            self._tracker = qml.Tracker(self.device, callback=self._on_update)
+            self._tracker.__enter__()
+        _ACTIVE.append(self)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._wall_time += time.perf_counter_ns() - self._start
+        _ACTIVE.remove(self)
+        if self._tracker is not None:
+            self._tracker.__exit__(*exc_info)
+            self._tracker = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the counters and the phase statistics in seconds.
+
+        Returns:
+            Dict[str, Any]: The wall time, the counters and per phase its
+                calls, total, mean and self time and its device executions.
+        """
+        phases = dict()
+        for name, (calls, total, self_time) in self._phases.items():
+            phases[name] = {
+                "calls": calls,
+                "total": total * 1e-9,
+                "mean": total * 1e-9 / calls,
+                "self": self_time * 1e-9,
+                "executions": self.counters.get(f"executions.{name}", 0),
+            }
+        return {
+            "wall_time": self._wall_time * 1e-9,
+            "counters": dict(self.counters),
+            "phases": phases,
+        }
+
+    def export_chrome_trace(self, path: str) -> str:
+        """Write the trace events in the Chrome trace format.
+
+        The file can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+        Args:
+            path (str): The path of the json file.
+
+        Returns:
+            str: The path of the json file.
+
+        Raises:
+            ValueError: If the profiler does not record trace events.
+        """
+        if not self.trace:
+            raise ValueError("The profiler was created with trace=False.")
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [
+            {
+                "name": name,
+                "cat": "qflow",
+                "ph": "X",
+                "ts": start / 1e3,
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, start, duration in self._events
+        ]
+        events.extend(
+            {
+                "name": "executions",
+                "ph": "C",
+                "ts": timestamp / 1e3,
+                "pid": pid,
+                "args": {"executions": total},
+            }
+            for timestamp, total in self._executions
+        )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
@@ -1 +1,6 @@
-from qflow.optimizer.quantum_natural_gradient import QNG2Optimizer
+from qflow._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {"qflow.optimizer.quantum_natural_gradient": ["QNG2Optimizer"]},
+)
@@ -5,6 +5,7 @@ import pennylane as qml
 from scipy.linalg import lstsq
 
 from qflow.abstract_optimizer import AbstractOptimizer
+from qflow.instrumentation import count, phase
 
 
 class QNG2Optimizer(AbstractOptimizer):
@@ -59,7 +60,9 @@ class QNG2Optimizer(AbstractOptimizer):
         params = params.reshape((-1,))
 
         if self.F is None:
-            self.F = qml.metric_tensor(objective_fn, approx=self.approx)(params)
+            count("metric_tensor_evaluations")
+            with phase("metric_tensor"):
+                self.F = qml.metric_tensor(objective_fn, approx=self.approx)(params)
         # https://discuss.pennylane.ai/t/quantum-natural-gradient-descent/351/2
         # Instead of pseudo inverse solve system of equations
         # In the current implmentation of the QNG optimizer, adding small values
@@ -67,22 +70,11 @@ class QNG2Optimizer(AbstractOptimizer):
         # self.F += np.identity(self.F.shape[0]) * 0.01
         # pennylane's qng uses np.linalg.solve to solve the system of equations
         # nat_grad = np.linalg.solve(self.F, self.grad_fn(params))
-        self.grad = self.grad_fn(params)
-        self.nat_grad, _, _, _ = lstsq(self.F, self.grad, cond=1e-7)
+        with phase("gradient"):
+            self.grad = self.grad_fn(params)
+        with phase("linear_solve"):
+            self.nat_grad, _, _, _ = lstsq(self.F, self.grad, cond=1e-7)
         params -= self.stepsize * self.nat_grad
 
         params = params.reshape(params_shape)
         return params
-
-    def step_and_cost(
-        self,
-        objective_fn: Callable,
-        params: np.ndarray,
-        grad_fn: Callable = None,
-        *args,
-        **kwargs
-    ):
-        params = self.step(objective_fn, params, grad_fn, *args, **kwargs)
-        cost = objective_fn(params)
-
-        return params, cost
@@ -0,0 +1,162 @@
+from typing import Tuple, Union
+
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+
+from qflow.utils.maxcut_utils import get_maxcut_edges
+
+
+def _safe_power(base: np.ndarray, exponent: np.ndarray) -> np.ndarray:
+    """base ** exponent with 0 ** 0 = 1 and no warnings for negative exponents."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(exponent == 0, 1.0, base**exponent)
+
+
+def get_edge_classes(
+    edges: np.ndarray, num_nodes: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Group the edges of a graph by their p = 1 QAOA light cone.
+
+    At p = 1 the expectation value of an edge only depends on the number of
+    other neighbours of its endpoints and the number of triangles that
+    contain it. The triangles are counted with the sparse product A @ A.
+
+    Args:
+        edges (np.ndarray): The (M, 2) array of node positions.
+        num_nodes (int): The number of nodes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Per class of
+            edges, deg(u) - 1 and deg(v) - 1 (sorted), the number of triangles
+            and the number of edges in the class.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    u, v = edges[:, 0], edges[:, 1]
+    degree = np.bincount(edges.ravel(), minlength=num_nodes)
+
+    ones = np.ones(len(edges), dtype=np.int64)
+    A = sp.coo_matrix((ones, (u, v)), shape=(num_nodes, num_nodes)).tocsr()
+    A = ((A + A.T) > 0).astype(np.int64)
+    triangles = np.asarray((A @ A)[u, v]).ravel()
+
+    a, b = np.sort(np.stack([degree[u] - 1, degree[v] - 1]), axis=0)
+    classes, counts = np.unique(
+        np.stack([a, b, triangles], axis=1), axis=0, return_counts=True
+    )
+    return classes[:, 0], classes[:, 1], classes[:, 2], counts
+
+
+def _edge_cut(
+    gamma: np.ndarray,
+    beta: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    triangles: np.ndarray,
+    return_grad: bool,
+):
+    """The expected cut <(1 - Z_u Z_v) / 2> of an edge at p = 1 and its derivatives.
+
+    https://arxiv.org/abs/1706.02998, Theorem 1, for the evolution
+    exp(-i beta sum X) exp(-i gamma C) of the cut C on the plus state.
+    """
+    cos, sin = np.cos(gamma), np.sin(gamma)
+    cos_2 = np.cos(2 * gamma)
+    exponent = a + b - 2 * triangles
+    single = _safe_power(cos, a) + _safe_power(cos, b)
+    pair = _safe_power(cos, exponent)
+    loop = 1 - _safe_power(cos_2, triangles)
+
+    cut = 0.5 + 0.25 * np.sin(4 * beta) * sin * single
+    cut -= 0.25 * np.sin(2 * beta) ** 2 * pair * loop
+    if not return_grad:
+        return cut
+
+    d_single = a * _safe_power(cos, a - 1) + b * _safe_power(cos, b - 1)
+    d_pair = exponent * _safe_power(cos, exponent - 1)
+    d_loop = 2 * triangles * _safe_power(cos_2, triangles - 1) * np.sin(2 * gamma)
+
+    grad_gamma = 0.25 * np.sin(4 * beta) * (cos * single - sin**2 * d_single)
+    grad_gamma -= 0.25 * np.sin(2 * beta) ** 2 * (-sin * d_pair * loop + pair * d_loop)
+    grad_beta = np.cos(4 * beta) * sin * single
+    grad_beta -= 0.5 * np.sin(4 * beta) * pair * loop
+    return cut, grad_gamma, grad_beta
+
+
+def get_p1_maxcut_energy_from_edges(
+    edges: np.ndarray,
+    num_nodes: int,
+    gamma: Union[float, np.ndarray],
+    beta: Union[float, np.ndarray],
+    return_grad: bool = False,
+):
+    """Evaluate the p = 1 QAOA energy of an unweighted Max-Cut graph in closed form.
+
+    The energy is <H> with H = sum_(u,v) (Z_u Z_v - 1) / 2 of
+    `qml.qaoa.maxcut`, for the circuit of `maxcut_qaoa_example` at
+    `num_layers=1`, i.e. params = [gamma, beta]. Every edge contributes a
+    closed-form term in the degrees of its endpoints and its triangles, so
+    the cost is linear in the number of edges and no state is simulated. The
+    edges are grouped by their (degrees, triangles) class first, and the
+    classes are evaluated for the whole batch of angles at once.
+
+    Args:
+        edges (np.ndarray): The (M, 2) array of node positions.
+        num_nodes (int): The number of nodes.
+        gamma (float or np.ndarray): The cost angles, broadcastable with beta.
+        beta (float or np.ndarray): The mixer angles, broadcastable with gamma.
+        return_grad (bool, optional): Whether to return the derivatives.
+            Defaults to False.
+
+    Returns:
+        np.ndarray: The energies with the broadcast shape of gamma and beta.
+            If return_grad is True, a tuple of the energies and their
+            derivatives with respect to gamma and beta.
+    """
+    a, b, triangles, counts = get_edge_classes(edges, num_nodes)
+    gamma, beta = np.broadcast_arrays(
+        np.asarray(gamma, dtype=np.float64), np.asarray(beta, dtype=np.float64)
+    )
+    # exp(-i gamma H) = exp(i gamma C), i.e. the cut is evolved with -gamma
+    result = _edge_cut(-gamma[..., None], beta[..., None], a, b, triangles, return_grad)
+    if not return_grad:
+        return -result @ counts
+    cut, grad_gamma, grad_beta = result
+    return -cut @ counts, grad_gamma @ counts, -grad_beta @ counts
+
+
+def get_p1_maxcut_energy(
+    graph: nx.Graph,
+    gamma: Union[float, np.ndarray],
+    beta: Union[float, np.ndarray],
+    return_grad: bool = False,
+):
+    """Evaluate the p = 1 QAOA energy of an unweighted Max-Cut graph in closed form.
+
+    See `get_p1_maxcut_energy_from_edges`.
+
+    Args:
+        graph (nx.Graph): A networkx Graph with unit edge weights.
+        gamma (float or np.ndarray): The cost angles, broadcastable with beta.
+        beta (float or np.ndarray): The mixer angles, broadcastable with gamma.
+        return_grad (bool, optional): Whether to return the derivatives.
+            Defaults to False.
+
+    Returns:
+        np.ndarray: The energies, or a tuple of the energies and their
+            derivatives with respect to gamma and beta.
+
+    Raises:
+        TypeError: If the input graph is not a networkx Graph object.
+        ValueError: If the graph has edge weights other than 1.
+
+    Example:
+    >>> circuit, H, min_energy = maxcut_qaoa_example(num_layers=1)
+    >>> graph = get_maxcut_graph(4, seed=0)
+    >>> gamma, beta = np.meshgrid(np.linspace(0, np.pi, 100), np.linspace(0, np.pi, 100))
+    >>> energies = get_p1_maxcut_energy(graph, gamma, beta)
+    """
+    edges, weights, num_nodes = get_maxcut_edges(graph)
+    if not np.all(weights == 1):
+        raise ValueError("The closed form holds for unweighted graphs only.")
+    return get_p1_maxcut_energy_from_edges(edges, num_nodes, gamma, beta, return_grad)
@@ -0,0 +1,265 @@
+import copy
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
+
+from qflow.qaoa.mixer_h import x_mixer
+from qflow.templates.circuits import QAOACircuit
+from qflow.templates.state_preparation import Plus
+
+INTERP = "interp"
+FOURIER = "fourier"
+
+
+@dataclass(frozen=True)
+class DepthResult:
+    """The optimum of one QAOA depth.
+
+    Attributes:
+        num_layers (int): The depth p.
+        params (np.ndarray): The optimal (gammas, betas) in the layout of
+            `QAOACircuit`.
+        energy (float): The optimal energy.
+        num_steps (int): The number of optimizer steps at this depth.
+        fourier_params (np.ndarray, optional): The optimal (u, v) if the
+            Fourier parameterization was optimized.
+    """
+
+    num_layers: int
+    params: np.ndarray
+    energy: float
+    num_steps: int
+    fourier_params: Optional[np.ndarray] = None
+
+
+def interp_params(params: np.ndarray) -> np.ndarray:
+    """Linearly interpolate optimal depth-p angles to depth p + 1 (INTERP).
+
+    The angles are treated as a discretized annealing schedule, i.e.
+    x'_i = (i - 1) / p x_{i - 1} + (p - i + 1) / p x_i with x_0 = x_{p + 1} = 0.
+        https://arxiv.org/abs/1812.01041
+
+    Args:
+        params (np.ndarray): The (gammas, betas) of depth p.
+
+    Returns:
+        np.ndarray: The (gammas, betas) of depth p + 1.
+
+    Example:
+    >>> interp_params(np.array([1.0, 2.0, 0.5, 0.3]))
+    array([1. , 1.5, 2. , 0.5, 0.4, 0.3])
+    """
+    params = np.asarray(params, dtype=np.float64)
+    p = len(params) // 2
+    i = np.arange(1, p + 2)
+    angles = []
+    for x in (params[:p], params[p:]):
+        padded = np.concatenate([[0.0], x, [0.0]])
+        angles.append((i - 1) / p * padded[i - 1] + (p - i + 1) / p * padded[i])
+    return np.concatenate(angles)
+
+
+def _fourier_basis(num_frequencies: int, num_layers: int):
+    """The (q, p) sine and cosine matrices of the Fourier parameterization."""
+    k = np.arange(1, num_frequencies + 1)[:, None] - 0.5
+    i = np.arange(1, num_layers + 1)[None, :] - 0.5
+    phase = k * i * np.pi / num_layers
+    return np.sin(phase), np.cos(phase)
+
+
+def fourier_to_params(fourier_params: np.ndarray, num_layers: int) -> np.ndarray:
+    """Convert Fourier amplitudes (u, v) to QAOA angles (gammas, betas).
+
+    gamma_i = sum_k u_k sin((k - 1/2)(i - 1/2) pi / p) and
+    beta_i = sum_k v_k cos((k - 1/2)(i - 1/2) pi / p). The conversion is
+    linear and written with array operations only, such that it can be
+    differentiated with autograd.
+        https://arxiv.org/abs/1812.01041
+
+    Args:
+        fourier_params (np.ndarray): The (u, v) of q frequencies each.
+        num_layers (int): The depth p.
+
+    Returns:
+        np.ndarray: The (gammas, betas) of depth p.
+    """
+    q = len(fourier_params) // 2
+    sin, cos = _fourier_basis(q, num_layers)
+    return qml.math.concatenate(
+        [fourier_params[:q] @ sin, fourier_params[q:] @ cos], axis=0
+    )
+
+
+def params_to_fourier(params: np.ndarray, num_frequencies: int = None) -> np.ndarray:
+    """Convert QAOA angles (gammas, betas) to Fourier amplitudes (u, v).
+
+    The inverse of `fourier_to_params` in the least squares sense, which is
+    exact for num_frequencies = p.
+
+    Args:
+        params (np.ndarray): The (gammas, betas) of depth p.
+        num_frequencies (int, optional): The number of frequencies q <= p.
+            Defaults to p.
+
+    Returns:
+        np.ndarray: The (u, v) of q frequencies each.
+    """
+    params = np.asarray(params, dtype=np.float64)
+    p = len(params) // 2
+    q = p if num_frequencies is None else num_frequencies
+    sin, cos = _fourier_basis(q, p)
+    u = np.linalg.lstsq(sin.T, params[:p], rcond=None)[0]
+    v = np.linalg.lstsq(cos.T, params[p:], rcond=None)[0]
+    return np.concatenate([u, v])
+
+
+def _grow_fourier(fourier_params: np.ndarray, num_frequencies: int) -> np.ndarray:
+    """Pad the (u, v) amplitudes with zeros to num_frequencies each (FOURIER)."""
+    q = len(fourier_params) // 2
+    pad = np.zeros(num_frequencies - q)
+    return np.concatenate([fourier_params[:q], pad, fourier_params[q:], pad])
+
+
+def grow_qaoa_depth(
+    H: qml.Hamiltonian,
+    max_layers: int,
+    strategy: str = INTERP,
+    fourier: bool = False,
+    num_frequencies: int = None,
+    optimizer=None,
+    max_steps: int = 100,
+    tol: float = 1e-6,
+    target_energy: float = None,
+    initial_params: np.ndarray = None,
+    seed: int = 0,
+    mixer_h: qml.Hamiltonian = None,
+    initial_state: Callable = None,
+) -> List[DepthResult]:
+    """Optimize QAOA depth by depth, warm starting from the previous optimum.
+
+    The depths p = 1, ..., max_layers are optimized in sequence. Every depth
+    starts from the optimum of the previous one, extended by the INTERP
+    heuristic (linear interpolation of the angles) or the FOURIER heuristic
+    (the Fourier amplitudes padded with a zero frequency). Optionally, the
+    optimization itself runs over the compact Fourier amplitudes (u, v),
+    whose number is capped by `num_frequencies` instead of growing with p.
+        https://arxiv.org/abs/1812.01041
+
+    Args:
+        H (qml.Hamiltonian): The cost Hamiltonian.
+        max_layers (int): The largest depth.
+        strategy (str, optional): INTERP or FOURIER. Defaults to INTERP.
+        fourier (bool, optional): Whether to optimize the Fourier amplitudes
+            instead of the angles. Defaults to False.
+        num_frequencies (int, optional): The maximal number of frequencies q of
+            the Fourier parameterization. Defaults to p, i.e. no cap.
+        optimizer (optional): A pennylane style optimizer with `step_and_cost`.
+            It is used as a template, every depth optimizes with a fresh copy
+            such that no state, e.g. the cached metric tensor of
+            `QNG2Optimizer`, carries over. Defaults to
+            `qml.AdamOptimizer(0.05)`.
+        max_steps (int, optional): The maximal number of steps per depth.
+            Defaults to 100.
+        tol (float, optional): A depth is converged when the energy changes by
+            less than `tol` in one step. Defaults to 1e-6.
+        target_energy (float, optional): Stop growing once a depth reaches this
+            energy. Defaults to None.
+        initial_params (np.ndarray, optional): The (gamma, beta) of depth 1.
+            Defaults to `QAOACircuit.init(seed)`.
+        seed (int, optional): The seed of the depth 1 parameters. Defaults to 0.
+        mixer_h (qml.Hamiltonian, optional): The mixer. Defaults to the X mixer.
+        initial_state (Callable, optional): The initial state. Defaults to Plus.
+
+    Returns:
+        List[DepthResult]: The optimum of every depth.
+
+    Raises:
+        ValueError: If the strategy is unknown.
+
+    Example:
+    >>> circuit, H, min_energy = maxcut_qaoa_example(num_nodes=6)
+    >>> results = grow_qaoa_depth(H, max_layers=4, strategy=FOURIER)
+    >>> [result.energy for result in results]
+    """
+    if strategy not in (INTERP, FOURIER):
+        raise ValueError(
+            f"Unknown strategy {strategy}, expected {INTERP} or {FOURIER}."
+        )
+
+    num_qubits = len(H.wires)
+    mixer_h = x_mixer(num_qubits) if mixer_h is None else mixer_h
+    initial_state = Plus(num_qubits) if initial_state is None else initial_state
+    template = qml.AdamOptimizer(0.05) if optimizer is None else optimizer
+    dev = qml.device("default.qubit", wires=H.wires)
+
+    def _frequencies(num_layers):
+        if num_frequencies is None:
+            return num_layers
+        return min(num_frequencies, num_layers)
+
+    results = []
+    params, fourier_params = None, None
+    for num_layers in range(1, max_layers + 1):
+        circuit = QAOACircuit(
+            H=H, initial_state=initial_state, mixer_h=mixer_h, num_layers=num_layers
+        )
+
+        @qml.qnode(dev)
+        def cost_fn(params):
+            circuit(params)
+            return qml.expval(H)
+
+        # warm start from the previous depth
+        if num_layers == 1:
+            params = circuit.init(seed) if initial_params is None else initial_params
+            params = np.asarray(params, dtype=np.float64)
+            fourier_params = params_to_fourier(params)
+        elif strategy == INTERP:
+            params = interp_params(params)
+            fourier_params = params_to_fourier(params, _frequencies(num_layers))
+        else:
+            fourier_params = _grow_fourier(fourier_params, _frequencies(num_layers))
+            params = fourier_to_params(fourier_params, num_layers)
+
+        if fourier:
+            x = pnp.array(fourier_params, requires_grad=True)
+            objective_fn = lambda x: cost_fn(fourier_to_params(x, num_layers))
+        else:
+            x = pnp.array(params, requires_grad=True)
+            objective_fn = cost_fn
+
+        optimizer = copy.deepcopy(template)
+        num_steps, previous = 0, np.inf
+        while num_steps < max_steps:
+            x, cost = optimizer.step_and_cost(objective_fn, x)
+            num_steps += 1
+            if abs(previous - cost) < tol:
+                break
+            previous = cost
+        energy = float(objective_fn(x))
+
+        x = np.array(x, dtype=np.float64)
+        if fourier:
+            fourier_params = x
+            params = fourier_to_params(x, num_layers)
+        else:
+            params = x
+            if strategy == FOURIER:
+                fourier_params = params_to_fourier(params, _frequencies(num_layers))
+
+        results.append(
+            DepthResult(
+                num_layers=num_layers,
+                params=params,
+                energy=energy,
+                num_steps=num_steps,
+                fourier_params=fourier_params if fourier else None,
+            )
+        )
+        if target_energy is not None and energy <= target_energy:
+            break
+
+    return results
@@ -0,0 +1,167 @@
+from typing import Dict, List, Tuple
+
+import networkx as nx
+import numpy as np
+
+from qflow.utils.maxcut_utils import get_maxcut_edges
+from qflow.utils.utils import parity
+
+
+def edge_light_cone(graph: nx.Graph, edge: Tuple, num_layers: int) -> nx.Graph:
+    """Return the subgraph that determines <Z_u Z_v> of depth-p QAOA.
+
+    The expectation value of an edge only depends on the nodes within
+    distance p of its endpoints. Edges between two nodes at distance exactly
+    p act outside of the light cone and are left out. The endpoints carry the
+    node attribute `root` = 1, all other nodes `root` = 0.
+
+    Args:
+        graph (nx.Graph): The Max-Cut graph.
+        edge (Tuple): The edge (u, v).
+        num_layers (int): The QAOA depth p.
+
+    Returns:
+        nx.Graph: The light cone subgraph.
+    """
+    u, v = edge
+    distance = nx.multi_source_dijkstra_path_length(
+        graph, {u, v}, cutoff=num_layers, weight=None
+    )
+    cone = nx.Graph()
+    cone.add_nodes_from(distance, root=0)
+    cone.nodes[u]["root"] = cone.nodes[v]["root"] = 1
+    cone.add_edges_from(
+        (a, b)
+        for a, b in graph.subgraph(distance).edges()
+        if min(distance[a], distance[b]) < num_layers
+    )
+    return cone
+
+
+def _apply_mixer(state: np.ndarray, beta: float, num_qubits: int) -> np.ndarray:
+    """Apply exp(-i beta X) to every qubit of a statevector."""
+    cos, sin = np.cos(beta), np.sin(beta)
+    for wire in range(num_qubits):
+        state = state.reshape(2**wire, 2, -1)
+        state = np.stack(
+            [
+                cos * state[:, 0] - 1j * sin * state[:, 1],
+                cos * state[:, 1] - 1j * sin * state[:, 0],
+            ],
+            axis=1,
+        )
+    return state.reshape(-1)
+
+
+def simulate_edge_expectation(cone: nx.Graph, root: Tuple, params: np.ndarray) -> float:
+    """Simulate <Z_u Z_v> of depth-p QAOA on a light cone subgraph.
+
+    The circuit is that of `QAOACircuit` with the cost Hamiltonian of
+    `qml.qaoa.maxcut`, the X mixer and the plus state, simulated as a dense
+    statevector of the cone.
+
+    Args:
+        cone (nx.Graph): The light cone, see `edge_light_cone`.
+        root (Tuple): The edge (u, v) of the observable.
+        params (np.ndarray): The (gammas, betas) of `QAOACircuit`.
+
+    Returns:
+        float: The expectation value <Z_u Z_v>.
+    """
+    edges, _, num_qubits = get_maxcut_edges(cone)
+    index = np.arange(2**num_qubits, dtype=np.uint64)
+
+    def edge_mask(a: int, b: int) -> np.uint64:
+        return np.uint64((1 << (num_qubits - 1 - a)) | (1 << (num_qubits - 1 - b)))
+
+    # the diagonal of sum_(a,b) Z_a Z_b, the identity terms are a global phase;
+    # built edge by edge to keep the peak memory at the size of the statevector
+    zz = np.zeros(2**num_qubits)
+    for a, b in edges:
+        zz += 1 - 2 * parity(index & edge_mask(a, b)).astype(np.float64)
+
+    num_layers = len(params) // 2
+    state = np.full(2**num_qubits, 2 ** (-num_qubits / 2), dtype=np.complex128)
+    for gamma, beta in zip(params[:num_layers], params[num_layers:]):
+        state = state * np.exp(-0.5j * gamma * zz)
+        state = _apply_mixer(state, beta, num_qubits)
+
+    nodes = list(cone.nodes)
+    u, v = nodes.index(root[0]), nodes.index(root[1])
+    observable = 1 - 2 * parity(index & edge_mask(u, v)).astype(np.float64)
+    return float(np.real(np.vdot(state, observable * state)))
+
+
+def _same_root(a: dict, b: dict) -> bool:
+    return a["root"] == b["root"]
+
+
+class LightConeEvaluator:
+    """Evaluate depth-p QAOA Max-Cut energies edge by edge.
+
+    The light cone of every edge is extracted once and canonicalized: cones
+    are bucketed by their Weisfeiler-Lehman hash with the edge endpoints as
+    node labels, and every bucket is split into isomorphism classes. Only one
+    representative per class is simulated, e.g. all edges of a regular graph
+    with large girth share a single class. The energy is the one of
+    `QAOACircuit` with the Hamiltonian `qml.qaoa.maxcut(graph)`.
+
+    Args:
+        graph (nx.Graph): The Max-Cut graph.
+        num_layers (int): The QAOA depth p.
+        max_qubits (int, optional): The largest light cone that is simulated.
+            Defaults to 24.
+
+    Attributes:
+        classes (List[Tuple[nx.Graph, Tuple, int]]): Per class of light cones,
+            a representative cone, its root edge and the number of edges.
+
+    Raises:
+        ValueError: If a light cone has more than `max_qubits` nodes.
+
+    Example:
+    >>> graph = nx.random_regular_graph(3, 1000, seed=0)
+    >>> evaluator = LightConeEvaluator(graph, num_layers=2)
+    >>> len(evaluator.classes)
+    >>> energy = evaluator.energy(np.array([0.4, 0.8, 0.6, 0.3]))
+    """
+
+    def __init__(self, graph: nx.Graph, num_layers: int, max_qubits: int = 24):
+        self.num_layers = num_layers
+        self.num_edges = graph.number_of_edges()
+        self.classes = []
+
+        buckets: Dict[str, List[int]] = dict()
+        for edge in graph.edges():
+            cone = edge_light_cone(graph, edge, num_layers)
+            if cone.number_of_nodes() > max_qubits:
+                raise ValueError(
+                    f"The light cone of {edge} has {cone.number_of_nodes()} > "
+                    f"{max_qubits} nodes."
+                )
+            key = nx.weisfeiler_lehman_graph_hash(cone, node_attr="root")
+            for k in buckets.setdefault(key, []):
+                representative, root, count = self.classes[k]
+                if nx.is_isomorphic(cone, representative, node_match=_same_root):
+                    self.classes[k] = (representative, root, count + 1)
+                    break
+            else:
+                buckets[key].append(len(self.classes))
+                self.classes.append((cone, edge, 1))
+
+    def edge_expectations(self, params: np.ndarray) -> np.ndarray:
+        """Return <Z_u Z_v> of every class representative."""
+        params = np.asarray(params, dtype=np.float64)
+        if len(params) != 2 * self.num_layers:
+            raise ValueError(f"{len(params)} != {2 * self.num_layers}")
+        return np.array(
+            [
+                simulate_edge_expectation(cone, root, params)
+                for cone, root, _ in self.classes
+            ]
+        )
+
+    def energy(self, params: np.ndarray) -> float:
+        """Return the energy sum_(u,v) (<Z_u Z_v> - 1) / 2."""
+        counts = np.array([count for _, _, count in self.classes])
+        return float(0.5 * np.dot(counts, self.edge_expectations(params) - 1))
@@ -1,6 +1,9 @@
+from typing import List, Tuple
+
 import networkx as nx
 import numpy as np
 import pennylane as qml
+import scipy.sparse
 
 # from beartype import beartype
 from pennylane import qaoa
@@ -93,3 +96,136 @@ def x_mixer(n_qubits: int) -> qml.Hamiltonian:
     """
     mixer_h = qaoa.x_mixer(range(n_qubits))
     return mixer_h
+
+
+def mixer_eigensystem(
+    mixer_h: qml.Hamiltonian, wires=None
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Diagonalize a mixer Hamiltonian for its exact time evolution.
+
+    XY mixers conserve the Hamming weight, so the sparse matrix of the mixer
+    terms is diagonalized block by block in the subspaces of fixed Hamming
+    weight, i.e. the largest block has dimension binom(n, n / 2) and neither
+    the 2^n x 2^n matrix nor its eigenvectors are formed. Other mixers are
+    diagonalized as a single block.
+
+    Args:
+        mixer_h (qml.Hamiltonian): mixer Hamiltonian
+        wires (Iterable, optional): wire order of the matrix. Defaults to mixer_h.wires.
+
+    Returns:
+        blocks: per block, the basis state indices, the eigenvalues and the
+            eigenvectors as columns
+    """
+    wires = mixer_h.wires if wires is None else qml.wires.Wires(wires)
+    matrix = mixer_h.sparse_matrix(wire_order=wires).tocsr()
+    weights = np.array([bin(k).count("1") for k in range(matrix.shape[0])])
+    rows, cols = matrix.nonzero()
+    if np.all(weights[rows] == weights[cols]):
+        blocks = [np.flatnonzero(weights == w) for w in range(len(wires) + 1)]
+    else:
+        blocks = [np.arange(matrix.shape[0])]
+
+    eigensystem = []
+    for block in blocks:
+        eigvals, eigvecs = np.linalg.eigh(matrix[block][:, block].toarray())
+        if np.allclose(eigvecs.imag, 0.0):
+            eigvecs = eigvecs.real
+        eigensystem.append((block, eigvals, eigvecs))
+    return eigensystem
+
+
+class FixedWeightEvolution(qml.operation.Operation):
+    """
+    The time evolution exp(-i beta mixer_h) of a mixer applied block by block.
+
+    The operation keeps the eigensystem of `mixer_eigensystem` per Hamming
+    weight block. Its matrix is assembled from the blocks only when a device
+    applies it, the sparse matrix never holds more than the block entries.
+
+    Args:
+        beta (float): evolution time
+        eigensystem (list): the blocks of `mixer_eigensystem`
+        wires (Iterable): wire order of the eigensystem
+    """
+
+    num_params = 1
+    num_wires = qml.operation.AnyWires
+    grad_method = "F"
+
+    def __init__(self, beta, eigensystem, wires, id=None):
+        self._hyperparameters = {"eigensystem": eigensystem}
+        super().__init__(beta, wires=wires, id=id)
+
+    @staticmethod
+    def compute_matrix(beta, eigensystem):
+        blocks = []
+        for _, eigvals, eigvecs in eigensystem:
+            phases = qml.math.exp(-1j * beta * eigvals)
+            blocks.append(qml.math.dot(eigvecs * phases, eigvecs.conj().T))
+        # the blocks in the order of the basis states
+        order = np.argsort(np.concatenate([block for block, _, _ in eigensystem]))
+        matrix = qml.math.block_diag(blocks)
+        return matrix[order][:, order]
+
+    @staticmethod
+    def compute_sparse_matrix(beta, eigensystem):
+        dim = sum(len(block) for block, _, _ in eigensystem)
+        rows, cols, values = [], [], []
+        for block, eigvals, eigvecs in eigensystem:
+            phases = np.exp(-1j * qml.math.toarray(beta) * eigvals)
+            rows.append(np.repeat(block, len(block)))
+            cols.append(np.tile(block, len(block)))
+            values.append(((eigvecs * phases) @ eigvecs.conj().T).ravel())
+        return scipy.sparse.csr_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(dim, dim),
+        )
+
+
+def exact_mixer_evolution(beta, eigensystem: list, wires) -> None:
+    """
+    Apply exp(-i beta mixer_h) exactly in the eigenbasis of the mixer.
+
+    Args:
+        beta (float): evolution time
+        eigensystem (list): the blocks of `mixer_eigensystem`
+        wires (Iterable): wire order of the eigensystem
+    """
+    FixedWeightEvolution(beta, eigensystem, wires=wires)
+
+
+def xy_matchings(mixer_h: qml.Hamiltonian) -> List[List[Tuple[Tuple, float]]]:
+    """
+    Partition the edges of an XY mixer into matchings.
+
+    The edges of a matching share no qubit, so their terms c (XX + YY) commute
+    and every matching is exponentiated exactly by one IsingXY gate per edge.
+    A ring with an even number of qubits splits into its even and odd edges.
+
+    Args:
+        mixer_h (qml.Hamiltonian): XY mixer Hamiltonian with terms c XX and c YY
+
+    Returns:
+        matchings: per matching, the list of (edge wires, coefficient c)
+
+    Raises:
+        ValueError: if mixer_h is not of the XY form
+    """
+    coeffs = dict()
+    for coeff, op in zip(mixer_h.coeffs, mixer_h.ops):
+        if op.name not in (["PauliX", "PauliX"], ["PauliY", "PauliY"]):
+            raise ValueError(f"The mixer term {op} is not of the form XX or YY.")
+        edge = tuple(op.wires)
+        coeffs.setdefault(edge, dict())[op.name[0]] = float(np.real(coeff))
+    for edge, terms in coeffs.items():
+        if len(terms) != 2 or not np.isclose(terms["PauliX"], terms["PauliY"]):
+            raise ValueError(f"The XX and YY terms on {edge} differ.")
+
+    colors = nx.greedy_color(nx.line_graph(nx.Graph(list(coeffs))), "largest_first")
+    matchings = [[] for _ in range(max(colors.values(), default=-1) + 1)]
+    for edge, terms in coeffs.items():
+        color = colors[edge] if edge in colors else colors[edge[::-1]]
+        matchings[color].append((edge, terms["PauliX"]))
+    return matchings
@@ -0,0 +1,324 @@
+import hashlib
+import inspect
+import itertools
+import json
+import multiprocessing as mp
+import os
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# statevector qubits of the molecular examples, the others take num_nodes/num_qubits
+EXAMPLE_QUBITS = {"lih": 10, "h2o": 12, "h4": 8}
+# relative cost of one step, QNG evaluates the metric tensor
+OPTIMIZER_COST = {"QNGOptimizer": 4.0, "QNG2Optimizer": 4.0}
+# the subdirectory of the output directory with the trajectory store
+TRAJECTORY_DIR = "trajectories"
+
+DEFAULT_GRID = {
+    "example": ["maxcut_qaoa_example"],
+    "num_layers": [1],
+    "optimizer": ["AdamOptimizer"],
+    "stepsize": [0.01],
+    "seed": [0],
+}
+
+
+@dataclass
+class SweepSummary:
+    """The outcome of a sweep.
+
+    Attributes:
+        completed (List[str]): The ids of the jobs that ran successfully.
+        skipped (List[str]): The ids of the jobs that already had results.
+        failed (Dict[str, str]): Per failed job id, the reason of the last attempt.
+    """
+
+    completed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+def load_sweep_config(path: str) -> Dict[str, Any]:
+    """Load a sweep config from a .json or .toml file.
+
+    The config has the keys
+        grid (dict): Per job parameter, the list of its values. The keys
+            example, num_layers, optimizer, stepsize and seed are always set,
+            further keys such as num_nodes or distance are passed to the example.
+        output_dir (str, optional): The result directory, relative to the
+            config file. Defaults to "sweep_results".
+        max_steps (int, optional): The optimizer steps per job. Defaults to 100.
+        max_workers (int, optional): The number of parallel jobs.
+        timeout (float, optional): The wall time limit of a job in seconds.
+        retries (int, optional): The number of retries of a failed job. Defaults to 1.
+
+    Args:
+        path (str): The path of the config file.
+
+    Returns:
+        Dict[str, Any]: The config with `output_dir` resolved.
+
+    Raises:
+        ValueError: If the file type is not supported.
+
+    Example (sweep.toml):
+        output_dir = "results"
+        timeout = 600
+
+        [grid]
+        example = ["maxcut_qaoa_example"]
+        num_nodes = [6, 8]
+        num_layers = [1, 2, 3]
+        optimizer = ["AdamOptimizer", "QNG2Optimizer"]
+        stepsize = [0.01, 0.05]
+        seed = [0, 1, 2]
+    """
+    if path.endswith(".json"):
+        with open(path) as f:
+            config = json.load(f)
+    elif path.endswith(".toml"):
+        import tomllib
+
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+    else:
+        raise ValueError(f"Unsupported config file {path}, expected .json or .toml.")
+
+    output_dir = config.get("output_dir", "sweep_results")
+    config["output_dir"] = os.path.join(
+        os.path.dirname(os.path.abspath(path)), output_dir
+    )
+    return config
+
+
+def expand_grid(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the jobs of a sweep, the Cartesian product of the grid values."""
+    grid = {**DEFAULT_GRID, **config.get("grid", dict())}
+    max_steps = config.get("max_steps", 100)
+    keys = sorted(grid)
+    values = [v if isinstance(v, list) else [v] for v in (grid[k] for k in keys)]
+    return [
+        {**dict(zip(keys, combination)), "max_steps": max_steps}
+        for combination in itertools.product(*values)
+    ]
+
+
+def job_id(job: Dict[str, Any]) -> str:
+    """Return a stable id of a job from its parameters."""
+    encoded = json.dumps(job, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def estimate_job_cost(job: Dict[str, Any]) -> float:
+    """Estimate the relative run time of a job for the longest-first schedule."""
+    num_qubits = job.get("num_nodes", job.get("num_qubits"))
+    if num_qubits is None:
+        prefix = job["example"].split("_")[0]
+        num_qubits = EXAMPLE_QUBITS.get(prefix, 4)
+    return (
+        2.0**num_qubits
+        * job["num_layers"]
+        * job["max_steps"]
+        * OPTIMIZER_COST.get(job["optimizer"], 1.0)
+    )
+
+
+def _result_path(output_dir: str, job: Dict[str, Any]) -> str:
+    return os.path.join(output_dir, f"{job_id(job)}.json")
+
+
+def _get_optimizer(name: str, stepsize: float):
+    import pennylane as qml
+
+    from qflow.optimizer import QNG2Optimizer
+
+    if name == "QNG2Optimizer":
+        return QNG2Optimizer(stepsize=stepsize)
+    return getattr(qml, name)(stepsize=stepsize)
+
+
+class _GradientRecorder:
+    """A gradient function for `step_and_cost` that keeps the norm of the last gradient."""
+
+    def __init__(self, cost_fn):
+        import pennylane as qml
+
+        self.grad_fn = qml.grad(cost_fn)
+        self.norm = np.nan
+
+    def __call__(self, *args, **kwargs):
+        grad = self.grad_fn(*args, **kwargs)
+        self.norm = float(np.linalg.norm(grad))
+        return grad
+
+
+def run_job(job: Dict[str, Any], output_dir: str) -> str:
+    """Run one job of a sweep and store its result.
+
+    The example is built with the job parameters that it accepts, the
+    circuit is initialized with the job seed and optimized for `max_steps`
+    steps. Every step (energy, gradient norm, approximation ratio, wall time
+    and device executions) is appended to the trajectory store in
+    output_dir/trajectories, see `TrajectoryStore`. The run summary and the
+    `Profiler` summary of the optimization are written to a temporary file
+    and atomically renamed once the trajectory is stored, so a result file
+    always marks a complete job.
+
+    Args:
+        job (Dict[str, Any]): The job parameters, see `expand_grid`.
+        output_dir (str): The result directory.
+
+    Returns:
+        str: The path of the result file.
+    """
+    import pennylane as qml
+
+    from qflow.hamiltonian.utils_hamiltonian import get_reference_spectrum
+    from qflow.instrumentation import Profiler
+    from qflow.templates import examples
+    from qflow.utils.trajectory_store import TrajectoryWriter
+    from qflow.utils.utils import get_approximation_ratio
+
+    builder = getattr(examples, job["example"])
+    accepted = inspect.signature(builder).parameters
+    circuit, H, min_energy = builder(
+        **{key: value for key, value in job.items() if key in accepted}
+    )
+    # the approximation ratio needs both ends of the spectrum, E_max = 0
+    # only holds for Max-Cut
+    spectrum = get_reference_spectrum(H)
+
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def cost_fn(params):
+        circuit(params)
+        return qml.expval(H)
+
+    optimizer = _get_optimizer(job["optimizer"], job["stepsize"])
+    grad_fn = _GradientRecorder(cost_fn)
+    params = circuit.init(job["seed"])
+
+    with Profiler(dev) as profiler, TrajectoryWriter(
+        os.path.join(output_dir, TRAJECTORY_DIR)
+    ) as writer:
+        run_id = writer.start_run({**job, "job_id": job_id(job)})
+        start = time.perf_counter()
+        for step in range(job["max_steps"] + 1):
+            # step_and_cost returns the cost before the step for the PennyLane
+            # optimizers and after it for AbstractOptimizer, evaluating it
+            # here makes row i hold E(params_i) for every optimizer
+            energy = float(np.real(cost_fn(params)))
+            if step < job["max_steps"]:
+                params = optimizer.step(cost_fn, params, grad_fn=grad_fn)
+                # QNG2Optimizer computes its own gradient
+                grad_norm = getattr(optimizer, "grad", None)
+                grad_norm = grad_fn.norm if grad_norm is None else grad_norm
+            else:
+                grad_norm = np.nan
+            writer.append(
+                run_id,
+                step=step,
+                energy=energy,
+                grad_norm=np.linalg.norm(grad_norm),
+                approx_ratio=get_approximation_ratio(
+                    energy, spectrum.min_energy, spectrum.max_energy
+                ),
+                wall_time=time.perf_counter() - start,
+                executions=dev.num_executions,
+            )
+        summary = writer.finish_run(run_id)
+
+    result = {
+        "job_id": job_id(job),
+        "job": job,
+        "run_id": run_id,
+        "min_energy": float(min_energy),
+        "params": np.asarray(params, dtype=np.float64).tolist(),
+        **summary,
+        "profile": profiler.summary(),
+    }
+    path = _result_path(output_dir, job)
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def run_sweep(
+    config: Dict[str, Any],
+    max_workers: Optional[int] = None,
+    poll_interval: float = 0.5,
+) -> SweepSummary:
+    """Run all jobs of a sweep that do not have results yet.
+
+    The jobs are started longest first (see `estimate_job_cost`) on at most
+    `max_workers` processes. Every job runs in its own process, which is
+    killed when it exceeds the timeout, and a failed job is queued again up
+    to `retries` times. A restarted sweep skips the jobs whose result file
+    exists, i.e. it only runs what is missing.
+
+    Args:
+        config (Dict[str, Any]): The config, see `load_sweep_config`.
+        max_workers (int, optional): The number of parallel jobs. Defaults to
+            config["max_workers"] or the number of CPUs.
+        poll_interval (float, optional): The interval of the timeout checks in
+            seconds. Defaults to 0.5.
+
+    Returns:
+        SweepSummary: The completed, skipped and failed job ids.
+    """
+    output_dir = config.get("output_dir", "sweep_results")
+    os.makedirs(output_dir, exist_ok=True)
+    max_workers = max_workers or config.get("max_workers") or os.cpu_count() or 1
+    timeout = config.get("timeout")
+    retries = config.get("retries", 1)
+
+    summary = SweepSummary()
+    pending = deque()
+    for job in sorted(expand_grid(config), key=estimate_job_cost, reverse=True):
+        if os.path.exists(_result_path(output_dir, job)):
+            summary.skipped.append(job_id(job))
+        else:
+            pending.append((job, 0))
+
+    running = dict()
+    while pending or running:
+        while pending and len(running) < max_workers:
+            job, attempt = pending.popleft()
+            process = mp.Process(target=run_job, args=(job, output_dir), daemon=True)
+            process.start()
+            running[process.sentinel] = (process, job, attempt, time.monotonic())
+
+        wait(list(running), timeout=poll_interval)
+        for sentinel, (process, job, attempt, started) in list(running.items()):
+            if process.is_alive():
+                if timeout is None or time.monotonic() - started < timeout:
+                    continue
+                process.kill()
+                process.join()
+                reason = f"timeout after {timeout}s"
+            else:
+                process.join()
+                reason = f"exit code {process.exitcode}"
+            del running[sentinel]
+
+            if process.exitcode == 0 and os.path.exists(_result_path(output_dir, job)):
+                summary.completed.append(job_id(job))
+            elif attempt < retries:
+                pending.append((job, attempt + 1))
+            else:
+                summary.failed[job_id(job)] = reason
+    return summary
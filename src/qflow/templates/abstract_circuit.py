@@ -1,11 +1,181 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
 
 import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
 from pennylane.operation import Operation
 
+from qflow.instrumentation import count, phase
+
+# operations that are not decomposed when a circuit is compiled
+COMPILE_STOP_AT = frozenset(qml.devices.DefaultQubit.operations)
+
+
+class CompiledCircuit:
+    """A recorded gate sequence whose gate parameters are affine in the circuit parameters.
+
+    Every trainable gate parameter is scale * params.flatten()[index] + offset.
+    Replaying the program only copies the recorded gates and sets their
+    parameters, the ansatz code and the template decompositions are not run.
+
+    Args:
+        ops (List[Operation]): The recorded gates.
+        slots (List[List[Tuple[int, int]]]): Per gate, the pairs (data position,
+            slot) of its trainable parameters.
+        index (np.ndarray): Per slot, the index of the circuit parameter.
+        scale (np.ndarray): Per slot, the scale of the circuit parameter.
+        offset (np.ndarray): Per slot, the offset.
+    """
+
+    def __init__(self, ops, slots, index, scale, offset):
+        self.ops = ops
+        self.slots = slots
+        self.index = index
+        self.scale = scale
+        self.offset = offset
+
+    def __call__(self, params) -> None:
+        if len(self.index):
+            flat = qml.math.reshape(params, (-1,))
+            values = _split(qml.math.take(flat, self.index) * self.scale + self.offset)
+        for op, slots in zip(self.ops, self.slots):
+            # a shallow copy without the per-attribute overhead of copy.copy
+            new = object.__new__(type(op))
+            new.__dict__.update(op.__dict__)
+            new.data = list(op.data)
+            for position, slot in slots:
+                new.data[position] = values[slot]
+            qml.QueuingManager.append(new)
+
+
+def _split(values) -> list:
+    """Split a vector of gate parameters into scalars, keeping their trainability."""
+    if isinstance(values, pnp.tensor):
+        # indexing a pnp.tensor is slow, views of 0-d arrays are not
+        requires_grad = values.requires_grad
+        scalars = []
+        for value in values.unwrap():
+            scalar = np.array(value).view(pnp.tensor)
+            scalar.requires_grad = requires_grad
+            scalars.append(scalar)
+        return scalars
+    return list(values)
+
+
+def _record(circuit: "AbstractCircuit", params: np.ndarray) -> List[Operation]:
+    """Record the ansatz and decompose it into device gates."""
+    tape = qml.tape.make_qscript(circuit._circuit_ansatz)(params)
+    tape = tape.expand(
+        depth=10, stop_at=lambda op: getattr(op, "name", None) in COMPILE_STOP_AT
+    )
+    return tape.operations
+
+
+def _same_structure(ops: List[Operation], other: List[Operation]) -> bool:
+    return len(ops) == len(other) and all(
+        a.name == b.name and a.wires == b.wires and len(a.data) == len(b.data)
+        for a, b in zip(ops, other)
+    )
+
+
+def compile_circuit(
+    circuit: "AbstractCircuit", shape: Tuple[int, ...], seed: int = 0
+) -> Optional[CompiledCircuit]:
+    """Compile a circuit into a `CompiledCircuit` by probing its ansatz.
+
+    The ansatz is recorded at params = 0, params = [1, 2, ..., P] and
+    params = [1, 4, ..., P^2]. A gate parameter that changes is attributed to
+    the circuit parameter j with the ratio of its changes (j + 1), which gives
+    its scale and offset. The program is checked against a random probe.
+
+    Args:
+        circuit (AbstractCircuit): The circuit.
+        shape (Tuple[int, ...]): The shape of the circuit parameters.
+        seed (int, optional): The seed of the random probe. Defaults to 0.
+
+    Returns:
+        CompiledCircuit or None: The program, or None if the structure depends
+            on the parameter values or a gate parameter is not affine in a
+            single circuit parameter.
+    """
+    size = int(np.prod(shape))
+    ramp = np.arange(1, size + 1, dtype=np.float64)
+    probes = [np.zeros(size), ramp, ramp**2]
+    probes.append(np.random.default_rng(seed).uniform(-np.pi, np.pi, size))
+    records = [_record(circuit, probe.reshape(shape)) for probe in probes]
+    if not all(_same_structure(records[0], record) for record in records[1:]):
+        return None
+
+    slots, index, scale, offset = [], [], [], []
+    for k, op in enumerate(records[0]):
+        op_slots = []
+        for position, value in enumerate(op.data):
+            values = [qml.math.toarray(record[k].data[position]) for record in records]
+            if np.ndim(values[0]) > 0 or np.iscomplexobj(values[0]):
+                if not all(np.array_equal(values[0], v) for v in values[1:3]):
+                    return None
+                continue
+            d0, d1, d2 = (float(v) for v in values[:3])
+            if d1 == d0 and d2 == d0:
+                continue
+            if d1 == d0:
+                return None
+            ratio = (d2 - d0) / (d1 - d0)
+            j = int(round(ratio)) - 1
+            if not 0 <= j < size or abs(ratio - (j + 1)) > 1e-6 * (j + 1):
+                return None
+            op_slots.append((position, len(index)))
+            index.append(j)
+            scale.append((d1 - d0) / (j + 1))
+            offset.append(d0)
+        slots.append(op_slots)
+
+    index, scale, offset = (
+        np.array(index, dtype=np.int64),
+        np.array(scale),
+        np.array(offset),
+    )
+    program = CompiledCircuit(records[0], slots, index, scale, offset)
+
+    # verify the affine model on the random probe
+    predicted = scale * probes[3][index] + offset
+    actual = [
+        records[3][k].data[position] for k, s in enumerate(slots) for position, _ in s
+    ]
+    if not np.allclose(predicted, np.array(actual, dtype=np.float64), atol=1e-9):
+        return None
+    for k, op in enumerate(records[0]):
+        constant = [p for p in range(len(op.data)) if p not in dict(slots[k])]
+        for position in constant:
+            if not np.allclose(
+                qml.math.toarray(op.data[position]),
+                qml.math.toarray(records[3][k].data[position]),
+            ):
+                return None
+    return program
+
 
 class AbstractCircuit(ABC):
-    """Abstract base class for quantum circuits."""
+    """Abstract base class for quantum circuits.
+
+    Calling a circuit applies its ansatz. On the first call for a parameter
+    shape, the ansatz is compiled into a `CompiledCircuit`, and later calls
+    only rebind the parameter values. Circuits whose structure depends on the
+    parameter values fall back to running `_circuit_ansatz`. Setting any
+    attribute of the circuit discards the compiled program. Set the class
+    attribute `compile_cache = False` to always run `_circuit_ansatz`.
+
+    Changing an attribute in place, e.g. an element of an array or an entry
+    of a dict, is not detected and the circuit keeps replaying the stale
+    program. Call `clear_compile_cache` after such a change, or rebind the
+    attribute.
+
+    Within a `Profiler`, the calls are timed as the phase "circuit" and the
+    compilations as "compile".
+    """
+
+    compile_cache: bool = True
 
     def __init__(self):
         """Initialize the circuit.
@@ -15,16 +185,42 @@ class AbstractCircuit(ABC):
         """
         pass
 
-    def __call__(self) -> Operation:
-        """Return the circuit as a PennyLane operation.
+    def __setattr__(self, name, value):
+        if name != "_compiled":
+            # e.g. new gates, Hamiltonians or initial states change the program
+            self.__dict__.pop("_compiled", None)
+        super().__setattr__(name, value)
 
-        Returns:
-            Operation: The PennyLane operation representing the circuit.
+    def clear_compile_cache(self) -> None:
+        """Discard the compiled program, it is compiled again on the next call."""
+        self.__dict__.pop("_compiled", None)
 
-        Raises:
-            NotImplementedError: If the method is not implemented by a subclass.
+    def __call__(self, params) -> Operation:
+        """Apply the circuit with the given parameters.
+
+        Args:
+            params (np.ndarray): The parameters of the circuit.
+
+        Returns:
+            Operation: The evaluation of the circuit.
         """
-        raise NotImplementedError
+        count("circuit_calls")
+        with phase("circuit"):
+            if not self.compile_cache:
+                return self._circuit_ansatz(params)
+
+            shape = tuple(np.shape(params))
+            compiled = self.__dict__.get("_compiled")
+            if compiled is None or compiled[0] != shape:
+                count("compilations")
+                with phase("compile"):
+                    compiled = (shape, compile_circuit(self, shape))
+                self._compiled = compiled
+                if compiled[1] is None:
+                    count("compile_fallbacks")
+            if compiled[1] is None:
+                return self._circuit_ansatz(params)
+            return compiled[1](params)
 
     def __repr__(self):
         """Return a string representation of the circuit.
@@ -7,7 +7,6 @@ import pennylane.numpy as pnp
 from pennylane.operation import Operation
 from pennylane.templates.layers import StronglyEntanglingLayers
 
-from qflow.hamiltonian.molecule import molecular_hamiltonian
 from qflow.templates.circuits import AbstractCircuit
 
 
@@ -103,17 +102,6 @@ class AbstractMolecularCircuit(AbstractCircuit):
         """
         self._params = params
 
-    def __call__(self, params: pnp.ndarray) -> Operation:
-        """Evaluate the circuit with given parameters.
-
-        Args:
-            params (pnp.ndarray): The parameters to be used for evaluating the circuit.
-
-        Returns:
-            Operation: The evaluation of the circuit.
-        """
-        return self._circuit_ansatz(params)
-
     @abstractmethod
     def _circuit_ansatz(self, params) -> Operation:
         raise NotImplementedError
@@ -1,9 +1,18 @@
-from qflow.templates.abstract_circuit import AbstractCircuit
-from qflow.templates.abstract_molecular_circuit import AbstractMolecularCircuit
-
-from .barren_plateau_circuit import BarrenPlateauCircuit
-from .molecular_basic_entangler import MolecularBasicEntangler
+from qflow._lazy import attach
 
 # from .molecular_hamiltonian_circuit import MolecularHamiltonianCircuit
-from .molecular_strong_entangler import MolecularStrongEntangler
-from .qaoa_circuit import QAOACircuit
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "qflow.templates.abstract_circuit": ["AbstractCircuit"],
+        "qflow.templates.abstract_molecular_circuit": ["AbstractMolecularCircuit"],
+        "qflow.templates.circuits.barren_plateau_circuit": ["BarrenPlateauCircuit"],
+        "qflow.templates.circuits.molecular_basic_entangler": [
+            "MolecularBasicEntangler"
+        ],
+        "qflow.templates.circuits.molecular_strong_entangler": [
+            "MolecularStrongEntangler"
+        ],
+        "qflow.templates.circuits.qaoa_circuit": ["QAOACircuit"],
+    },
+)
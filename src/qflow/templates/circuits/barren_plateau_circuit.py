@@ -1,4 +1,4 @@
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
 import autograd
 import numpy as np
@@ -10,6 +10,41 @@ from qflow.templates.circuits import AbstractCircuit
 from qflow.utils.utils import pairwise
 
 
+# gate code -> rotation gate of the random layers
+GATES = (qml.RX, qml.RY, qml.RZ)
+
+
+def sample_gate_codes(
+    num_layers: int,
+    num_qubits: int,
+    num_circuits: Optional[int] = None,
+    seed: Optional[Union[int, np.random.Generator]] = None,
+) -> np.ndarray:
+    """Draw the random rotation gates of barren plateau circuits.
+
+    Args:
+        num_layers (int): Number of layers in the circuit.
+        num_qubits (int): Number of qubits in the circuit.
+        num_circuits (int, optional): Number of circuit instances. Defaults to
+            None, i.e. a single instance.
+        seed (int or np.random.Generator, optional): Seed for the random number
+            generator, or a generator to draw from. Defaults to None, i.e. the
+            global `np.random` stream, in the order of one draw per layer and
+            wire.
+
+    Returns:
+        np.ndarray: The int8 gate codes (indices into `GATES`) of shape
+            (num_layers, num_qubits), or (num_circuits, num_layers, num_qubits).
+    """
+    shape = (num_layers, num_qubits)
+    if num_circuits is not None:
+        shape = (num_circuits,) + shape
+    if seed is None:
+        return np.random.randint(0, len(GATES), size=shape).astype(np.int8)
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, len(GATES), size=shape, dtype=np.int8)
+
+
 class BarrenPlateauCircuit(AbstractCircuit):
     """Class for building Barren Plateau Circuits.
         https://arxiv.org/pdf/1803.11173.pdf
@@ -20,7 +55,8 @@ class BarrenPlateauCircuit(AbstractCircuit):
     Attributes:
         num_layers (int): Number of layers in the circuit.
         num_qubits (int): Number of qubits in the circuit.
-        list_gate_set (list): List of gate sequences for each layer.
+        gate_codes (np.ndarray): The (num_layers, num_qubits) int8 codes of the
+            rotation gates, see `GATES`.
         params (numpy.ndarray): Parameters for the circuit.
     """
 
@@ -29,7 +65,7 @@ class BarrenPlateauCircuit(AbstractCircuit):
         self.num_layers = num_layers
         self.num_qubits = num_qubits
         self.params_shape = (self.num_layers * self.num_qubits,)
-        self.list_gate_set = []  # (n_qubits, layers)
+        self.gate_codes = None  # (layers, n_qubits)
 
     @property
     def wires(self):
@@ -43,6 +79,10 @@ class BarrenPlateauCircuit(AbstractCircuit):
     def init(self, seed: int = None):
         """Initializes the gate sequences and circuit parameters.
 
+        The gates and then the parameters are drawn from the global
+        `np.random` stream, such that a seed gives the same circuit as
+        sampling the gates one by one with `np.random.choice`.
+
         Args:
             seed (int, optional): Seed for the random number generator.
 
@@ -53,28 +93,18 @@ class BarrenPlateauCircuit(AbstractCircuit):
             np.random.seed(seed)
             pnp.random.seed(seed)
 
-        self.list_gate_set = self._pauli_gates(self.num_layers, self.wires, seed)
+        self.gate_codes = sample_gate_codes(self.num_layers, self.num_qubits)
         return self._params(seed)
 
-    def _pauli_gates(
-        self, layer: int, wires: List[int], seed: Optional[int] = None
-    ) -> List[Dict[int, Callable[[float], Operation]]]:
-        """Generates a random sequence of Pauli gates for each layer.
-
-        Args:
-            layer (int): Number of layers in the circuit.
-            wires (List): List of wires in the circuit.
-            rng_key (int, optional): Seed for the random number generator.
-
-        Returns:
-            List: List of gate sequences for each layer.
-        """
-        list_gate_set = []
-        for _ in range(layer):
-            gate_set = [qml.RX, qml.RY, qml.RZ]
-            random_gate_sequence = {i: np.random.choice(gate_set) for i in wires}
-            list_gate_set.append(random_gate_sequence)
-        return list_gate_set
+    @property
+    def list_gate_set(self) -> List[Dict[int, Callable[[float], Operation]]]:
+        """The gates as a list (per layer) of dicts from wire to gate class."""
+        if self.gate_codes is None:
+            return []
+        return [
+            {wire: GATES[code] for wire, code in zip(self.wires, layer)}
+            for layer in self.gate_codes
+        ]
 
     def _params(self, seed: int):
         """Initialize the parameters for the circuit evaluation.
@@ -110,17 +140,6 @@ class BarrenPlateauCircuit(AbstractCircuit):
         H = qml.Hamiltonian(coeffs, obs)
         return H
 
-    def __call__(self, params):
-        """Execute the circuit with given parameters.
-
-        Args:
-            params (np.ndarray): The parameters to be used for executing the circuit.
-
-        Returns:
-            Operation: The evaluation of the circuit.
-        """
-        return self._circuit_ansatz(params)
-
     def _circuit_ansatz(self, params) -> Operation:
         """Perform the actual circuit execution with given parameters.
 
@@ -131,10 +150,10 @@ class BarrenPlateauCircuit(AbstractCircuit):
             Operation: The evaluation of the circuit.
 
         Raises:
-            AssertionError: If `self.list_gate_set` is not None or if the shape of
+            AssertionError: If `self.gate_codes` is None or if the shape of
                 the 'params' does not match.
         """
-        assert self.list_gate_set is not None
+        assert self.gate_codes is not None
         assert (
             len(params.flatten()) == self.num_qubits * self.num_layers
         ), f"{len(params.flatten())} != {self.num_qubits * self.num_layers}"
@@ -150,7 +169,7 @@ class BarrenPlateauCircuit(AbstractCircuit):
 
         for layer in range(self.num_layers):
             for wire in self.wires:
-                self.list_gate_set[layer][wire](params[layer][wire], wires=wire)
+                GATES[self.gate_codes[layer, wire]](params[layer][wire], wires=wire)
 
             qml.Barrier(wires=self.wires)
 
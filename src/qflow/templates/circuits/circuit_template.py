@@ -27,8 +27,5 @@ class TemplateCircuit(AbstractCircuit):
         H = qml.Hamiltonian(coeffs, obs)
         return H
 
-    def __call__(self, x):
-        return self._circuit_ansatz(x)
-
     def _circuit_ansatz(self, x):
         qml.RY(np.pi / 4, wires=0)
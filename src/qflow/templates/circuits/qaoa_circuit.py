@@ -20,6 +20,10 @@ class QAOACircuit(AbstractCircuit):
         initial_state (qml.qnode, optional): The initial state of the circuit. Default is the Plus state.
         mixer_h (qml.qnode, optional): The mixer Hamiltonian. Default is the x_mixer.
         num_layers (int, optional): The number of blocks of time evolution. Default is 1.
+        mixer_method (str, optional): How the mixer evolution is applied. "trotter"
+            applies a single Trotter step, "exact" applies exp(-i beta mixer_h) in the
+            eigenbasis of the mixer and "matching" applies the XY mixer as commuting
+            matchings of IsingXY gates. Default is "trotter".
 
     Attributes:
         H (qml.Hamiltonian): The cost Hamiltonian of the optimization problem.
@@ -27,15 +31,21 @@ class QAOACircuit(AbstractCircuit):
         mixer_h (qml.qnode): The mixer Hamiltonian of the optimization problem.
         num_qubits (int): The number of qubits in the Hamiltonian.
         num_layers (int): The number of blocks of time evolution.
+        mixer_method (str): How the mixer evolution is applied.
 
+    Raises:
+        ValueError: If the mixer method is unknown.
     """
 
+    mixer_methods = ("trotter", "exact", "matching")
+
     def __init__(
         self,
         H: qml.Hamiltonian,
         initial_state: qml.qnode = Plus,
         mixer_h: qml.qnode = x_mixer,
         num_layers: int = 1,
+        mixer_method: str = "trotter",
     ):
         self.H = H
         self.initial_state = initial_state
@@ -47,6 +57,16 @@ class QAOACircuit(AbstractCircuit):
             self.H.wires
         ), f"N qubits mixer_h: {len(self.mixer_h.wires)} N qubits H: {len(self.H.wires)} "
 
+        if mixer_method not in self.mixer_methods:
+            raise ValueError(
+                f"Unknown mixer method {mixer_method}, expected one of {self.mixer_methods}."
+            )
+        self.mixer_method = mixer_method
+        if mixer_method == "exact":
+            self._mixer_eigensystem = mixer_eigensystem(self.mixer_h, self.wires)
+        elif mixer_method == "matching":
+            self._mixer_matchings = xy_matchings(self.mixer_h)
+
     @property
     def wires(self):
         return self.H.wires
@@ -71,17 +91,6 @@ class QAOACircuit(AbstractCircuit):
         x0 = pnp.concatenate((gamma_init, beta_init), axis=0)
         return x0
 
-    def __call__(self, params: pnp.ndarray) -> Operation:
-        """Evaluates the circuit at the given parameters.
-
-        Args:
-            params (numpy.ndarray): The parameters of the circuit.
-
-        Returns:
-            Operation: The evaluation of the circuit.
-        """
-        return self._circuit_ansatz(params)
-
     def _circuit_ansatz(self, params) -> Operation:
         """Perform the actual circuit evaluation with given parameters.
 
@@ -107,4 +116,16 @@ class QAOACircuit(AbstractCircuit):
         gamma_list = params[: self.num_layers]
         for beta, gamma in zip(beta_list, gamma_list):
             qml.ApproxTimeEvolution(self.H, gamma, 1)
+            self._mixer_evolution(beta)
+
+    def _mixer_evolution(self, beta) -> None:
+        """Apply the time evolution exp(-i beta mixer_h) with the mixer method."""
+        if self.mixer_method == "exact":
+            exact_mixer_evolution(beta, self._mixer_eigensystem, wires=self.wires)
+        elif self.mixer_method == "matching":
+            # IsingXY(phi) = exp(i phi / 4 (XX + YY))
+            for matching in self._mixer_matchings:
+                for edge, coeff in matching:
+                    qml.IsingXY(-4 * coeff * beta, wires=edge)
+        else:
             qml.ApproxTimeEvolution(self.mixer_h, beta, 1)
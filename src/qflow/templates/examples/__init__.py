@@ -1,14 +1,23 @@
-from .barren_plateau_circuit import barren_plateau_example
+from qflow._lazy import attach
 
 # from .h2_circuit import h2_vqe_example
 # from .h2_simple_circuit import h2_simple_vqe_circuit
-from .h2o_circuit import (
-    h2o_vqe_basic_entangler_example,
-    h2o_vqe_strong_entangler_example,
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "qflow.templates.examples.barren_plateau_circuit": ["barren_plateau_example"],
+        "qflow.templates.examples.h2o_circuit": [
+            "h2o_vqe_basic_entangler_example",
+            "h2o_vqe_strong_entangler_example",
+        ],
+        "qflow.templates.examples.h4_circuit": [
+            "h4_vqe_basic_entangler_example",
+            "h4_vqe_strong_entangler_example",
+        ],
+        "qflow.templates.examples.lih_circuit": [
+            "lih_vqe_basic_entangler_example",
+            "lih_vqe_strong_entangler_example",
+        ],
+        "qflow.templates.examples.maxcut_circuit": ["maxcut_qaoa_example"],
+    },
 )
-from .h4_circuit import h4_vqe_basic_entangler_example, h4_vqe_strong_entangler_example
-from .lih_circuit import (
-    lih_vqe_basic_entangler_example,
-    lih_vqe_strong_entangler_example,
-)
-from .maxcut_circuit import maxcut_qaoa_example
@@ -1,6 +1,4 @@
-import numpy as np
-
-from qflow.hamiltonian.utils_hamiltonian import get_eigenvalues_hamiltonian
+from qflow.hamiltonian.utils_hamiltonian import get_reference_spectrum
 from qflow.templates.circuits import BarrenPlateauCircuit
 
 
@@ -32,7 +30,6 @@ def barren_plateau_example(
     """
 
     circuit = BarrenPlateauCircuit(num_layers=num_layers, num_qubits=num_qubits)
-    eigenvalues = get_eigenvalues_hamiltonian(circuit.H)
-    min_energy = np.min(eigenvalues)
+    min_energy = get_reference_spectrum(circuit.H).min_energy
 
     return circuit, circuit.H, min_energy
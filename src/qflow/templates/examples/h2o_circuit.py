@@ -1,6 +1,7 @@
 import pennylane.numpy as pnp
 
 from qflow.hamiltonian.h2o_hamiltonian import get_h2o_hamiltonian
+from qflow.hamiltonian.tapering import taper_hamiltonian
 from qflow.templates.circuits import (
     AbstractMolecularCircuit,
     MolecularBasicEntangler,
@@ -12,6 +13,7 @@ def h2o_vqe_basic_entangler_example(
     num_layers: int = 1,
     distance: float = 1.32,
     angle: float = 104.5,
+    taper: bool = False,
 ) -> AbstractMolecularCircuit:
     """
     Creates a VQE circuit for the H2O molecule using the Basic Entangler Layers ansatz.
@@ -23,6 +25,7 @@ def h2o_vqe_basic_entangler_example(
         num_layers (int): The number of layers in the ansatz. Default: 1.
         distance (float): The O-H bond distance in the H2O molecule, in angstroms. Default: 1.32.
         angle (float): The H-O-H bond angle in degrees. Default: 104.5.
+        taper (bool): Whether to remove the qubits of the Z2 symmetries, see `taper_hamiltonian`. Default: False.
         seed (int): The random seed for the Gaussian noise. Default: 0.
 
     Returns:
@@ -43,6 +46,9 @@ def h2o_vqe_basic_entangler_example(
 
     initial_state = pnp.array([1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0])
 
+    if taper:
+        H, initial_state = taper_hamiltonian(H, num_electrons=int(sum(initial_state)))
+
     circuit = MolecularBasicEntangler(
         num_layers=num_layers,
         wires=H.wires,
@@ -56,6 +62,7 @@ def h2o_vqe_strong_entangler_example(
     num_layers: int = 1,
     distance: float = 1.32,
     angle: float = 104.5,
+    taper: bool = False,
 ) -> AbstractMolecularCircuit:
     """
     Build a quantum circuit for the Variational Quantum Eigensolver (VQE)
@@ -90,6 +97,9 @@ def h2o_vqe_strong_entangler_example(
 
     initial_state = pnp.array([1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0])
 
+    if taper:
+        H, initial_state = taper_hamiltonian(H, num_electrons=int(sum(initial_state)))
+
     circuit = MolecularStrongEntangler(
         num_layers=num_layers,
         wires=H.wires,
@@ -3,6 +3,7 @@ from typing import Tuple
 import pennylane.numpy as pnp
 
 from qflow.hamiltonian import get_h4_hamiltonian
+from qflow.hamiltonian.tapering import taper_hamiltonian
 from qflow.templates.circuits import (
     AbstractMolecularCircuit,
     MolecularBasicEntangler,
@@ -14,6 +15,7 @@ def h4_vqe_strong_entangler_example(
     num_layers: int = 1,
     distance: float = 1.0,
     angle: float = 90.0,
+    taper: bool = False,
 ) -> AbstractMolecularCircuit:
     """
     Creates a VQE circuit for the H4 molecule using the Strongly Entangling Layers ansatz.
@@ -25,6 +27,7 @@ def h4_vqe_strong_entangler_example(
         num_layers (int): The number of layers in the ansatz. Default: 1.
         distance (float): The distance between the H atoms in the H4 molecule, in angstroms. Default: 1.0.
         angle (float): The H-H-H bond angle in degrees. Default: 90.0.
+        taper (bool): Whether to remove the qubits of the Z2 symmetries, see `taper_hamiltonian`. Default: False.
         seed (int): The random seed for the Gaussian noise. Default: 0.
 
     Returns:
@@ -44,6 +47,9 @@ def h4_vqe_strong_entangler_example(
 
     initial_state = pnp.array([1, 1, 1, 1, 0, 0, 0, 0])
 
+    if taper:
+        H, initial_state = taper_hamiltonian(H, num_electrons=int(sum(initial_state)))
+
     circuit = MolecularStrongEntangler(
         num_layers=num_layers,
         wires=H.wires,
@@ -57,6 +63,7 @@ def h4_vqe_basic_entangler_example(
     num_layers: int = 1,
     distance: float = 1.0,
     angle: float = 90.0,
+    taper: bool = False,
 ) -> AbstractMolecularCircuit:
     """
     Creates a VQE circuit for the H4 molecule using the Basic Entangler Layers ansatz.
@@ -68,6 +75,7 @@ def h4_vqe_basic_entangler_example(
         num_layers (int): The number of layers in the ansatz. Default: 1.
         distance (float): The distance between the H atoms in the H4 molecule, in angstroms. Default: 1.0.
         angle (float): The H-H-H bond angle in degrees. Default: 90.0.
+        taper (bool): Whether to remove the qubits of the Z2 symmetries, see `taper_hamiltonian`. Default: False.
         hf_params (bool): If True, use the Hartree-Fock parameters as initial parameters for the ansatz. Default: False.
         perturb_hf_params (bool): If True, perturb the Hartree-Fock parameters by adding random Gaussian noise. Default: True.
         seed (int): The random seed for the Gaussian noise. Default: 0.
@@ -90,6 +98,9 @@ def h4_vqe_basic_entangler_example(
 
     initial_state = pnp.array([1, 1, 1, 1, 0, 0, 0, 0])
 
+    if taper:
+        H, initial_state = taper_hamiltonian(H, num_electrons=int(sum(initial_state)))
+
     circuit = MolecularBasicEntangler(
         num_layers=num_layers,
         wires=H.wires,
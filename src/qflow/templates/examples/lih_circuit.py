@@ -2,6 +2,7 @@ import pennylane.numpy as pnp
 
 from qflow.hamiltonian.lih_hamiltonian import get_lih_hamiltonian
 from qflow.hamiltonian.molecule import molecular_hamiltonian
+from qflow.hamiltonian.tapering import taper_hamiltonian
 from qflow.templates.circuits import (
     AbstractMolecularCircuit,
     MolecularBasicEntangler,
@@ -12,6 +13,7 @@ from qflow.templates.circuits import (
 def lih_vqe_basic_entangler_example(
     num_layers: int = 1,
     distance: float = 3.0,
+    taper: bool = False,
 ) -> AbstractMolecularCircuit:
     """
     Creates a VQE circuit for the LiH molecule using the Basic Entangler Layers ansatz.
@@ -22,6 +24,7 @@ def lih_vqe_basic_entangler_example(
     Args:
         num_layers (int): The number of layers in the ansatz. Default: 1.
         distance (float): The distance between the Li and H atoms in the LiH molecule, in angstroms. Default: 3.0.
+        taper (bool): Whether to remove the qubits of the Z2 symmetries, see `taper_hamiltonian`. Default: False.
 
     Returns:
         A tuple containing the following values:
@@ -41,6 +44,9 @@ def lih_vqe_basic_entangler_example(
 
     initial_state = pnp.array([1, 1, 0, 0, 0, 0, 0, 0, 0, 0])
 
+    if taper:
+        H, initial_state = taper_hamiltonian(H, num_electrons=int(sum(initial_state)))
+
     circuit = MolecularBasicEntangler(
         num_layers=num_layers,
         wires=H.wires,
@@ -53,6 +59,7 @@ def lih_vqe_basic_entangler_example(
 def lih_vqe_strong_entangler_example(
     num_layers: int = 1,
     distance: float = 3.0,
+    taper: bool = False,
 ) -> AbstractMolecularCircuit:
     """
     Creates a VQE circuit for the LiH molecule using the Strongly Entangling Layers ansatz.
@@ -64,6 +71,7 @@ def lih_vqe_strong_entangler_example(
         num_layers (int): The number of layers in the ansatz. Default: 1.
         hf_params (bool): Whether to use the Hartree-Fock parameters as initial parameters. Default: False.
         distance (float): The distance between the Li and H atoms in the LiH molecule, in angstroms. Default: 3.0.
+        taper (bool): Whether to remove the qubits of the Z2 symmetries, see `taper_hamiltonian`. Default: False.
         perturb_hf_params (bool): Whether to perturb the Hartree-Fock parameters when using them as initial parameters. Default: True.
         seed (int): The random seed for the Gaussian noise. Default: 0.
 
@@ -84,6 +92,9 @@ def lih_vqe_strong_entangler_example(
 
     initial_state = pnp.array([1, 1, 0, 0, 0, 0, 0, 0, 0, 0])
 
+    if taper:
+        H, initial_state = taper_hamiltonian(H, num_electrons=int(sum(initial_state)))
+
     circuit = MolecularStrongEntangler(
         num_layers=num_layers,
         wires=H.wires,
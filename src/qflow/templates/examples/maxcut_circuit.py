@@ -1,7 +1,6 @@
-import numpy as np
 import pennylane as qml
 
-from qflow.hamiltonian.utils_hamiltonian import get_eigenvalues_hamiltonian
+from qflow.hamiltonian.utils_hamiltonian import get_reference_spectrum
 from qflow.qaoa.mixer_h import x_mixer
 from qflow.templates.circuits import QAOACircuit
 from qflow.templates.state_preparation import Plus
@@ -44,7 +43,6 @@ def maxcut_qaoa_example(
         H=H, initial_state=initial_state, mixer_h=mixer_h, num_layers=num_layers
     )
 
-    eigenvalues = get_eigenvalues_hamiltonian(H)
-    min_energy = np.min(eigenvalues)
+    min_energy = get_reference_spectrum(H).min_energy
 
     return circuit, H, min_energy
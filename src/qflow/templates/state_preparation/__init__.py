@@ -1,2 +1,9 @@
-from .dicke_state import DickeState
-from .plus import Plus
+from qflow._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "qflow.templates.state_preparation.dicke_state": ["DickeState"],
+        "qflow.templates.state_preparation.plus": ["Plus"],
+    },
+)
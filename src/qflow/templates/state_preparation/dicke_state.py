@@ -1,23 +1,82 @@
-import jax.numpy as jnp
+from typing import Sequence
+
 import numpy as np
 import pennylane as qml
-from jax import vmap
 
-from qflow.utils.utils import get_all_bitstrings
+from qflow.utils.utils import get_hamming_weight_indices
 
 from .abstract_initial_state import InitialState
 
 
+def _split_and_cyclic_shift(n: int, k: int, wires: Sequence) -> None:
+    """Apply the split & cyclic shift unitary SCS_{n,k} on the first n wires."""
+    qml.CNOT(wires=[wires[n - 2], wires[n - 1]])
+    qml.CRY(2 * np.arccos(np.sqrt(1 / n)), wires=[wires[n - 1], wires[n - 2]])
+    qml.CNOT(wires=[wires[n - 2], wires[n - 1]])
+    for l in range(2, k + 1):
+        qml.CNOT(wires=[wires[n - 1 - l], wires[n - 1]])
+        qml.ctrl(qml.RY, control=[wires[n - 1], wires[n - l]])(
+            2 * np.arccos(np.sqrt(l / n)), wires=wires[n - 1 - l]
+        )
+        qml.CNOT(wires=[wires[n - 1 - l], wires[n - 1]])
+
+
+def dicke_state_circuit(num_qubits: int, hamming_weight: int, wires: Sequence) -> None:
+    """Deterministically prepare a Dicke state with O(n k) gates.
+        https://arxiv.org/abs/1904.07358
+
+    Args:
+        num_qubits (int): The number of qubits.
+        hamming_weight (int): The number of excitations.
+        wires (Sequence): The wires of the state.
+    """
+    wires = list(wires)
+    for wire in wires[num_qubits - hamming_weight :]:
+        qml.PauliX(wires=wire)
+    for n in range(num_qubits, hamming_weight, -1):
+        _split_and_cyclic_shift(n, hamming_weight, wires)
+    for n in range(hamming_weight, 1, -1):
+        _split_and_cyclic_shift(n, n - 1, wires)
+
+
 class DickeState(InitialState):
-    def __init__(self, num_qubits, hamming_weight, **kwargs):
+    """The equal superposition of all basis states with a fixed Hamming weight.
+
+    Args:
+        num_qubits (int): The number of qubits.
+        hamming_weight (int): The number of ones in each basis state.
+        method (str, optional): "statevector" loads the amplitude vector with
+            `qml.QubitStateVector`, "gates" prepares the state with the
+            deterministic split & cyclic shift circuit and never builds a 2^n
+            vector. Defaults to "statevector".
+    """
+
+    def __init__(self, num_qubits, hamming_weight, method="statevector", **kwargs):
         super().__init__(num_qubits, **kwargs)
-        self.state = np.zeros(2**self.num_qubits, dtype=np.complex128)
-        all_bitstrings = get_all_bitstrings(self.num_qubits)
-        sum_bitstrings = vmap(jnp.sum)(all_bitstrings)  # nice!
-        self.index_ = list(*jnp.where(sum_bitstrings == hamming_weight))
+        if method not in ("statevector", "gates"):
+            raise ValueError(
+                f"Unknown method {method}, expected 'statevector' or 'gates'."
+            )
+        self.hamming_weight = hamming_weight
+        self.method = method
         self.wires = range(self.num_qubits)
-        for i in self.index_:
-            self.state[i] = 1 / np.sqrt(len(self.index_)) * 1 + 0j
+        self._index = None
+        self.state = None
+        if self.method == "statevector":
+            self.state = np.zeros(2**self.num_qubits, dtype=np.complex128)
+            self.state[self.index_] = 1 / np.sqrt(len(self.index_)) + 0j
+
+    @property
+    def index_(self) -> np.ndarray:
+        """The indices of the basis states in the superposition."""
+        if self._index is None:
+            self._index = get_hamming_weight_indices(
+                self.num_qubits, self.hamming_weight
+            )
+        return self._index
 
     def __call__(self):
-        qml.QubitStateVector(self.state, wires=self.wires)
+        if self.method == "gates":
+            dicke_state_circuit(self.num_qubits, self.hamming_weight, self.wires)
+        else:
+            qml.QubitStateVector(self.state, wires=self.wires)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from qflow.barren_plateau import (
+    RunningStats,
+    barren_plateau_gradients,
+    gradient_variance_study,
+)
+from qflow.barren_plateau.study import _pennylane_gradients
+from qflow.templates.circuits.barren_plateau_circuit import sample_gate_codes
+
+
+@pytest.mark.parametrize("num_layers, num_qubits", [(1, 2), (3, 4), (2, 5)])
+def test_barren_plateau_gradients(num_layers, num_qubits):
+    rng = np.random.default_rng(0)
+    gate_codes = sample_gate_codes(num_layers, num_qubits, 3, seed=rng)
+    params = rng.uniform(-np.pi, np.pi, size=gate_codes.shape)
+
+    energies, grads = barren_plateau_gradients(gate_codes, params)
+    expected_energies, expected_grads = _pennylane_gradients(gate_codes, params)
+
+    np.testing.assert_allclose(energies, expected_energies, atol=1e-10)
+    np.testing.assert_allclose(grads, expected_grads, atol=1e-10)
+
+
+def test_running_stats():
+    values = np.random.default_rng(1).normal(size=101)
+    running = RunningStats()
+    for chunk in np.array_split(values, 7):
+        running.merge(RunningStats().update(chunk))
+
+    assert running.count == len(values)
+    np.testing.assert_allclose(running.mean, np.mean(values))
+    np.testing.assert_allclose(running.variance, np.var(values, ddof=1))
+    low, high = running.variance_interval(0.95)
+    assert low < running.variance < high
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_gradient_variance_study(max_workers):
+    results = list(
+        gradient_variance_study(
+            [2, 3], [2], num_samples=50, batch_size=16, max_workers=max_workers
+        )
+    )
+    assert sorted((r.num_qubits, r.num_layers) for r in results) == [(2, 2), (3, 2)]
+    for result in results:
+        assert result.num_samples == 50
+        assert result.mean_ci[0] < result.mean < result.mean_ci[1]
+        assert result.variance_ci[0] < result.variance < result.variance_ci[1]
+
+    # the chunk seeds do not depend on the number of workers
+    reference = {
+        r.num_qubits: r.variance
+        for r in gradient_variance_study([2, 3], [2], num_samples=50, batch_size=16)
+    }
+    for result in results:
+        np.testing.assert_allclose(result.variance, reference[result.num_qubits])
@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from qflow.utils.utils import CACHE_DIR_ENV
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(tmp_path_factory):
+    """Point the on-disk caches to a fresh directory for the whole session.
+
+    The tests never read entries of the user's cache, which could hide a
+    regression of the Hamiltonian builders, and never write to it.
+    """
+    previous = os.environ.get(CACHE_DIR_ENV)
+    os.environ[CACHE_DIR_ENV] = str(tmp_path_factory.mktemp("qflow_cache"))
+    yield os.environ[CACHE_DIR_ENV]
+    if previous is None:
+        del os.environ[CACHE_DIR_ENV]
+    else:
+        os.environ[CACHE_DIR_ENV] = previous
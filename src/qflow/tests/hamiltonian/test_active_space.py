@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from qflow.hamiltonian.active_space import select_active_space
+from qflow.hamiltonian.lih_hamiltonian import get_lih_hamiltonian
+from qflow.hamiltonian.molecule import molecular_hamiltonian
+
+
+@pytest.mark.parametrize(
+    "threshold, expected",
+    [(0.05, (2, 2, 2)), (0.015, (4, 3, 1)), (1e-6, (4, 4, 1))],
+)
+def test_select_active_space(threshold, expected):
+    no_occ = np.array([0.0, 1.99, 0.1, 2.0, 0.01, 1.9])
+    space = select_active_space(no_occ, num_electrons=6, threshold=threshold)
+    assert (space.active_electrons, space.active_orbitals, space.num_core) == expected
+    assert space.discarded_occupation <= threshold
+    assert space.num_qubits == 2 * space.active_orbitals
+
+
+def test_select_active_space_infeasible():
+    no_occ = np.array([2.0, 1.5, 0.5, 0.0])
+    assert select_active_space(no_occ, num_electrons=4).active_orbitals == 2
+    with pytest.raises(ValueError):
+        select_active_space(no_occ, num_electrons=4, max_orbitals=1)
+
+
+def test_lih_active_space():
+    _, num_qubits, _, _, no_occ = get_lih_hamiltonian(2.0)
+    space = select_active_space(no_occ, num_electrons=4, threshold=0.01)
+    assert space.num_qubits < num_qubits
+
+    H, auto_num_qubits, _, _, _ = get_lih_hamiltonian(2.0, active_space_threshold=0.01)
+    assert auto_num_qubits == space.num_qubits == len(H.wires)
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_molecular_hamiltonian_active_space(cache):
+    kwargs = dict(
+        symbols=["Li", "H"],
+        coordinates=np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 2.0]]),
+        frozen=1,
+        cache=cache,
+        return_stats=True,
+    )
+    *_, no_occ, stats = molecular_hamiltonian(**kwargs, active_space_threshold=0.01)
+    assert stats.active_space == select_active_space(no_occ, 4, threshold=0.01)
+    assert stats.num_qubits == stats.active_space.num_qubits
+    assert stats.statevector_bytes == 16 * 2**stats.num_qubits
+    assert stats.compression is None
+
+    # a given active space is reported as well
+    H, num_qubits, *_, stats = molecular_hamiltonian(
+        **kwargs, active_electrons=2, active_orbitals=3
+    )
+    assert (stats.active_space.active_electrons, stats.num_qubits) == (2, 6)
+    assert stats.active_space.num_core == 1
+    assert num_qubits == len(H.wires) == stats.num_qubits
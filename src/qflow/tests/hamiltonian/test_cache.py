@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
+
+from qflow.hamiltonian.cache import (
+    hamiltonian_cache_key,
+    load_hamiltonian,
+    save_hamiltonian,
+)
+
+
+def get_test_hamiltonian():
+    coeffs = [-0.5, 0.2, 0.125]
+    obs = [
+        qml.Identity(0),
+        qml.PauliZ(1),
+        qml.PauliX(0) @ qml.PauliY(1) @ qml.PauliZ(3),
+    ]
+    return qml.Hamiltonian(coeffs, obs)
+
+
+def test_cache_key():
+    coordinates = pnp.array([[0.0, 0.0, 0.0], [0.0, 0.0, 3.0]])
+    key = hamiltonian_cache_key(symbols=["Li", "H"], coordinates=coordinates, frozen=1)
+    assert key == hamiltonian_cache_key(
+        frozen=1, symbols=["Li", "H"], coordinates=coordinates + 1e-14
+    )
+    assert key != hamiltonian_cache_key(
+        symbols=["Li", "H"], coordinates=coordinates, frozen=0
+    )
+
+
+def test_cache_roundtrip(tmp_path):
+    H = get_test_hamiltonian()
+    hf_occ, no_occ = np.array([2.0, 0.0]), np.array([1.9, 0.1])
+    key = hamiltonian_cache_key(name="test")
+
+    assert load_hamiltonian(key, cache_dir=str(tmp_path)) is None
+    save_hamiltonian(key, H, 4, -7.8, hf_occ, no_occ, cache_dir=str(tmp_path))
+    H_cached, num_qubits, energy, hf_cached, no_cached = load_hamiltonian(
+        key, cache_dir=str(tmp_path)
+    )
+
+    assert num_qubits == 4 and energy == -7.8
+    np.testing.assert_allclose(H_cached.coeffs, H.coeffs)
+    assert [str(op) for op in H_cached.ops] == [str(op) for op in H.ops]
+    np.testing.assert_allclose(hf_cached, hf_occ)
+    np.testing.assert_allclose(no_cached, no_occ)
+    assert not [f for f in os.listdir(tmp_path) if f.endswith(".tmp")]
+
+
+def test_cache_eviction(tmp_path):
+    H = get_test_hamiltonian()
+    occ = np.zeros(2)
+    keys = [hamiltonian_cache_key(index=i) for i in range(3)]
+    for i, key in enumerate(keys):
+        path = save_hamiltonian(key, H, 4, 0.0, occ, occ, cache_dir=str(tmp_path))
+        os.utime(path, (i, i))
+    # touching the first entry makes it the most recently used one
+    assert load_hamiltonian(keys[0], cache_dir=str(tmp_path)) is not None
+
+    size = os.path.getsize(path)
+    save_hamiltonian(
+        hamiltonian_cache_key(index=3),
+        H,
+        4,
+        0.0,
+        occ,
+        occ,
+        cache_dir=str(tmp_path),
+        max_bytes=2 * size,
+    )
+    assert load_hamiltonian(keys[0], cache_dir=str(tmp_path)) is not None
+    assert load_hamiltonian(keys[1], cache_dir=str(tmp_path)) is None
+    assert load_hamiltonian(keys[2], cache_dir=str(tmp_path)) is None
+
+
+def test_tests_use_isolated_cache(isolated_cache_dir):
+    from qflow.hamiltonian.cache import get_cache_dir
+
+    home_cache = os.path.join(os.path.expanduser("~"), ".cache", "qflow")
+    assert get_cache_dir().startswith(isolated_cache_dir)
+    assert not get_cache_dir().startswith(home_cache)
@@ -0,0 +1,61 @@
+import numpy as np
+import pennylane as qml
+import pytest
+
+from qflow.hamiltonian.compression import compress_hamiltonian
+from qflow.hamiltonian.h4_hamiltonian import get_h4_hamiltonian
+from qflow.hamiltonian.molecule import molecular_hamiltonian
+
+
+def _ground_energy(H, wires):
+    return np.linalg.eigvalsh(H.sparse_matrix(wire_order=wires).toarray())[0]
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.05, 0.2])
+def test_compress_hamiltonian(threshold):
+    rng = np.random.default_rng(0)
+    paulis = [qml.PauliX, qml.PauliY, qml.PauliZ]
+    ops = [qml.Identity(0)]
+    for _ in range(30):
+        i, j = rng.choice(3, size=2, replace=False)
+        ops.append(paulis[rng.integers(3)](i) @ paulis[rng.integers(3)](j))
+    H = qml.Hamiltonian(rng.normal(scale=0.1, size=len(ops)), ops)
+
+    H_small, stats = compress_hamiltonian(H, threshold)
+    assert stats.num_terms == len(ops)
+    assert stats.num_terms_compressed == len(H_small.ops)
+    assert np.all(np.abs(H_small.coeffs[1:]) > threshold)
+
+    wires = range(3)
+    dense = H.sparse_matrix(wire_order=wires).toarray()
+    dense_small = H_small.sparse_matrix(wire_order=wires).toarray()
+    assert np.linalg.norm(dense - dense_small, 2) <= stats.error_bound + 1e-12
+    if threshold == 0.0:
+        assert stats.num_dropped == 0
+        np.testing.assert_allclose(dense_small, dense, atol=1e-12)
+
+
+def test_compressed_molecular_hamiltonian():
+    kwargs = dict(
+        symbols=["H", "H", "H", "H"],
+        coordinates=np.array([[0.0, 0.0, z] for z in (0.0, 1.0, 2.0, 3.0)]),
+        cache=False,
+    )
+    H, num_qubits, _, _, _ = molecular_hamiltonian(**kwargs)
+    H_small, _, _, _, _, stats = molecular_hamiltonian(
+        **kwargs, threshold=1e-2, return_stats=True
+    )
+
+    compression = stats.compression
+    assert len(H_small.ops) == compression.num_terms_compressed < len(H.ops)
+    assert compression.num_terms == len(H.ops)
+    wires = range(num_qubits)
+    error = abs(_ground_energy(H_small, wires) - _ground_energy(H, wires))
+    assert error <= compression.error_bound
+
+
+def test_builder_return_stats():
+    *result, stats = get_h4_hamiltonian(threshold=1e-2, return_stats=True)
+    assert len(result) == 5
+    assert stats.num_qubits == result[1]
+    assert stats.compression.num_terms_compressed == len(result[0].ops)
@@ -0,0 +1,69 @@
+import numpy as np
+import pennylane as qml
+import pytest
+
+from qflow.hamiltonian import get_maxcut_hamiltonian
+from qflow.hamiltonian.diagonal import (
+    get_diagonal_expval_fn,
+    get_diagonal_hamiltonian,
+    is_diagonal_hamiltonian,
+    sample_diagonal_hamiltonian,
+)
+from qflow.templates.circuits import BarrenPlateauCircuit
+from qflow.templates.examples import maxcut_qaoa_example
+from qflow.utils.maxcut_utils import get_maxcut_costs, get_maxcut_graph
+
+
+@pytest.mark.parametrize("num_nodes, seed", [(4, 0), (6, 1)])
+def test_maxcut_diagonal(num_nodes, seed):
+    graph = get_maxcut_graph(num_nodes, seed=seed)
+    for H in [get_maxcut_hamiltonian(graph), qml.qaoa.maxcut(graph)[0]]:
+        assert is_diagonal_hamiltonian(H)
+        wires = sorted(H.wires)
+        diagonal = get_diagonal_hamiltonian(H, wires)
+        expected = qml.utils.sparse_hamiltonian(H, wires=wires).diagonal().real
+        np.testing.assert_allclose(diagonal, expected)
+        np.testing.assert_allclose(diagonal, get_maxcut_costs(graph))
+
+
+def test_non_diagonal_hamiltonian():
+    H = qml.Hamiltonian([1.0, 0.5], [qml.PauliZ(0), qml.PauliX(1)])
+    assert not is_diagonal_hamiltonian(H)
+    with pytest.raises(ValueError):
+        get_diagonal_hamiltonian(H)
+
+
+def test_diagonal_expval_fn():
+    circuit, H, _ = maxcut_qaoa_example(num_layers=2, num_nodes=5, seed=0)
+    params = circuit.init(0)
+
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def fun(params):
+        circuit(params)
+        return qml.expval(H)
+
+    expval_fn = get_diagonal_expval_fn(circuit, H)
+    np.testing.assert_allclose(expval_fn(params), fun(params))
+    np.testing.assert_allclose(qml.grad(expval_fn)(params), qml.grad(fun)(params))
+
+    samples = sample_diagonal_hamiltonian(
+        expval_fn.probs_fn(params), expval_fn.diagonal, shots=20000, seed=0
+    )
+    assert np.isclose(samples.mean(), fun(params), atol=0.1)
+
+
+def test_barren_plateau_diagonal():
+    circuit = BarrenPlateauCircuit(num_layers=2, num_qubits=4)
+    params = circuit.init(0)
+
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def fun(params):
+        circuit(params)
+        return qml.expval(circuit.H)
+
+    expval_fn = get_diagonal_expval_fn(circuit, circuit.H)
+    np.testing.assert_allclose(expval_fn(params), fun(params))
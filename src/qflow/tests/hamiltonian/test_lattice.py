@@ -0,0 +1,99 @@
+import pickle
+
+import networkx as nx
+import numpy as np
+import pennylane as qml
+import pytest
+
+from qflow.hamiltonian import (
+    get_heisenberg_hamiltonian,
+    get_transverse_field_ising_hamiltonian,
+)
+from qflow.hamiltonian.diagonal import get_diagonal_hamiltonian
+from qflow.hamiltonian.lattice import (
+    chain_edges,
+    graph_edges,
+    grid_edges,
+    heisenberg_pauli_sum,
+    transverse_field_ising_pauli_sum,
+)
+from qflow.hamiltonian.pauli_sum import PauliSum
+
+
+def _sparse(H, wires):
+    return H.sparse_matrix(wire_order=wires).toarray()
+
+
+@pytest.mark.parametrize("rows, cols", [(2, 2), (3, 4), (4, 3)])
+@pytest.mark.parametrize("periodic", [False, True])
+def test_grid_edges(rows, cols, periodic):
+    graph = nx.grid_2d_graph(rows, cols, periodic=periodic)
+    graph = nx.convert_node_labels_to_integers(graph)
+    expected = {frozenset(e) for e in graph.edges}
+    edges = grid_edges(rows, cols, periodic=periodic)
+    assert {frozenset(e) for e in edges.tolist()} == expected
+    assert len(edges) == len(expected)
+
+
+@pytest.mark.parametrize("n_spins", [2, 3])
+def test_heisenberg_hamiltonian(n_spins):
+    graph = nx.convert_node_labels_to_integers(nx.grid_2d_graph(n_spins, n_spins))
+    ops = []
+    for u, v in graph.edges:
+        ops += [P(u) @ P(v) for P in (qml.PauliX, qml.PauliY, qml.PauliZ)]
+    expected = qml.Hamiltonian(np.ones(len(ops)), ops)
+
+    H = get_heisenberg_hamiltonian(n_spins)
+    wires = range(n_spins**2)
+    np.testing.assert_allclose(_sparse(H, wires), _sparse(expected, wires))
+
+
+@pytest.mark.parametrize("n_spins", [3, 5])
+def test_transverse_field_ising_hamiltonian(n_spins):
+    ops = [qml.PauliZ(i) @ qml.PauliZ((i + 1) % n_spins) for i in range(n_spins)]
+    ops += [qml.PauliX(i) for i in range(n_spins)]
+    coeffs = [-1.0] * n_spins + [-0.7] * n_spins
+    expected = qml.Hamiltonian(coeffs, ops)
+
+    H = get_transverse_field_ising_hamiltonian(n_spins, 0.7)
+    wires = range(n_spins)
+    np.testing.assert_allclose(_sparse(H, wires), _sparse(expected, wires))
+
+
+def test_pauli_sum_sparse_matrix():
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 4, size=(20, 4))
+    H = PauliSum(rng.normal(size=20), codes, wires=["a", "b", "c", "d"])
+    expected = _sparse(H.to_hamiltonian(), H.wires)
+    np.testing.assert_allclose(H.sparse_matrix().toarray(), expected, atol=1e-12)
+
+    roundtrip = PauliSum.from_hamiltonian(H.to_hamiltonian(), H.wires)
+    np.testing.assert_allclose(roundtrip.coeffs, H.coeffs)
+    np.testing.assert_array_equal(roundtrip.codes, H.codes)
+
+
+def test_pauli_sum_arithmetic():
+    edges = chain_edges(4, periodic=True)
+    H = heisenberg_pauli_sum(edges, 4)
+    doubled = (H + H).simplify()
+    assert len(doubled) == len(H)
+    np.testing.assert_allclose(doubled.coeffs, 2.0)
+    assert len((H + (-1.0) * H).simplify()) == 0
+
+    clone = pickle.loads(pickle.dumps(H))
+    np.testing.assert_array_equal(clone.codes, H.codes)
+
+
+def test_pauli_sum_diagonal():
+    graph = nx.cycle_graph(["x", "y", "z", "w"])
+    edges, wires = graph_edges(graph)
+    H = transverse_field_ising_pauli_sum(edges, len(wires), 0.0, wires=wires)
+    H = H.simplify()
+    assert H.is_diagonal
+    np.testing.assert_allclose(
+        H.diagonal(), get_diagonal_hamiltonian(H.to_hamiltonian(), wires)
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
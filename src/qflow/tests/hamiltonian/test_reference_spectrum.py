@@ -0,0 +1,65 @@
+import numpy as np
+import pennylane as qml
+import pytest
+from scipy.linalg import eigvalsh
+
+from qflow.hamiltonian import get_maxcut_hamiltonian
+from qflow.hamiltonian.utils_hamiltonian import (
+    get_eigenvalues_hamiltonian,
+    get_reference_spectrum,
+)
+from qflow.utils.maxcut_utils import get_maxcut_graph
+
+
+def random_hamiltonian(num_qubits, num_terms, seed):
+    rng = np.random.default_rng(seed)
+    paulis = [qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ]
+    obs = []
+    for _ in range(num_terms):
+        word = rng.integers(0, 4, size=num_qubits)
+        factors = [paulis[p](w) for w, p in enumerate(word)]
+        obs.append(qml.operation.Tensor(*factors))
+    return qml.Hamiltonian(rng.normal(size=num_terms), obs)
+
+
+@pytest.mark.parametrize("num_qubits, dense_max_qubits", [(6, 10), (8, 4)])
+def test_reference_spectrum(num_qubits, dense_max_qubits):
+    H = random_hamiltonian(num_qubits, 20, seed=num_qubits)
+    eigenvalues = eigvalsh(H.sparse_matrix(wire_order=H.wires).toarray())
+    spectrum = get_reference_spectrum(H, dense_max_qubits=dense_max_qubits)
+
+    assert np.isclose(spectrum.min_energy, eigenvalues[0])
+    assert np.isclose(spectrum.max_energy, eigenvalues[-1])
+    assert np.isclose(spectrum.gap, eigenvalues[1] - eigenvalues[0])
+    assert get_reference_spectrum(H) is spectrum
+    np.testing.assert_allclose(get_eigenvalues_hamiltonian(H), eigenvalues)
+
+
+@pytest.mark.parametrize("dense_max_qubits", [10, 4])
+def test_reference_spectrum_degenerate(dense_max_qubits):
+    # Z2 symmetric, the ground level of the Ising ring is twofold degenerate
+    obs = [qml.PauliZ(i) @ qml.PauliZ((i + 1) % 6) for i in range(6)]
+    obs += [qml.PauliX(i) for i in range(6)]
+    H = qml.Hamiltonian([1.0] * 6 + [0.01] * 6, obs)
+    eigenvalues = eigvalsh(H.sparse_matrix(wire_order=H.wires).toarray())
+    spectrum = get_reference_spectrum(H, dense_max_qubits=dense_max_qubits)
+
+    assert np.isclose(spectrum.min_energy, eigenvalues[0])
+    distinct = eigenvalues[eigenvalues > eigenvalues[0] + 1e-6]
+    assert np.isclose(spectrum.gap, distinct[0] - eigenvalues[0], atol=1e-6)
+    assert spectrum.gap > 1.0
+
+
+def test_reference_spectrum_diagonal():
+    graph = get_maxcut_graph(7, seed=0)
+    H = get_maxcut_hamiltonian(graph)
+    eigenvalues = eigvalsh(H.sparse_matrix(wire_order=H.wires).toarray())
+    spectrum = get_reference_spectrum(H)
+
+    assert np.isclose(spectrum.min_energy, eigenvalues[0])
+    assert np.isclose(spectrum.max_energy, eigenvalues[-1])
+    # the Z2 symmetry of Max-Cut degenerates the ground level
+    degeneracy = np.sum(np.isclose(eigenvalues, eigenvalues[0]))
+    assert spectrum.degeneracy == degeneracy >= 2
+    assert np.isclose(spectrum.gap, eigenvalues[degeneracy] - eigenvalues[0])
+    assert spectrum.gap > 0
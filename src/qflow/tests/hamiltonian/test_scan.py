@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pytest
+
+from qflow.hamiltonian.scan import scan_geometries
+
+
+def dummy_builder(distance, angle=0.0, chkfile=None, offset=0.0):
+    # reports whether the geometry could be seeded from a previous checkpoint
+    warm = chkfile is not None and os.path.exists(chkfile)
+    if chkfile is not None:
+        with open(chkfile, "w") as f:
+            f.write(str(distance))
+    return distance + angle + offset, warm
+
+
+def failing_builder(distance, chkfile=None):
+    raise ValueError("SCF did not converge")
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_scan_geometries(max_workers):
+    grid = np.linspace(1.0, 2.0, 7)
+    results = dict()
+    for index, point, result in scan_geometries(
+        dummy_builder, grid, max_workers=max_workers, offset=1.0
+    ):
+        assert point == (grid[index],)
+        results[index] = result
+
+    assert sorted(results) == list(range(len(grid)))
+    np.testing.assert_allclose([results[i][0] for i in range(len(grid))], grid + 1.0)
+    # the first point of every chunk is a cold start, all others are warm
+    num_cold = sum(not warm for _, warm in results.values())
+    assert num_cold == max_workers
+
+
+def test_scan_geometries_tuples():
+    grid = [(1.0, 90.0), (1.1, 90.0), (1.2, 95.0)]
+    results = list(scan_geometries(dummy_builder, grid, max_workers=2))
+    assert sorted(result[0] for _, _, result in results) == [91.0, 91.1, 96.2]
+
+
+def test_scan_geometries_error():
+    with pytest.raises(ValueError):
+        list(scan_geometries(failing_builder, [1.0, 2.0], max_workers=2))
+
+
+def test_chkfile_written_on_cache_hit(tmp_path, monkeypatch):
+    from pyscf import lib, scf
+
+    from qflow.hamiltonian.molecule import molecular_hamiltonian
+
+    coordinates = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.4]])
+    first = str(tmp_path / "first.chk")
+    _, _, energy, _, _ = molecular_hamiltonian(
+        ["H", "H"], coordinates, cache=True, chkfile=first
+    )
+
+    # a cache hit writes the stored orbitals for the next point of a scan,
+    # without running the SCF again
+    def no_scf(*args, **kwargs):
+        raise AssertionError("SCF run on a cache hit")
+
+    monkeypatch.setattr(scf, "RHF", no_scf)
+    chkfile = str(tmp_path / "scan.chk")
+    molecular_hamiltonian(["H", "H"], coordinates, cache=True, chkfile=chkfile)
+    np.testing.assert_allclose(
+        lib.chkfile.load(chkfile, "scf/mo_coeff"),
+        lib.chkfile.load(first, "scf/mo_coeff"),
+    )
+    assert lib.chkfile.load(chkfile, "scf/e_tot") > energy
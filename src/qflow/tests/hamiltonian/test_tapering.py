@@ -0,0 +1,68 @@
+import numpy as np
+import pennylane as qml
+import pytest
+
+from qflow.hamiltonian.tapering import taper_hamiltonian
+from qflow.hamiltonian.utils_hamiltonian import get_reference_spectrum
+from qflow.templates.examples import (
+    lih_vqe_basic_entangler_example,
+    lih_vqe_strong_entangler_example,
+)
+
+
+def _basis_state_energy(H, state, wires):
+    dev = qml.device("default.qubit", wires=wires)
+
+    @qml.qnode(dev)
+    def energy():
+        qml.BasisState(np.array(state), wires=wires)
+        return qml.expval(H)
+
+    return energy()
+
+
+@pytest.mark.parametrize(
+    "example", [lih_vqe_basic_entangler_example, lih_vqe_strong_entangler_example]
+)
+def test_tapered_lih(example):
+    circuit, H, min_energy = example(distance=2.0)
+    tapered_circuit, H_tapered, tapered_min_energy = example(distance=2.0, taper=True)
+
+    assert tapered_min_energy == min_energy
+    assert tapered_circuit.num_qubits == len(H_tapered.wires) < circuit.num_qubits
+    np.testing.assert_allclose(
+        get_reference_spectrum(H_tapered).min_energy,
+        get_reference_spectrum(H).min_energy,
+        atol=1e-8,
+    )
+    np.testing.assert_allclose(
+        _basis_state_energy(
+            H_tapered, tapered_circuit.initial_state, range(tapered_circuit.num_qubits)
+        ),
+        _basis_state_energy(H, circuit.initial_state, circuit.wires),
+        atol=1e-8,
+    )
+
+    dev = qml.device("default.qubit", wires=tapered_circuit.wires)
+
+    @qml.qnode(dev)
+    def cost_fn(params):
+        tapered_circuit(params)
+        return qml.expval(H_tapered)
+
+    assert np.isfinite(cost_fn(tapered_circuit.init(0)))
+
+
+def test_tapered_hartree_fock_energy():
+    H = qml.qchem.molecular_hamiltonian(
+        ["H", "H"], np.array([0.0, 0.0, 0.0, 0.0, 0.0, 1.4])
+    )[0]
+    hf_state = np.array([1, 1, 0, 0])
+    H_tapered, tapered_state = taper_hamiltonian(H, num_electrons=2)
+
+    assert len(tapered_state) == 1 and H_tapered.wires.tolist() == [0]
+    np.testing.assert_allclose(
+        _basis_state_energy(H_tapered, tapered_state, [0]),
+        _basis_state_energy(H, hf_state, range(4)),
+        atol=1e-8,
+    )
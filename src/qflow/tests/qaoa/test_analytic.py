@@ -0,0 +1,81 @@
+import networkx as nx
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
+import pytest
+
+from qflow.qaoa.analytic import (
+    get_edge_classes,
+    get_p1_maxcut_energy,
+    get_p1_maxcut_energy_from_edges,
+)
+from qflow.templates.examples.maxcut_circuit import maxcut_qaoa_example
+from qflow.utils.maxcut_utils import get_maxcut_edges, get_maxcut_graph
+
+
+@pytest.mark.parametrize("num_nodes, seed", [(4, 0), (6, 1), (7, 0)])
+def test_p1_maxcut_energy(num_nodes, seed):
+    circuit, H, _ = maxcut_qaoa_example(num_layers=1, num_nodes=num_nodes, seed=seed)
+    graph = get_maxcut_graph(num_nodes, seed=seed)
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def cost_fn(params):
+        circuit(params)
+        return qml.expval(H)
+
+    for gamma, beta in [(0.3, 0.7), (1.1, -0.4), (2.5, 1.3)]:
+        params = pnp.array([gamma, beta], requires_grad=True)
+        energy, grad_gamma, grad_beta = get_p1_maxcut_energy(
+            graph, gamma, beta, return_grad=True
+        )
+        np.testing.assert_allclose(energy, cost_fn(params), atol=1e-10)
+        np.testing.assert_allclose(
+            [grad_gamma, grad_beta], qml.grad(cost_fn)(params), atol=1e-10
+        )
+
+
+def test_p1_maxcut_energy_batch():
+    graph = nx.random_regular_graph(3, 100, seed=0)
+    graph.add_edges_from([(0, 100), (100, 101), (101, 0)])
+    edges, _, num_nodes = get_maxcut_edges(graph)
+    gamma, beta = np.meshgrid(np.linspace(-2, 2, 7), np.linspace(-1, 1, 5))
+
+    energies, grad_gamma, grad_beta = get_p1_maxcut_energy_from_edges(
+        edges, num_nodes, gamma, beta, return_grad=True
+    )
+    assert energies.shape == grad_gamma.shape == grad_beta.shape == (5, 7)
+    for i, j in [(0, 0), (2, 3), (4, 6)]:
+        np.testing.assert_allclose(
+            energies[i, j],
+            get_p1_maxcut_energy_from_edges(edges, num_nodes, gamma[i, j], beta[i, j]),
+        )
+
+    # finite differences
+    eps = 1e-6
+    for shift, grad in [((eps, 0), grad_gamma), ((0, eps), grad_beta)]:
+        plus = get_p1_maxcut_energy_from_edges(
+            edges, num_nodes, gamma + shift[0], beta + shift[1]
+        )
+        minus = get_p1_maxcut_energy_from_edges(
+            edges, num_nodes, gamma - shift[0], beta - shift[1]
+        )
+        np.testing.assert_allclose((plus - minus) / (2 * eps), grad, atol=1e-5)
+
+
+def test_edge_classes():
+    graph = nx.gnm_random_graph(30, 90, seed=2)
+    edges, _, num_nodes = get_maxcut_edges(graph)
+    a, b, triangles, counts = get_edge_classes(edges, num_nodes)
+
+    assert counts.sum() == len(edges)
+    assert np.all(a <= b)
+    # every triangle contains three edges, and nx counts it at three nodes
+    assert np.dot(triangles, counts) == sum(nx.triangles(graph).values())
+
+
+def test_weighted_graph():
+    graph = nx.Graph()
+    graph.add_edge(0, 1, weight=2.0)
+    with pytest.raises(ValueError):
+        get_p1_maxcut_energy(graph, 0.1, 0.2)
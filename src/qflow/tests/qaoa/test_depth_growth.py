@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from qflow.qaoa.depth_growth import (
+    FOURIER,
+    INTERP,
+    fourier_to_params,
+    grow_qaoa_depth,
+    interp_params,
+    params_to_fourier,
+)
+from qflow.optimizer import QNG2Optimizer
+from qflow.templates.examples.maxcut_circuit import maxcut_qaoa_example
+
+
+def test_interp_params():
+    np.testing.assert_allclose(
+        interp_params(np.array([1.0, 2.0, 0.5, 0.3])),
+        [1.0, 1.5, 2.0, 0.5, 0.4, 0.3],
+    )
+
+
+@pytest.mark.parametrize("num_layers", [1, 2, 5])
+def test_fourier_round_trip(num_layers):
+    params = np.random.default_rng(num_layers).uniform(size=2 * num_layers)
+    fourier_params = params_to_fourier(params)
+    np.testing.assert_allclose(fourier_to_params(fourier_params, num_layers), params)
+
+
+@pytest.mark.parametrize(
+    "strategy, fourier", [(INTERP, False), (FOURIER, False), (FOURIER, True)]
+)
+def test_grow_qaoa_depth(strategy, fourier):
+    _, H, min_energy = maxcut_qaoa_example(num_nodes=4)
+    results = grow_qaoa_depth(
+        H, max_layers=3, strategy=strategy, fourier=fourier, max_steps=20
+    )
+
+    assert [result.num_layers for result in results] == [1, 2, 3]
+    for result in results:
+        assert len(result.params) == 2 * result.num_layers
+        assert min_energy - 1e-8 <= result.energy
+        if fourier:
+            np.testing.assert_allclose(
+                fourier_to_params(result.fourier_params, result.num_layers),
+                result.params,
+            )
+    # the warm starts keep the deeper circuits at least as good
+    assert results[-1].energy <= results[0].energy + 1e-6
+
+
+def test_grow_qaoa_depth_target():
+    _, H, _ = maxcut_qaoa_example(num_nodes=4)
+    results = grow_qaoa_depth(H, max_layers=3, max_steps=5, target_energy=np.inf)
+    assert len(results) == 1
+
+
+def test_grow_qaoa_depth_qng():
+    # QNG2Optimizer caches the metric tensor of the first depth it steps on
+    _, H, min_energy = maxcut_qaoa_example(num_nodes=4)
+    optimizer = QNG2Optimizer(0.1)
+    results = grow_qaoa_depth(H, max_layers=3, optimizer=optimizer, max_steps=5)
+
+    assert [len(result.params) for result in results] == [2, 4, 6]
+    for result in results:
+        assert min_energy - 1e-8 <= result.energy
+    assert optimizer.F is None
@@ -0,0 +1,66 @@
+import networkx as nx
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
+import pytest
+
+from qflow.qaoa.analytic import get_p1_maxcut_energy
+from qflow.qaoa.light_cone import LightConeEvaluator, edge_light_cone
+from qflow.qaoa.mixer_h import x_mixer
+from qflow.templates.circuits import QAOACircuit
+from qflow.templates.state_preparation import Plus
+
+
+@pytest.mark.parametrize("num_layers", [1, 2])
+def test_light_cone_energy(num_layers):
+    graph = nx.random_regular_graph(3, 8, seed=1)
+    H, _ = qml.qaoa.maxcut(graph)
+    circuit = QAOACircuit(H, Plus(8), x_mixer(8), num_layers=num_layers)
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def cost_fn(params):
+        circuit(params)
+        return qml.expval(H)
+
+    params = np.random.default_rng(num_layers).uniform(-1, 1, 2 * num_layers)
+    evaluator = LightConeEvaluator(graph, num_layers)
+    assert sum(count for _, _, count in evaluator.classes) == graph.number_of_edges()
+    np.testing.assert_allclose(
+        evaluator.energy(params), cost_fn(pnp.array(params)), atol=1e-10
+    )
+
+
+def test_light_cone_classes():
+    # all edges of a long ring are equivalent
+    graph = nx.cycle_graph(200)
+    evaluator = LightConeEvaluator(graph, num_layers=3)
+    assert len(evaluator.classes) == 1
+    cone, _, count = evaluator.classes[0]
+    assert count == 200 and cone.number_of_nodes() == 8
+
+    # the depth-1 light cone agrees with the closed form on larger graphs
+    graph = nx.random_regular_graph(3, 300, seed=0)
+    evaluator = LightConeEvaluator(graph, num_layers=1)
+    np.testing.assert_allclose(
+        evaluator.energy([0.4, 0.7]), get_p1_maxcut_energy(graph, 0.4, 0.7)
+    )
+
+
+def test_edge_light_cone():
+    graph = nx.path_graph(10)
+    graph.add_edge(2, 7)
+    cone = edge_light_cone(graph, (4, 5), num_layers=2)
+    assert sorted(cone.nodes) == [2, 3, 4, 5, 6, 7]
+    # the edges between two boundary nodes are outside of the light cone
+    assert sorted(tuple(sorted(edge)) for edge in cone.edges) == [
+        (2, 3),
+        (3, 4),
+        (4, 5),
+        (5, 6),
+        (6, 7),
+    ]
+    assert [cone.nodes[n]["root"] for n in sorted(cone.nodes)] == [0, 0, 1, 1, 0, 0]
+
+    with pytest.raises(ValueError):
+        LightConeEvaluator(nx.complete_graph(6), num_layers=1, max_qubits=4)
@@ -0,0 +1,173 @@
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
+import pytest
+from scipy.linalg import expm
+
+from qflow.qaoa.mixer_h import (
+    FixedWeightEvolution,
+    circular_xy_mixer,
+    mixer_eigensystem,
+    row_mixer,
+    x_mixer,
+    xy_matchings,
+)
+from qflow.templates.circuits import QAOACircuit
+from qflow.templates.state_preparation import Plus
+
+
+def _mixer_state(mixer_h, mixer_method, beta):
+    # gamma = 0 leaves only the mixer evolution of the plus state
+    H = qml.Hamiltonian(
+        [1.0 for _ in mixer_h.wires], [qml.PauliZ(w) for w in mixer_h.wires]
+    )
+    num_qubits = len(H.wires)
+    circuit = QAOACircuit(
+        H=H,
+        initial_state=Plus(num_qubits),
+        mixer_h=mixer_h,
+        num_layers=1,
+        mixer_method=mixer_method,
+    )
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def state(params):
+        circuit(params)
+        return qml.state()
+
+    return state(pnp.array([0.0, beta]))
+
+
+@pytest.mark.parametrize(
+    "mixer_h, num_blocks",
+    [
+        (circular_xy_mixer(4), 5),
+        (circular_xy_mixer(5), 6),
+        (row_mixer(9), 10),
+        (x_mixer(3), 1),
+    ],
+)
+def test_exact_mixer(mixer_h, num_blocks):
+    beta = 0.7
+    wires = sorted(mixer_h.wires)
+    plus = np.ones(2 ** len(wires)) / np.sqrt(2 ** len(wires))
+    expected = expm(-1j * beta * qml.matrix(mixer_h, wire_order=wires)) @ plus
+    np.testing.assert_allclose(
+        _mixer_state(mixer_h, "exact", beta), expected, atol=1e-10
+    )
+
+    # the sparse form only holds the Hamming weight blocks
+    eigensystem = mixer_eigensystem(mixer_h, wires)
+    sparse = FixedWeightEvolution.compute_sparse_matrix(beta, eigensystem)
+    np.testing.assert_allclose(sparse @ plus, expected, atol=1e-10)
+    assert len(eigensystem) == num_blocks
+    assert sparse.nnz <= sum(len(block) ** 2 for block, _, _ in eigensystem)
+
+
+@pytest.mark.parametrize("num_qubits", [4, 5, 6])
+def test_matching_mixer(num_qubits):
+    beta = 0.3
+    mixer_h = circular_xy_mixer(num_qubits)
+    matchings = xy_matchings(mixer_h)
+    # the brickwork edges of circular_xy_mixer form two layers
+    assert len(matchings) == 2
+
+    # every matching is exponentiated exactly
+    wires = list(range(num_qubits))
+    state = np.ones(2**num_qubits) / np.sqrt(2**num_qubits)
+    for matching in matchings:
+        assert len({w for edge, _ in matching for w in edge}) == 2 * len(matching)
+        H = qml.Hamiltonian(
+            [c for _, c in matching for _ in range(2)],
+            [
+                op(edge[0]) @ op(edge[1])
+                for edge, _ in matching
+                for op in (qml.PauliX, qml.PauliY)
+            ],
+        )
+        state = expm(-1j * beta * qml.matrix(H, wire_order=wires)) @ state
+    np.testing.assert_allclose(
+        _mixer_state(mixer_h, "matching", beta), state, atol=1e-10
+    )
+
+
+def _reference_energy(H, mixer_unitary, params, num_qubits):
+    wires = list(range(num_qubits))
+    H_matrix = qml.matrix(H, wire_order=wires)
+    state = np.ones(2**num_qubits) / np.sqrt(2**num_qubits)
+    num_layers = len(params) // 2
+    for gamma, beta in zip(params[:num_layers], params[num_layers:]):
+        # the cost terms commute, a single Trotter step is exact
+        state = mixer_unitary(beta) @ (expm(-1j * gamma * H_matrix) @ state)
+    return np.real(state.conj() @ H_matrix @ state)
+
+
+@pytest.mark.parametrize("mixer_method", ["exact", "matching"])
+def test_mixer_method_gradient(mixer_method):
+    num_qubits = 4
+    wires = list(range(num_qubits))
+    mixer_h = circular_xy_mixer(num_qubits)
+    H = qml.Hamiltonian([1.0, 0.5], [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliZ(2)])
+    H = H + qml.Hamiltonian([0.0], [qml.PauliZ(3)])
+    circuit = QAOACircuit(
+        H, Plus(num_qubits), mixer_h, num_layers=2, mixer_method=mixer_method
+    )
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def cost_fn(params):
+        circuit(params)
+        return qml.expval(H)
+
+    if mixer_method == "exact":
+        M = qml.matrix(mixer_h, wire_order=wires)
+        mixer_unitary = lambda beta: expm(-1j * beta * M)
+    else:
+        # the product of the exactly exponentiated matchings at the same depth
+        matchings = [
+            qml.matrix(
+                qml.Hamiltonian(
+                    [c for _, c in matching for _ in range(2)],
+                    [
+                        op(edge[0]) @ op(edge[1])
+                        for edge, _ in matching
+                        for op in (qml.PauliX, qml.PauliY)
+                    ],
+                ),
+                wire_order=wires,
+            )
+            for matching in xy_matchings(mixer_h)
+        ]
+        mixer_unitary = lambda beta: np.linalg.multi_dot(
+            [expm(-1j * beta * M) for M in matchings[::-1]]
+        )
+
+    params = pnp.array([0.1, 0.2, 0.3, 0.4], requires_grad=True)
+    reference = np.array(params)
+    np.testing.assert_allclose(
+        cost_fn(params),
+        _reference_energy(H, mixer_unitary, reference, num_qubits),
+        atol=1e-10,
+    )
+
+    # central finite differences of the expm reference
+    step = 1e-6
+    expected = [
+        (
+            _reference_energy(H, mixer_unitary, reference + step * e, num_qubits)
+            - _reference_energy(H, mixer_unitary, reference - step * e, num_qubits)
+        )
+        / (2 * step)
+        for e in np.eye(len(reference))
+    ]
+    np.testing.assert_allclose(qml.grad(cost_fn)(params), expected, atol=1e-7)
+
+
+def test_unknown_mixer_method():
+    with pytest.raises(ValueError):
+        QAOACircuit(
+            circular_xy_mixer(4), Plus(4), circular_xy_mixer(4), mixer_method="foo"
+        )
+    with pytest.raises(ValueError):
+        xy_matchings(x_mixer(3))
@@ -7,6 +7,7 @@ from jaxopt import OptaxSolver
 
 from qflow.hamiltonian.utils_hamiltonian import get_eigenvalues_hamiltonian
 from qflow.templates.circuits import BarrenPlateauCircuit
+from qflow.templates.circuits.barren_plateau_circuit import GATES, sample_gate_codes
 from qflow.utils.utils import get_approximation_ratio
 
 
@@ -48,5 +49,32 @@ def test_barren_plateau_circuit(num_layers, num_qubits):
     assert r > 0.9, "Approximation ratio is too low. Optimization failed."
 
 
+def test_gate_codes():
+    codes = sample_gate_codes(4, 3, num_circuits=1000, seed=0)
+    assert codes.shape == (1000, 4, 3) and codes.dtype == np.int8
+    np.testing.assert_allclose(
+        np.bincount(codes.ravel()) / codes.size, 1 / 3, atol=0.01
+    )
+    np.testing.assert_array_equal(codes, sample_gate_codes(4, 3, 1000, seed=0))
+
+    circuit = BarrenPlateauCircuit(4, 3)
+    params = circuit.init(seed=1)
+    # the seeded global stream, drawn gate by gate and then the parameters
+    np.random.seed(1)
+    gates = [[np.random.choice(GATES) for _ in range(3)] for _ in range(4)]
+    np.testing.assert_array_equal(
+        circuit.gate_codes, [[GATES.index(gate) for gate in layer] for layer in gates]
+    )
+    np.testing.assert_array_equal(params, np.random.uniform(-np.pi, np.pi, 12))
+
+    tape = qml.tape.make_qscript(circuit._circuit_ansatz)(params)
+    rotations = [op for op in tape.operations if op.name in ("RX", "RY", "RZ")][3:]
+    for op, (layer, wire) in zip(rotations, np.ndindex(4, 3)):
+        assert op.name == GATES[circuit.gate_codes[layer, wire]].__name__
+        assert (
+            circuit.list_gate_set[layer][wire] is GATES[circuit.gate_codes[layer, wire]]
+        )
+
+
 if __name__ == "__main__":
     test_barren_plateau_circuit(5, 7)
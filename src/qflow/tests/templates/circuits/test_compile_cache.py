@@ -0,0 +1,135 @@
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as pnp
+import pytest
+
+from qflow.templates.abstract_circuit import compile_circuit
+from qflow.templates.circuits import (
+    AbstractCircuit,
+    BarrenPlateauCircuit,
+    MolecularBasicEntangler,
+    MolecularStrongEntangler,
+)
+from qflow.templates.examples import maxcut_qaoa_example
+
+
+class SquaredCircuit(AbstractCircuit):
+    """A circuit whose gate parameters are not affine in its parameters."""
+
+    wires = range(2)
+
+    def _circuit_ansatz(self, params):
+        qml.RX(params[0] ** 2, wires=0)
+        qml.RY(params[1], wires=1)
+
+
+class WeightedCircuit(AbstractCircuit):
+    """A circuit whose gates are scaled by a weight array."""
+
+    wires = range(2)
+
+    def __init__(self):
+        self.weights = np.array([1.0, 2.0])
+
+    def _circuit_ansatz(self, params):
+        qml.RX(self.weights[0] * params[0], wires=0)
+        qml.RY(self.weights[1] * params[1], wires=1)
+
+
+def _cost_and_grad(circuit, H, params, compile_cache):
+    circuit.compile_cache = compile_cache
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def cost_fn(params):
+        circuit(params)
+        return qml.expval(H)
+
+    return cost_fn(params), qml.grad(cost_fn)(params)
+
+
+def _molecular_hamiltonian():
+    return qml.Hamiltonian(
+        [1.0, 0.5, -0.3],
+        [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliX(2), qml.PauliY(1) @ qml.PauliY(3)],
+    )
+
+
+@pytest.mark.parametrize(
+    "make_circuit",
+    [
+        lambda: maxcut_qaoa_example(num_layers=2, num_nodes=5, seed=0)[:2],
+        lambda: (lambda c: (c, c.H))(BarrenPlateauCircuit(3, 4)),
+        lambda: (
+            MolecularStrongEntangler(2, list(range(4)), pnp.array([1, 1, 0, 0])),
+            _molecular_hamiltonian(),
+        ),
+        lambda: (
+            MolecularBasicEntangler(2, list(range(4)), pnp.array([1, 1, 0, 0])),
+            _molecular_hamiltonian(),
+        ),
+    ],
+)
+def test_compiled_circuit(make_circuit):
+    circuit, H = make_circuit()
+    params = circuit.init(0)
+
+    cost, grad = _cost_and_grad(circuit, H, params, compile_cache=True)
+    assert circuit._compiled[1] is not None
+    expected_cost, expected_grad = _cost_and_grad(circuit, H, params, False)
+
+    np.testing.assert_allclose(cost, expected_cost, atol=1e-10)
+    np.testing.assert_allclose(grad, expected_grad, atol=1e-10)
+
+
+def test_compile_fallback():
+    circuit = SquaredCircuit()
+    assert compile_circuit(circuit, (2,)) is None
+
+    params = pnp.array([0.3, -1.2], requires_grad=True)
+    H = qml.PauliZ(0) @ qml.PauliZ(1)
+    cost, grad = _cost_and_grad(circuit, H, params, compile_cache=True)
+    np.testing.assert_allclose(cost, np.cos(0.3**2) * np.cos(-1.2))
+
+
+def test_compile_invalidation():
+    circuit = BarrenPlateauCircuit(2, 3)
+    params = circuit.init(0)
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def state_fn(params):
+        circuit(params)
+        return qml.state()
+
+    state_fn(params)
+    assert "_compiled" in circuit.__dict__
+
+    # new random gates must not reuse the program of the old ones
+    circuit.init(1)
+    assert "_compiled" not in circuit.__dict__
+    state = state_fn(params)
+    circuit.compile_cache = False
+    np.testing.assert_allclose(state, state_fn(params), atol=1e-12)
+
+
+def test_compile_in_place_mutation():
+    circuit = WeightedCircuit()
+    params = pnp.array([0.3, -1.2], requires_grad=True)
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def state_fn(params):
+        circuit(params)
+        return qml.state()
+
+    stale = state_fn(params)
+    # in-place changes are not detected, the stale program is replayed
+    circuit.weights[0] = 3.0
+    np.testing.assert_allclose(state_fn(params), stale, atol=1e-12)
+
+    circuit.clear_compile_cache()
+    state = state_fn(params)
+    assert not np.allclose(state, stale)
+    circuit.compile_cache = False
+    np.testing.assert_allclose(state, state_fn(params), atol=1e-12)
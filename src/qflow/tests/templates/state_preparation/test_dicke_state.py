@@ -0,0 +1,57 @@
+import time
+
+import numpy as np
+import pennylane as qml
+import pytest
+
+from qflow.templates.state_preparation import DickeState
+from qflow.utils.utils import get_all_bitstrings, get_hamming_weight_indices
+
+
+@pytest.mark.parametrize("n_bits", [1, 5, 8])
+def test_hamming_weight_indices(n_bits):
+    weights = get_all_bitstrings(n_bits).sum(axis=1)
+    for hamming_weight in range(n_bits + 1):
+        expected = np.where(weights == hamming_weight)[0]
+        np.testing.assert_array_equal(
+            get_hamming_weight_indices(n_bits, hamming_weight), expected
+        )
+
+
+@pytest.mark.parametrize(
+    "num_qubits, hamming_weight", [(3, 1), (4, 2), (5, 3), (6, 3), (4, 4), (4, 0)]
+)
+def test_dicke_state_gates(num_qubits, hamming_weight):
+    dev = qml.device("default.qubit", wires=num_qubits)
+
+    def get_state(method):
+        initial_state = DickeState(num_qubits, hamming_weight, method=method)
+
+        @qml.qnode(dev)
+        def state():
+            initial_state()
+            return qml.state()
+
+        return state()
+
+    np.testing.assert_allclose(get_state("gates"), get_state("statevector"), atol=1e-8)
+
+
+def test_hamming_weight_indices_time():
+    start = time.perf_counter()
+    index = get_hamming_weight_indices(24, 12)
+    assert time.perf_counter() - start < 1.0
+    assert len(index) == 2704156
+
+
+@pytest.mark.parametrize("num_qubits, hamming_weight", [(24, 12), (24, 1), (10, 7)])
+def test_dicke_state_gate_count(num_qubits, hamming_weight):
+    n, k = num_qubits, hamming_weight
+    initial_state = DickeState(n, k, method="gates")
+    tape = qml.tape.make_qscript(initial_state)()
+
+    # k X gates, n - k SCS_{m,k} of 3k gates and SCS_{m,m-1} of 3(m - 1) for m <= k
+    assert len(tape.operations) == k + 3 * k * (n - k) + 3 * k * (k - 1) // 2
+    assert len(tape.operations) <= 3 * n * k
+    # the gates never enumerate the 2^n basis states
+    assert initial_state._index is None and initial_state.state is None
@@ -0,0 +1,77 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+RUN_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "benchmarks", "run.py"
+)
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists(RUN_PATH), reason="the benchmarks are not in the source tree"
+)
+
+
+@pytest.fixture(scope="module")
+def run():
+    spec = importlib.util.spec_from_file_location("benchmarks_run", RUN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _results(unit, values):
+    return {
+        "results": {
+            "bench.Bench.method": {
+                "unit": unit,
+                "param_names": ["n"],
+                "values": {json.dumps([n]): value for n, value in values.items()},
+            }
+        }
+    }
+
+
+def _status(rows):
+    return {row["params"]: row["status"] for row in rows}
+
+
+def test_compare_ratio(run):
+    baseline = _results("bytes", {8: 100.0, 10: 100.0, 12: 100.0})
+    current = _results("bytes", {8: 100.0, 10: 250.0, 12: 40.0, 14: 100.0})
+    rows = run.compare(baseline, current, factor=2.0)
+
+    status = _status(rows)
+    assert status["[8]"] == "ok"
+    assert status["[10]"] == "regression"
+    assert status["[12]"] == "improvement"
+    assert status["[14]"] == "new"
+    assert [row["ratio"] for row in rows[:3]] == [1.0, 2.5, 0.4]
+    assert "regression" in run.report(rows)
+
+
+def test_compare_scaling(run):
+    # 2^n in the baseline, 4^n now: every size step grows twice as fast
+    baseline = _results("seconds", {n: 2.0**n * 1e-3 for n in (4, 6, 8)})
+    current = _results("seconds", {n: 4.0**n * 1e-4 for n in (4, 6, 8)})
+    rows = run.compare(baseline, current, factor=1e3, scaling_factor=2.0)
+
+    scaling = [row for row in rows if row["status"] == "scaling"]
+    assert [row["params"] for row in scaling] == ["[4] -> [6]", "[6] -> [8]"]
+    assert all(row["ratio"] == pytest.approx(4.0) for row in scaling)
+    # only consecutive sizes are compared
+    assert "[4] -> [8]" not in _status(rows)
+
+    # the same growth as the baseline is no scaling regression
+    rows = run.compare(baseline, baseline, scaling_factor=2.0)
+    assert {row["status"] for row in rows} == {"ok"}
+
+
+def test_compare_noise_floor(run):
+    # timings below MIN_SECONDS are never flagged
+    baseline = _results("seconds", {4: run.MIN_SECONDS / 10, 6: 1.0})
+    current = _results("seconds", {4: run.MIN_SECONDS / 2, 6: 1.0})
+    rows = run.compare(baseline, current)
+    assert _status(rows) == {"[4]": "ok", "[6]": "ok"}
+    assert rows[0]["ratio"] is None
@@ -0,0 +1,61 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["pyscf", "openfermion", "openfermionpyscf", "algorithmx"]
+
+# the cold start of an entry point on top of its unavoidable dependencies
+IMPORT_SCRIPT = """
+import json, sys, time
+import networkx, numpy, scipy.sparse
+{preload}
+start = time.perf_counter()
+from {module} import {name}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [m for m in {heavy} if m in sys.modules]]))
+"""
+
+
+def _import_entry_point(module, name, preload=""):
+    script = IMPORT_SCRIPT.format(
+        module=module, name=name, preload=preload, heavy=HEAVY_MODULES
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "module, name, preload",
+    [
+        ("qflow.utils", "pairwise", ""),
+        ("qflow.utils.maxcut_utils", "get_maxcut_costs", ""),
+        ("qflow.qaoa.light_cone", "LightConeEvaluator", ""),
+        ("qflow.qaoa.analytic", "get_p1_maxcut_energy", ""),
+        ("qflow.templates.circuits", "QAOACircuit", "import pennylane"),
+        ("qflow.templates.examples", "maxcut_qaoa_example", "import pennylane"),
+        ("qflow.hamiltonian", "get_maxcut_hamiltonian", "import pennylane"),
+        ("qflow.barren_plateau", "gradient_variance_study", "import pennylane"),
+    ],
+)
+def test_cold_start(module, name, preload):
+    elapsed, heavy = _import_entry_point(module, name, preload)
+    assert heavy == []
+    # importing the molecular stack alone takes more than a second
+    assert elapsed < 0.5, f"import of {module}.{name} took {elapsed:.2f}s"
+
+
+def test_lazy_exports():
+    import qflow.hamiltonian
+    import qflow.templates.circuits
+
+    assert "QAOACircuit" in dir(qflow.templates.circuits)
+    assert "get_lih_hamiltonian" in qflow.hamiltonian.__all__
+    with pytest.raises(AttributeError):
+        qflow.templates.circuits.NoCircuit
+
+    _, heavy = _import_entry_point("qflow.hamiltonian", "get_lih_hamiltonian")
+    assert "pyscf" in heavy
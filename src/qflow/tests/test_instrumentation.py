@@ -0,0 +1,78 @@
+import json
+
+import pennylane as qml
+import pytest
+
+from qflow.instrumentation import Profiler, active_profiler, count, phase
+from qflow.optimizer import QNG2Optimizer
+from qflow.templates.examples import maxcut_qaoa_example
+
+
+def test_nested_phases():
+    assert active_profiler() is None
+    with phase("outside"):
+        count("outside")
+
+    with Profiler() as profiler:
+        assert active_profiler() is profiler
+        for _ in range(3):
+            with phase("outer"):
+                count("calls", 2)
+                with phase("inner"):
+                    pass
+    assert active_profiler() is None
+
+    summary = profiler.summary()
+    assert summary["counters"] == {"calls": 6}
+    outer, inner = summary["phases"]["outer"], summary["phases"]["inner"]
+    assert outer["calls"] == inner["calls"] == 3
+    assert outer["self"] + inner["total"] == pytest.approx(outer["total"])
+    assert inner["self"] == inner["total"]
+    assert outer["total"] <= summary["wall_time"]
+
+
+def test_qng2_profile(tmp_path):
+    circuit, H, _ = maxcut_qaoa_example(num_layers=1, num_nodes=4)
+    dev = qml.device("default.qubit", wires=circuit.wires)
+
+    @qml.qnode(dev)
+    def cost_fn(params):
+        circuit(params)
+        return qml.expval(H)
+
+    params = circuit.init(0)
+    optimizer = QNG2Optimizer(stepsize=0.01)
+    with Profiler(dev, trace=True) as profiler:
+        for _ in range(3):
+            params, _ = optimizer.step_and_cost(cost_fn, params)
+
+    summary = profiler.summary()
+    counters, phases = summary["counters"], summary["phases"]
+    assert counters["steps"] == 3
+    assert counters["metric_tensor_evaluations"] == 1
+    assert counters["compilations"] == 1 and "compile_fallbacks" not in counters
+    assert counters["circuit_calls"] >= 6
+    assert set(phases) == {
+        "step",
+        "cost",
+        "gradient",
+        "metric_tensor",
+        "linear_solve",
+        "circuit",
+        "compile",
+    }
+    assert phases["cost"]["executions"] == 3
+    assert counters["executions"] == dev.num_executions
+    assert phases["step"]["total"] >= phases["gradient"]["total"]
+
+    path = profiler.export_chrome_trace(str(tmp_path / "trace.json"))
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    assert len(spans) == sum(p["calls"] for p in phases.values())
+    assert [e["args"]["executions"] for e in events if e["ph"] == "C"][-1] == (
+        dev.num_executions
+    )
+
+    with pytest.raises(ValueError):
+        Profiler().export_chrome_trace(str(tmp_path / "none.json"))
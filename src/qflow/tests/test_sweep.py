@@ -0,0 +1,153 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from qflow.__main__ import main
+from qflow.sweep import (
+    TRAJECTORY_DIR,
+    estimate_job_cost,
+    expand_grid,
+    job_id,
+    load_sweep_config,
+    run_sweep,
+)
+from qflow.utils.trajectory_store import TrajectoryStore
+
+
+def write_config(tmp_path, config, suffix=".json"):
+    path = tmp_path / f"sweep{suffix}"
+    if suffix == ".json":
+        path.write_text(json.dumps(config))
+    else:
+        lines = [f"{key} = {json.dumps(value)}" for key, value in config.items()]
+        path.write_text("\n".join(lines))
+    return str(path)
+
+
+def test_expand_grid():
+    config = {
+        "grid": {"num_nodes": [4, 5], "num_layers": [1, 2], "seed": [0, 1, 2]},
+        "max_steps": 3,
+    }
+    jobs = expand_grid(config)
+    assert len(jobs) == 12
+    assert len({job_id(job) for job in jobs}) == 12
+    assert all(job["max_steps"] == 3 and job["optimizer"] for job in jobs)
+    # the ids do not depend on the key order
+    assert job_id(dict(reversed(list(jobs[0].items())))) == job_id(jobs[0])
+
+
+@pytest.mark.parametrize("suffix", [".json", ".toml"])
+def test_load_sweep_config(tmp_path, suffix):
+    path = write_config(tmp_path, {"output_dir": "out", "max_steps": 2}, suffix)
+    config = load_sweep_config(path)
+    assert config["output_dir"] == os.path.join(str(tmp_path), "out")
+    assert config["max_steps"] == 2
+
+    with pytest.raises(ValueError):
+        load_sweep_config(str(tmp_path / "sweep.yaml"))
+
+
+def test_longest_first(capsys, tmp_path):
+    config = {
+        "grid": {
+            "num_nodes": [4, 6],
+            "num_layers": [1, 3],
+            "optimizer": ["AdamOptimizer", "QNG2Optimizer"],
+        }
+    }
+    assert main(["sweep", write_config(tmp_path, config), "--dry-run"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 8
+    costs = [estimate_job_cost(job) for job in expand_grid(config)]
+    assert lines[0].startswith(job_id(expand_grid(config)[costs.index(max(costs))]))
+
+
+def test_run_sweep(tmp_path):
+    config = {
+        "output_dir": str(tmp_path),
+        "max_steps": 2,
+        "grid": {"num_nodes": [3, 4], "seed": [0, 1]},
+    }
+    summary = run_sweep(config, max_workers=2, poll_interval=0.05)
+    assert len(summary.completed) == 4 and not summary.skipped and not summary.failed
+
+    store = TrajectoryStore(str(tmp_path / TRAJECTORY_DIR))
+    assert len(store) == 4
+    for job in expand_grid(config):
+        with open(tmp_path / f"{job_id(job)}.json") as f:
+            result = json.load(f)
+        assert result["job"] == job and result["num_steps"] == 3
+        assert result["best_energy"] >= result["min_energy"] - 1e-8
+
+        (run_id,) = store.query(job_id=job_id(job))
+        assert run_id == result["run_id"]
+        trajectory = store.trajectory(run_id)
+        np.testing.assert_array_equal(trajectory["step"], [0, 1, 2])
+        assert trajectory["energy"][-1] == result["final_energy"]
+        assert np.all(trajectory["grad_norm"][:2] > 0)
+        assert np.all(np.diff(trajectory["executions"]) > 0)
+        profile = result["profile"]
+        assert profile["counters"]["executions"] == trajectory["executions"][-1]
+        assert profile["phases"]["circuit"]["calls"] > 0
+
+    # a restarted sweep only runs the missing jobs
+    os.remove(tmp_path / f"{summary.completed[0]}.json")
+    summary = run_sweep(config, max_workers=2, poll_interval=0.05)
+    assert len(summary.completed) == 1 and len(summary.skipped) == 3
+
+
+def test_run_sweep_timeout(tmp_path):
+    config = {
+        "output_dir": str(tmp_path),
+        "max_steps": 10**6,
+        "timeout": 0.5,
+        "retries": 1,
+    }
+    summary = run_sweep(config, max_workers=1, poll_interval=0.05)
+    assert not summary.completed
+    assert list(summary.failed.values()) == ["timeout after 0.5s"]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".json")]
+
+
+def test_run_sweep_approx_ratio(tmp_path):
+    # Z0 Z1 has the spectrum [-1, 1], the ratio must not assume E_max = 0
+    config = {
+        "output_dir": str(tmp_path),
+        "max_steps": 3,
+        "grid": {"example": ["barren_plateau_example"], "num_layers": [2]},
+    }
+    summary = run_sweep(config, max_workers=1, poll_interval=0.05)
+    assert len(summary.completed) == 1
+
+    store = TrajectoryStore(str(tmp_path / TRAJECTORY_DIR))
+    (run_id,) = store.query()
+    trajectory = store.trajectory(run_id)
+    ratio = trajectory["approx_ratio"]
+    assert np.all((0 <= ratio) & (ratio <= 1))
+    np.testing.assert_allclose(ratio, (1 - trajectory["energy"]) / 2)
+
+
+def test_run_sweep_optimizer_steps(tmp_path):
+    config = {
+        "output_dir": str(tmp_path),
+        "max_steps": 3,
+        "grid": {"num_nodes": [4], "optimizer": ["AdamOptimizer", "QNG2Optimizer"]},
+    }
+    summary = run_sweep(config, max_workers=2, poll_interval=0.05)
+    assert len(summary.completed) == 2
+
+    store = TrajectoryStore(str(tmp_path / TRAJECTORY_DIR))
+    trajectories = {
+        optimizer: store.trajectory(store.query(optimizer=optimizer)[0])
+        for optimizer in config["grid"]["optimizer"]
+    }
+    adam, qng = trajectories["AdamOptimizer"], trajectories["QNG2Optimizer"]
+    # row i holds E(params_i): both start from the same initial parameters
+    assert adam["energy"][0] == qng["energy"][0]
+    for trajectory in trajectories.values():
+        np.testing.assert_array_equal(trajectory["step"], [0, 1, 2, 3])
+        assert np.all(np.diff(trajectory["energy"]) != 0)
+        assert np.isnan(trajectory["grad_norm"][-1])
@@ -0,0 +1,60 @@
+import itertools
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from qflow.utils.utils import (
+    BitstringView,
+    SpinstringView,
+    get_all_bitstrings,
+    get_all_bitstrings_as_string,
+    get_all_spinstrings,
+)
+
+
+@pytest.mark.parametrize("n_bits", [1, 4, 7])
+def test_all_bitstrings(n_bits):
+    expected = np.array(list(itertools.product([0, 1], repeat=n_bits)), dtype=np.int8)
+    np.testing.assert_array_equal(get_all_bitstrings(n_bits), expected)
+    np.testing.assert_array_equal(get_all_spinstrings(n_bits), 1 - 2 * expected)
+    assert get_all_bitstrings_as_string(n_bits)[-1] == " ".join("1" * n_bits)
+
+
+def test_bitstring_view():
+    view = BitstringView(5)
+    bitstrings = get_all_bitstrings(5)
+
+    np.testing.assert_array_equal(view[13], bitstrings[13])
+    np.testing.assert_array_equal(view[-2], bitstrings[-2])
+    np.testing.assert_array_equal(view[3:20:4], bitstrings[3:20:4])
+    np.testing.assert_array_equal(view[[1, 30]], bitstrings[[1, 30]])
+    np.testing.assert_array_equal(view.hamming_weight(), bitstrings.sum(axis=1))
+    np.testing.assert_array_equal(
+        view.parity(mask=0b00011), bitstrings[:, 3] ^ bitstrings[:, 4]
+    )
+    np.testing.assert_array_equal(
+        np.concatenate([rows for _, rows in view.chunks(6)]), bitstrings
+    )
+    np.testing.assert_array_equal(SpinstringView(5)[7], 1 - 2 * bitstrings[7])
+    assert get_all_bitstrings_as_string(5, 6) == ["0 0 1 1 0"]
+
+    with pytest.raises(IndexError):
+        view[32]
+
+
+def test_bitstring_view_large():
+    view = SpinstringView(40)
+    assert len(view) == 2**40
+    np.testing.assert_array_equal(view[2**40 - 1], -np.ones(40))
+
+
+def test_all_bitstrings_memory():
+    tracemalloc.start()
+    try:
+        bitstrings = get_all_bitstrings(18)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # the int8 output plus chunk sized intermediates
+    assert peak < 1.2 * bitstrings.nbytes
@@ -0,0 +1,58 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from qflow.utils.cost_store import get_stored_maxcut_costs, maxcut_graph_hash
+from qflow.utils.maxcut_utils import (
+    get_maxcut_costs,
+    get_maxcut_edges,
+    get_maxcut_graph,
+)
+
+
+def integer_weighted_graph(n, seed):
+    graph = get_maxcut_graph(n, seed=seed)
+    rng = np.random.default_rng(seed)
+    for u, v in graph.edges():
+        graph.edges[u, v]["weight"] = int(rng.integers(1, 300))
+    return graph
+
+
+def float_weighted_graph(n, seed):
+    graph = get_maxcut_graph(n, seed=seed)
+    for u, v in graph.edges():
+        graph.edges[u, v]["weight"] = 0.25
+    return graph
+
+
+@pytest.mark.parametrize(
+    "graph, dtypes",
+    [
+        (get_maxcut_graph(9, seed=0), (np.int8,)),
+        (integer_weighted_graph(8, 1), (np.int16, np.float64)),
+        (float_weighted_graph(7, 2), (np.float64,)),
+    ],
+)
+def test_stored_maxcut_costs(tmp_path, graph, dtypes):
+    costs = get_stored_maxcut_costs(graph, store_dir=str(tmp_path))
+    assert isinstance(costs, np.memmap) and not costs.flags.writeable
+    assert costs.dtype in dtypes
+    np.testing.assert_allclose(costs, get_maxcut_costs(graph))
+
+    # a hit maps the stored table instead of recomputing it
+    (path,) = tmp_path.iterdir()
+    mtime = path.stat().st_mtime_ns
+    np.testing.assert_array_equal(
+        get_stored_maxcut_costs(graph, store_dir=str(tmp_path)), costs
+    )
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_maxcut_graph_hash():
+    edges, weights, num_nodes = get_maxcut_edges(get_maxcut_graph(6, seed=0))
+    key = maxcut_graph_hash(edges, weights, num_nodes)
+    assert maxcut_graph_hash(edges[::-1, ::-1], weights[::-1], num_nodes) == key
+    assert maxcut_graph_hash(edges, 2 * weights, num_nodes) != key
+    assert maxcut_graph_hash(edges, weights, num_nodes + 1) != key
+    # relabelled nodes change the bit order
+    assert maxcut_graph_hash((edges + 1) % num_nodes, weights, num_nodes) != key
@@ -0,0 +1,53 @@
+import itertools
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from qflow.utils.maxcut_utils import (
+    get_maxcut_costs,
+    get_maxcut_graph,
+    iter_maxcut_costs,
+)
+
+
+def reference_maxcut_costs(graph):
+    # dense reference: C = 1/2 * (diag(s triu(A) s^T) - M)
+    A = nx.adjacency_matrix(graph).todense()
+    s = np.array(list(itertools.product([1, -1], repeat=graph.number_of_nodes())))
+    return 1 / 2 * (np.diag(s @ np.triu(A) @ s.T) - graph.number_of_edges())
+
+
+def weighted_graph(n, seed):
+    graph = get_maxcut_graph(n, seed=seed)
+    rng = np.random.default_rng(seed)
+    for u, v in graph.edges():
+        graph.edges[u, v]["weight"] = rng.uniform(0.5, 2.0)
+    return graph
+
+
+@pytest.mark.parametrize("method", ["edges", "gray"])
+@pytest.mark.parametrize("chunk_size, num_threads", [(2**16, None), (8, 3)])
+@pytest.mark.parametrize("graph", [get_maxcut_graph(7, seed=0), weighted_graph(8, 1)])
+def test_maxcut_costs(graph, method, chunk_size, num_threads):
+    costs = get_maxcut_costs(
+        graph, chunk_size=chunk_size, method=method, num_threads=num_threads
+    )
+    np.testing.assert_allclose(costs, reference_maxcut_costs(graph))
+
+
+@pytest.mark.parametrize("method", ["edges", "gray"])
+def test_iter_maxcut_costs(method):
+    graph = get_maxcut_graph(6, seed=2)
+    costs = np.full(2**6, np.nan)
+    for start, chunk in iter_maxcut_costs(graph, chunk_size=16, method=method):
+        costs[start : start + len(chunk)] = chunk
+    np.testing.assert_allclose(costs, reference_maxcut_costs(graph))
+
+
+def test_maxcut_costs_docstring_example():
+    graph = nx.Graph([(0, 1), (1, 2), (2, 3)])
+    np.testing.assert_allclose(
+        get_maxcut_costs(graph),
+        [0, -1, -2, -1, -2, -3, -2, -1, -1, -2, -3, -2, -1, -2, -1, 0],
+    )
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from qflow.utils.maxcut_dataset import (
+    generate_maxcut_dataset,
+    load_maxcut_dataset,
+    save_maxcut_dataset,
+)
+from qflow.utils.maxcut_utils import get_maxcut_costs
+
+
+@pytest.mark.parametrize(
+    "family, weighted", [("gnm", False), ("regular", False), ("gnm", True)]
+)
+def test_generate_maxcut_dataset(family, weighted):
+    dataset = generate_maxcut_dataset(6, 8, family=family, weighted=weighted, seed=1)
+
+    assert len(dataset) == 6
+    assert dataset.edge_offsets[-1] == len(dataset.edges) == len(dataset.weights)
+    for i in range(len(dataset)):
+        edges, weights, num_nodes = dataset.instance(i)
+        assert num_nodes == 8 and np.all(edges[:, 0] != edges[:, 1])
+        # no duplicate edges
+        assert len({tuple(sorted(edge)) for edge in edges.tolist()}) == len(edges)
+        if family == "regular":
+            assert np.all(np.bincount(edges.ravel(), minlength=8) == 3)
+        if not weighted:
+            assert np.all(weights == 1)
+
+        graph = dataset.graph(i)
+        costs = get_maxcut_costs(graph)
+        assert dataset.best_state[i] == np.argmin(costs)
+        bits = (dataset.best_state[i] >> (num_nodes - 1 - np.arange(num_nodes))) & 1
+        cut = np.sum(weights[bits[edges[:, 0]] != bits[edges[:, 1]]])
+        np.testing.assert_allclose(dataset.max_cut[i], cut)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_maxcut_dataset(tmp_path, mmap):
+    dataset = generate_maxcut_dataset(4, 6, weighted=True, solve=False)
+    assert np.all(np.isnan(dataset.max_cut)) and np.all(dataset.best_state == -1)
+
+    path = save_maxcut_dataset(str(tmp_path / "dataset.npz"), dataset)
+    loaded = load_maxcut_dataset(path, mmap=mmap)
+    assert isinstance(loaded.edges, np.memmap) == mmap
+    for name in dataset.__dataclass_fields__:
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(dataset, name))
+        assert getattr(loaded, name).dtype == getattr(dataset, name).dtype
+    assert list(tmp_path.iterdir()) == [tmp_path / "dataset.npz"]
@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+import pytest
+
+from qflow.utils.trajectory_store import TrajectoryStore, TrajectoryWriter
+
+
+def write_runs(store_dir, num_runs, num_steps, shard_size):
+    with TrajectoryWriter(store_dir, shard_size=shard_size) as writer:
+        run_ids = [
+            writer.start_run({"seed": seed, "optimizer": ["Adam", "QNG"][seed % 2]})
+            for seed in range(num_runs)
+        ]
+        # interleaved runs as in a sweep worker that alternates between runs
+        for step in range(num_steps):
+            for seed, run_id in enumerate(run_ids):
+                writer.append(run_id, step=step, energy=-step - seed, executions=step)
+        for run_id in run_ids:
+            writer.finish_run(run_id)
+    return run_ids
+
+
+@pytest.mark.parametrize("shard_size", [7, 1000])
+def test_trajectory_store(tmp_path, shard_size):
+    run_ids = write_runs(str(tmp_path), num_runs=4, num_steps=10, shard_size=shard_size)
+    store = TrajectoryStore(str(tmp_path))
+    assert list(store.runs) == run_ids
+
+    for seed, run_id in enumerate(run_ids):
+        trajectory = store.trajectory(run_id)
+        np.testing.assert_array_equal(trajectory["step"], np.arange(10))
+        np.testing.assert_array_equal(trajectory["energy"], -np.arange(10) - seed)
+        assert np.all(np.isnan(trajectory["grad_norm"]))
+        assert store.runs[run_id]["summary"] == {
+            "num_steps": 10,
+            "final_energy": -9.0 - seed,
+            "best_energy": -9.0 - seed,
+            "executions": 9,
+        }
+
+    if shard_size > 40:
+        (shard,) = os.listdir(tmp_path / "shards")
+        assert isinstance(store.trajectory(run_ids[0])["energy"], np.memmap)
+
+
+def test_query(tmp_path):
+    run_ids = write_runs(str(tmp_path), num_runs=6, num_steps=2, shard_size=100)
+    store = TrajectoryStore(str(tmp_path))
+    assert store.query(optimizer="Adam") == run_ids[::2]
+    assert store.query(optimizer="QNG", seed=[1, 2, 3]) == [run_ids[1], run_ids[3]]
+    assert store.query(seed=lambda seed: seed >= 4) == run_ids[4:]
+    assert store.query(seed=10) == []
+    np.testing.assert_array_equal(
+        store.summaries(store.query(optimizer="Adam"))["best_energy"], [-1, -3, -5]
+    )
+
+
+def test_unfinished_runs(tmp_path):
+    writer = TrajectoryWriter(str(tmp_path), shard_size=2)
+    finished = writer.start_run({"seed": 0}, run_id="job")
+    writer.extend(finished, step=np.arange(3), energy=np.zeros(3))
+    writer.finish_run(finished)
+    writer.start_run({"seed": 1}, run_id="killed")
+    writer.extend("killed", step=np.arange(3), energy=np.ones(3))
+    writer.flush()
+    assert list(TrajectoryStore(str(tmp_path)).runs) == ["job"]
+
+    # a retry with the same run id only sees its own rows
+    with TrajectoryWriter(str(tmp_path)) as retry:
+        retry.start_run({"seed": 1}, run_id="killed")
+        retry.append("killed", step=0, energy=2.0)
+        retry.finish_run("killed")
+    store = TrajectoryStore(str(tmp_path))
+    np.testing.assert_array_equal(store.trajectory("killed")["energy"], [2.0])
+    np.testing.assert_array_equal(store.trajectory("job")["energy"], np.zeros(3))
+
+    with pytest.raises(ValueError):
+        retry.extend("killed", step=[0, 1], energy=[0.0])
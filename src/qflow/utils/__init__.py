@@ -1 +1,22 @@
-from .utils import *
+from qflow._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "qflow.utils.utils": [
+            "BitstringView",
+            "CACHE_DIR_ENV",
+            "SpinstringView",
+            "get_all_bitstrings",
+            "get_all_bitstrings_as_string",
+            "get_all_spinstrings",
+            "get_approximation_ratio",
+            "get_cache_root",
+            "get_hamiltonian_matrix",
+            "get_hamming_weight_indices",
+            "pairwise",
+            "parity",
+            "popcount",
+        ],
+    },
+)
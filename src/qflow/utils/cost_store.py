@@ -0,0 +1,147 @@
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+import networkx as nx
+import numpy as np
+
+from qflow.utils.maxcut_utils import get_maxcut_costs_from_edges, get_maxcut_edges
+from qflow.utils.utils import get_cache_root
+
+
+def get_cost_store_dir() -> str:
+    """Return the directory of the Max-Cut cost tables.
+
+    The tables are stored in the "maxcut" subdirectory of `get_cache_root()`.
+    """
+    return os.path.join(get_cache_root(), "maxcut")
+
+
+def maxcut_graph_hash(edges: np.ndarray, weights: np.ndarray, num_nodes: int) -> str:
+    """Return a hash of a Max-Cut instance that identifies its cost vector.
+
+    The edges are normalized to u <= v and sorted, so the hash does not depend
+    on the edge order or orientation. It does depend on the node positions,
+    which determine the bit order of the cost vector.
+
+    Args:
+        edges (np.ndarray): The (M, 2) array of node positions.
+        weights (np.ndarray): The (M,) edge weights.
+        num_nodes (int): The number of nodes.
+
+    Returns:
+        str: The sha256 hex digest.
+    """
+    edges = np.sort(np.asarray(edges, dtype=np.int64).reshape(-1, 2), axis=1)
+    weights = np.asarray(weights, dtype=np.float64)
+    order = np.lexsort((edges[:, 1], edges[:, 0]))
+    digest = hashlib.sha256()
+    digest.update(np.int64(num_nodes).tobytes())
+    digest.update(np.ascontiguousarray(edges[order]).tobytes())
+    digest.update(np.ascontiguousarray(weights[order]).tobytes())
+    return digest.hexdigest()
+
+
+def _cost_dtype(weights: np.ndarray, num_edges: int) -> np.dtype:
+    """The smallest dtype that holds all costs 1/2 * (sum_(u,v) w_uv s_u s_v - M) exactly.
+
+    For integer weights, sum_(u,v) w_uv s_u s_v has the parity of sum(w), so
+    the costs are integers if sum(w) - M is even.
+    """
+    if np.all(weights == np.round(weights)) and (np.sum(weights) - num_edges) % 2 == 0:
+        bound = 0.5 * (np.sum(np.abs(weights)) + num_edges)
+        for dtype in (np.int8, np.int16, np.int32, np.int64):
+            if bound <= np.iinfo(dtype).max:
+                return np.dtype(dtype)
+    return np.dtype(np.float64)
+
+
+def get_stored_maxcut_costs_from_edges(
+    edges: np.ndarray,
+    weights: np.ndarray,
+    num_nodes: int,
+    store_dir: Optional[str] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    """Return the Max-Cut cost vector as a read-only memory map of a stored table.
+
+    On a miss, the costs are computed with `get_maxcut_costs_from_edges`
+    directly into a temporary .npy memory map, which is atomically renamed
+    once it is complete. Integer costs are stored in the smallest integer
+    dtype that fits, e.g. int8 for unweighted graphs with less than 128
+    edges, which is 8 times smaller than float64. All processes that open the
+    same table share one page-cached copy.
+
+    Args:
+        edges (np.ndarray): The (M, 2) array of node positions.
+        weights (np.ndarray): The (M,) edge weights.
+        num_nodes (int): The number of nodes.
+        store_dir (str, optional): The directory of the tables. Defaults to
+            `get_cost_store_dir()`.
+        num_threads (int, optional): The number of threads on a miss. Defaults to 1.
+
+    Returns:
+        np.ndarray: The read-only cost values for all 2**num_nodes solutions.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    weights = np.asarray(weights, dtype=np.float64)
+    store_dir = store_dir or get_cost_store_dir()
+    path = os.path.join(
+        store_dir, f"{maxcut_graph_hash(edges, weights, num_nodes)}.npy"
+    )
+    try:
+        return np.load(path, mmap_mode="r")
+    except (FileNotFoundError, ValueError):
+        pass
+
+    os.makedirs(store_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=store_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        out = np.lib.format.open_memmap(
+            tmp_path,
+            mode="w+",
+            dtype=_cost_dtype(weights, len(edges)),
+            shape=(2**num_nodes,),
+        )
+        get_maxcut_costs_from_edges(
+            edges, weights, num_nodes, num_threads=num_threads, out=out
+        )
+        out.flush()
+        del out
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return np.load(path, mmap_mode="r")
+
+
+def get_stored_maxcut_costs(
+    graph: nx.Graph,
+    store_dir: Optional[str] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    """Return the Max-Cut cost vector of a graph from the on-disk store.
+
+    See `get_stored_maxcut_costs_from_edges`.
+
+    Args:
+        graph (nx.Graph): A networkx Graph object representing the graph.
+        store_dir (str, optional): The directory of the tables. Defaults to
+            `get_cost_store_dir()`.
+        num_threads (int, optional): The number of threads on a miss. Defaults to 1.
+
+    Returns:
+        np.ndarray: The read-only cost values for all 2**num_nodes solutions.
+
+    Example:
+    >>> graph = get_maxcut_graph(26, seed=0)
+    >>> costs = get_stored_maxcut_costs(graph)  # computed once, then mapped
+    >>> costs.dtype, costs.min()
+    """
+    edges, weights, num_nodes = get_maxcut_edges(graph)
+    return get_stored_maxcut_costs_from_edges(
+        edges, weights, num_nodes, store_dir, num_threads
+    )
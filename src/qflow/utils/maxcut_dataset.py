@@ -0,0 +1,244 @@
+import os
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from typing import Tuple
+
+import networkx as nx
+import numpy as np
+
+from qflow.utils.maxcut_utils import get_maxcut_costs_from_edges
+
+FAMILIES = ("gnm", "regular")
+
+
+@dataclass(frozen=True)
+class MaxCutDataset:
+    """A batch of Max-Cut instances stored as flat arrays.
+
+    The edges of all graphs are concatenated, graph i owns the rows
+    edge_offsets[i]:edge_offsets[i + 1] of `edges` and `weights`. The arrays
+    may be read-only memory maps, see `load_maxcut_dataset`.
+
+    Attributes:
+        edges (np.ndarray): The (E, 2) int32 node positions of all edges.
+        weights (np.ndarray): The (E,) edge weights.
+        edge_offsets (np.ndarray): The (G + 1,) int64 offsets into `edges`.
+        num_nodes (np.ndarray): The (G,) int32 numbers of nodes.
+        max_cut (np.ndarray): The (G,) weights of the maximum cuts, NaN if unsolved.
+        best_state (np.ndarray): The (G,) int64 basis states of the maximum
+            cuts (the first node is the most significant bit), -1 if unsolved.
+    """
+
+    edges: np.ndarray
+    weights: np.ndarray
+    edge_offsets: np.ndarray
+    num_nodes: np.ndarray
+    max_cut: np.ndarray
+    best_state: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.num_nodes)
+
+    def instance(self, index: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Return the edges, weights and number of nodes of one graph.
+
+        The edges and weights are views into the dataset, i.e. they are not
+        copied when the dataset is memory mapped.
+        """
+        start, stop = self.edge_offsets[index], self.edge_offsets[index + 1]
+        return (
+            self.edges[start:stop],
+            self.weights[start:stop],
+            int(self.num_nodes[index]),
+        )
+
+    def graph(self, index: int) -> nx.Graph:
+        """Return one instance as a networkx graph with weighted edges."""
+        edges, weights, num_nodes = self.instance(index)
+        graph = nx.Graph()
+        graph.add_nodes_from(range(num_nodes))
+        graph.add_weighted_edges_from(
+            (int(u), int(v), float(w)) for (u, v), w in zip(edges, weights)
+        )
+        return graph
+
+
+def _gnm_edges(num_nodes: int, num_edges: int, rng: np.random.Generator) -> np.ndarray:
+    """Draw num_edges distinct node pairs uniformly without building a graph."""
+    rows, cols = np.triu_indices(num_nodes, k=1)
+    pairs = np.sort(rng.choice(len(rows), size=num_edges, replace=False))
+    return np.stack([rows[pairs], cols[pairs]], axis=1)
+
+
+def solve_maxcut(
+    edges: np.ndarray, weights: np.ndarray, num_nodes: int
+) -> Tuple[float, int]:
+    """Solve Max-Cut exactly by enumerating the cost vector.
+
+    Args:
+        edges (np.ndarray): The (M, 2) array of node positions.
+        weights (np.ndarray): The (M,) edge weights.
+        num_nodes (int): The number of nodes.
+
+    Returns:
+        Tuple[float, int]: The weight of the maximum cut and its basis state.
+    """
+    costs = get_maxcut_costs_from_edges(edges, weights, num_nodes)
+    best_state = int(np.argmin(costs))
+    # cost = (sum(w) - M) / 2 - cut, see `get_maxcut_costs`
+    max_cut = 0.5 * (np.sum(weights) - len(edges)) - costs[best_state]
+    return float(max_cut), best_state
+
+
+def generate_maxcut_dataset(
+    num_graphs: int,
+    num_nodes: int,
+    family: str = "gnm",
+    degree: int = 3,
+    weighted: bool = False,
+    solve: bool = True,
+    seed: int = 0,
+) -> MaxCutDataset:
+    """Generate many Max-Cut instances as flat edge and weight arrays.
+
+    "gnm" graphs have a uniformly random number of edges between n and
+    n (n - 1) / 2 as in `get_maxcut_graph`, drawn directly as node pairs.
+    "regular" graphs are random `degree`-regular graphs. Weighted instances
+    have uniform weights in [0, 1), otherwise all weights are 1.
+
+    Args:
+        num_graphs (int): The number of graphs.
+        num_nodes (int): The number of nodes per graph.
+        family (str, optional): "gnm" or "regular". Defaults to "gnm".
+        degree (int, optional): The degree of regular graphs. Defaults to 3.
+        weighted (bool, optional): Whether to draw random weights. Defaults to False.
+        solve (bool, optional): Whether to compute the maximum cuts by
+            enumeration, which is feasible up to about 25 nodes. Defaults to True.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        MaxCutDataset: The instances.
+
+    Raises:
+        ValueError: If the family is unknown.
+
+    Example:
+    >>> dataset = generate_maxcut_dataset(1000, 12, family="regular", weighted=True)
+    >>> save_maxcut_dataset("regular_12.npz", dataset)
+    """
+    if family not in FAMILIES:
+        raise ValueError(f"Unknown family {family}, expected one of {FAMILIES}.")
+    rng = np.random.default_rng(seed)
+
+    edge_list = []
+    for _ in range(num_graphs):
+        if family == "gnm":
+            max_edges = num_nodes * (num_nodes - 1) // 2
+            num_edges = rng.integers(min(num_nodes, max_edges), max_edges + 1)
+            edge_list.append(_gnm_edges(num_nodes, num_edges, rng))
+        else:
+            graph = nx.random_regular_graph(degree, num_nodes, seed=rng)
+            edge_list.append(np.array(graph.edges(), dtype=np.int64).reshape(-1, 2))
+
+    sizes = np.array([len(edges) for edges in edge_list], dtype=np.int64)
+    edge_offsets = np.concatenate([[0], np.cumsum(sizes)])
+    edges = np.concatenate(edge_list).astype(np.int32).reshape(-1, 2)
+    if weighted:
+        weights = rng.uniform(0.0, 1.0, size=len(edges))
+    else:
+        weights = np.ones(len(edges))
+
+    max_cut = np.full(num_graphs, np.nan)
+    best_state = np.full(num_graphs, -1, dtype=np.int64)
+    if solve:
+        for i in range(num_graphs):
+            start, stop = edge_offsets[i], edge_offsets[i + 1]
+            max_cut[i], best_state[i] = solve_maxcut(
+                edges[start:stop], weights[start:stop], num_nodes
+            )
+
+    return MaxCutDataset(
+        edges=edges,
+        weights=weights,
+        edge_offsets=edge_offsets,
+        num_nodes=np.full(num_graphs, num_nodes, dtype=np.int32),
+        max_cut=max_cut,
+        best_state=best_state,
+    )
+
+
+def save_maxcut_dataset(path: str, dataset: MaxCutDataset) -> str:
+    """Store a dataset as a single uncompressed npz file.
+
+    The file is written to a temporary file and atomically renamed. Since the
+    members are not compressed, `load_maxcut_dataset` can memory map them.
+
+    Args:
+        path (str): The path of the npz file.
+        dataset (MaxCutDataset): The dataset.
+
+    Returns:
+        str: The path of the npz file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **dataset.__dict__)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def _memmap_member(path: str, zf: zipfile.ZipFile, name: str) -> np.ndarray:
+    """Memory map an uncompressed .npy member of a zip file."""
+    info = zf.getinfo(name)
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"The member {name} is compressed and cannot be mapped.")
+    with open(path, "rb") as f:
+        # the local header has a fixed part of 30 bytes plus the name and extra
+        f.seek(info.header_offset + 26)
+        name_length, extra_length = np.frombuffer(f.read(4), dtype="<u2")
+        f.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(f)
+        else:
+            header = np.lib.format.read_array_header_2_0(f)
+        shape, fortran_order, dtype = header
+        offset = f.tell()
+    if len(shape) == 0 or 0 in shape:
+        return np.zeros(shape, dtype=dtype)
+    order = "F" if fortran_order else "C"
+    return np.memmap(
+        path, dtype=dtype, mode="r", offset=offset, shape=shape, order=order
+    )
+
+
+def load_maxcut_dataset(path: str, mmap: bool = True) -> MaxCutDataset:
+    """Load a dataset stored by `save_maxcut_dataset`.
+
+    With `mmap`, the arrays are read-only memory maps of the file, so worker
+    processes that load the same file share one page-cached copy and nothing
+    is copied or pickled.
+
+    Args:
+        path (str): The path of the npz file.
+        mmap (bool, optional): Whether to memory map the arrays. Defaults to True.
+
+    Returns:
+        MaxCutDataset: The dataset.
+    """
+    names = MaxCutDataset.__dataclass_fields__
+    if not mmap:
+        with np.load(path, allow_pickle=False) as data:
+            return MaxCutDataset(**{name: data[name] for name in names})
+    with zipfile.ZipFile(path) as zf:
+        return MaxCutDataset(
+            **{name: _memmap_member(path, zf, f"{name}.npy") for name in names}
+        )
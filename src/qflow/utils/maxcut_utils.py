@@ -1,17 +1,282 @@
 import random
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-import algorithmx
 import networkx as nx
 import numpy as np
 
 
-def get_maxcut_costs(graph: nx.Graph) -> np.ndarray:
+def get_maxcut_edges(graph: nx.Graph) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Return the edges of a graph as arrays of node positions and weights.
+
+    Node positions follow the order of `graph.nodes`, which is also the order
+    of the bits in the cost vector (the first node is the most significant bit).
+
+    Args:
+        graph (nx.Graph): A networkx Graph object representing the graph.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, int]: The (M, 2) edge array, the (M,)
+            weights (default 1) and the number of nodes.
+
+    Raises:
+        TypeError: If the input graph is not a networkx Graph object.
+    """
+    if not isinstance(graph, nx.Graph):
+        raise TypeError(
+            "Graph is not a networkx class (found type: %s)" % type(graph).__name__
+        )
+
+    position = {node: i for i, node in enumerate(graph.nodes)}
+    edges = np.array(
+        [(position[u], position[v]) for u, v in graph.edges()], dtype=np.int64
+    ).reshape(-1, 2)
+    weights = np.array(
+        [data.get("weight", 1) for _, _, data in graph.edges(data=True)],
+        dtype=np.float64,
+    )
+    return edges, weights, graph.number_of_nodes()
+
+
+def _edge_kernel(
+    start: int, stop: int, num_nodes: int, edges: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """Evaluate sum_(u,v) w_uv s_u s_v for the basis states start..stop-1.
+
+    The spin of node i is s_i = 1 - 2 b_i with b_i = (index >> (n - 1 - i)) & 1,
+    so s_u s_v = 1 - 2 (b_u ^ b_v).
+    """
+    index = np.arange(start, stop, dtype=np.int64)
+    shifts = num_nodes - 1 - np.arange(num_nodes)
+    bits = ((index >> shifts[:, None]) & 1).astype(np.int8)
+    cut = np.zeros(stop - start, dtype=np.float64)
+    for (u, v), weight in zip(edges, weights):
+        if weight == 1:
+            cut += bits[u] ^ bits[v]
+        else:
+            cut += weight * (bits[u] ^ bits[v])
+    return np.sum(weights) - 2 * cut
+
+
+class _GrayCodeKernel:
+    """Incremental Max-Cut cost evaluation over Gray-code ordered chunks.
+
+    The nodes are split into high nodes (the most significant bits, fixed within
+    a chunk) and low nodes (the bits enumerated within a chunk). The cost of a
+    chunk is the high-high energy plus a precomputed low-low table plus the
+    cross term, which is linear in the low spins. Visiting the chunks in Gray
+    code order flips a single high spin per chunk, which updates the high-high
+    energy and the cross field in O(n).
+    """
+
+    def __init__(self, edges, weights, num_nodes, num_low):
+        self.num_low = num_low
+        self.num_high = num_high = num_nodes - num_low
+        self.offset = np.sum(weights[edges[:, 0] == edges[:, 1]]) - len(edges)
+
+        self.w_high = np.zeros((num_high, num_high))
+        self.w_cross = np.zeros((num_high, num_low))
+        low_edges, low_weights = [], []
+        for (u, v), weight in zip(edges, weights):
+            u, v = min(u, v), max(u, v)
+            if u == v:
+                continue
+            if v < num_high:
+                self.w_high[u, v] += weight
+                self.w_high[v, u] += weight
+            elif u < num_high:
+                self.w_cross[u, v - num_high] += weight
+            else:
+                low_edges.append((u - num_high, v - num_high))
+                low_weights.append(weight)
+
+        self.low_table = _edge_kernel(
+            0,
+            2**num_low,
+            num_low,
+            np.array(low_edges, dtype=np.int64).reshape(-1, 2),
+            np.array(low_weights, dtype=np.float64),
+        )
+        index = np.arange(2**num_low, dtype=np.int64)[:, None]
+        shifts = num_low - 1 - np.arange(num_low)
+        self.low_spins = (1 - 2 * ((index >> shifts) & 1)).astype(np.float64)
+
+    def chunks(self, i_start: int, i_stop: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (start index, costs) for the Gray-code steps i_start..i_stop-1."""
+        gray = i_start ^ (i_start >> 1)
+        shifts = self.num_high - 1 - np.arange(self.num_high)
+        spins = (1 - 2 * ((gray >> shifts) & 1)).astype(np.float64)
+        energy_high = 0.5 * spins @ self.w_high @ spins
+        field = spins @ self.w_cross
+
+        for i in range(i_start, i_stop):
+            if i > i_start:
+                node = self.num_high - (i & -i).bit_length()
+                energy_high -= 2 * spins[node] * (self.w_high[node] @ spins)
+                field -= 2 * spins[node] * self.w_cross[node]
+                spins[node] = -spins[node]
+                gray = i ^ (i >> 1)
+            total = energy_high + self.low_table + self.low_spins @ field
+            yield gray << self.num_low, 0.5 * (total + self.offset)
+
+
+def _check_method(method: str) -> None:
+    if method not in ("edges", "gray"):
+        raise ValueError(f"Unknown method {method}, expected 'edges' or 'gray'.")
+
+
+def iter_maxcut_costs_from_edges(
+    edges: np.ndarray,
+    weights: np.ndarray,
+    num_nodes: int,
+    chunk_size: int = 2**16,
+    method: str = "edges",
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Stream the Max-Cut cost values in chunks with bounded memory.
+
+    Args:
+        edges (np.ndarray): The (M, 2) array of node positions.
+        weights (np.ndarray): The (M,) edge weights.
+        num_nodes (int): The number of nodes.
+        chunk_size (int, optional): The number of basis states per chunk, a
+            power of two. Defaults to 2**16.
+        method (str, optional): "edges" evaluates every edge with bit operations,
+            "gray" uses the Gray-code incremental update, which is faster for
+            dense graphs. Chunks of the "gray" method arrive out of order.
+            Defaults to "edges".
+
+    Yields:
+        Tuple[int, np.ndarray]: The index of the first basis state of the chunk
+            and the cost values of the chunk.
+    """
+    _check_method(method)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    weights = np.asarray(weights, dtype=np.float64)
+    num_states = 2**num_nodes
+    chunk_size = min(chunk_size, num_states)
+
+    if method == "gray":
+        num_low = min(num_nodes, int(np.log2(chunk_size)))
+        kernel = _GrayCodeKernel(edges, weights, num_nodes, num_low)
+        yield from kernel.chunks(0, 2 ** (num_nodes - num_low))
+        return
+
+    for start in range(0, num_states, chunk_size):
+        stop = min(start + chunk_size, num_states)
+        total = _edge_kernel(start, stop, num_nodes, edges, weights)
+        yield start, 0.5 * (total - len(edges))
+
+
+def get_maxcut_costs_from_edges(
+    edges: np.ndarray,
+    weights: np.ndarray,
+    num_nodes: int,
+    chunk_size: int = 2**16,
+    method: str = "edges",
+    num_threads: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Calculate the Max-Cut cost values from edge arrays.
+
+    See `get_maxcut_costs`. The chunks are distributed over a thread pool and
+    written into `out`, which may be a `numpy.memmap` for graphs whose cost
+    vector does not fit into memory.
+
+    Args:
+        edges (np.ndarray): The (M, 2) array of node positions.
+        weights (np.ndarray): The (M,) edge weights.
+        num_nodes (int): The number of nodes.
+        chunk_size (int, optional): The number of basis states per chunk.
+            Defaults to 2**16.
+        method (str, optional): "edges" or "gray", see `iter_maxcut_costs_from_edges`.
+        num_threads (int, optional): The number of threads. Defaults to 1.
+        out (np.ndarray, optional): The output array of length 2**num_nodes.
+
+    Returns:
+        np.ndarray: The cost values for all 2**num_nodes solutions.
+    """
+    _check_method(method)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    weights = np.asarray(weights, dtype=np.float64)
+    num_states = 2**num_nodes
+    chunk_size = min(chunk_size, num_states)
+    if out is None:
+        out = np.empty(num_states, dtype=np.float64)
+    num_threads = num_threads or 1
+
+    if method == "gray":
+        num_low = min(num_nodes, int(np.log2(chunk_size)))
+        kernel = _GrayCodeKernel(edges, weights, num_nodes, num_low)
+        blocks = np.array_split(np.arange(2 ** (num_nodes - num_low)), num_threads)
+
+        def work(block):
+            if len(block) == 0:
+                return
+            for start, costs in kernel.chunks(int(block[0]), int(block[-1]) + 1):
+                out[start : start + len(costs)] = costs
+
+    else:
+        blocks = range(0, num_states, chunk_size)
+
+        def work(start):
+            stop = min(start + chunk_size, num_states)
+            total = _edge_kernel(start, stop, num_nodes, edges, weights)
+            out[start:stop] = 0.5 * (total - len(edges))
+
+    if num_threads == 1:
+        for block in blocks:
+            work(block)
+    else:
+        with ThreadPoolExecutor(num_threads) as executor:
+            list(executor.map(work, blocks))
+    return out
+
+
+def iter_maxcut_costs(
+    graph: nx.Graph, chunk_size: int = 2**16, method: str = "edges"
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Stream the Max-Cut cost values of a graph in chunks.
+
+    Args:
+        graph (nx.Graph): A networkx Graph object representing the graph.
+        chunk_size (int, optional): The number of basis states per chunk.
+            Defaults to 2**16.
+        method (str, optional): "edges" or "gray", see `iter_maxcut_costs_from_edges`.
+
+    Yields:
+        Tuple[int, np.ndarray]: The index of the first basis state of the chunk
+            and the cost values of the chunk.
+
+    Example:
+        best = min(costs.min() for _, costs in iter_maxcut_costs(graph))
+    """
+    edges, weights, num_nodes = get_maxcut_edges(graph)
+    yield from iter_maxcut_costs_from_edges(
+        edges, weights, num_nodes, chunk_size, method
+    )
+
+
+def get_maxcut_costs(
+    graph: nx.Graph,
+    chunk_size: int = 2**16,
+    method: str = "edges",
+    num_threads: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """
     Calculates the Max-Cut cost values for a given graph.
 
+    The cost C = 1/2 * (sum_(u,v) w_uv s_u s_v - M) is evaluated from the edge
+    arrays with bit operations on chunks of integer basis states, so no
+    2^N x N spin matrix or 2^N x 2^N intermediate is built.
+
     Args:
         graph (nx.Graph): A networkx Graph object representing the graph.
+        chunk_size (int, optional): The number of basis states per chunk.
+            Defaults to 2**16.
+        method (str, optional): "edges" or "gray", see `iter_maxcut_costs_from_edges`.
+        num_threads (int, optional): The number of threads. Defaults to 1.
+        out (np.ndarray, optional): The output array, e.g. a `numpy.memmap`.
 
     Returns:
         numpy.ndarray: A 1D numpy array containing the cost values for all possible solutions to the Max-Cut problem.
@@ -28,34 +293,10 @@ def get_maxcut_costs(graph: nx.Graph) -> np.ndarray:
     Output:
         array([0, -1, -2, -1, -2, -3, -2, -1, -1, -2, -3, -2, -1, -2, -1,  0])
     """
-
-    if not isinstance(graph, nx.Graph):
-        raise TypeError(
-            "Graph is not a networkx class (found type: %s)" % type(graph).__name__
-        )
-
-    def product(*args, repeat=1):
-        # product('ABCD', 'xy') --> Ax Ay Bx By Cx Cy Dx Dy
-        # product(range(2), repeat=3) --> 000 001 010 011 100 101 110 111
-        pools = [list(pool) for pool in args] * repeat
-        result = [[]]
-        for pool in pools:
-            result = [x + [y] for x in result for y in pool]
-        for prod in result:
-            yield list(prod)
-
-    M = graph.number_of_edges()
-    N = graph.number_of_nodes()
-    A = nx.adjacency_matrix(graph).todense()
-
-    # Generate a list of all possible n‐tuples of elements from {1,-1} and
-    # organize them as a (2^n x n) matrix. In other words create all
-    # possible solutions to the problem.
-    s = np.array(list(product([1, -1], repeat=N)))
-
-    # Construct the the cost function for Max Cut: C=1/2*Sum(Z_i*Z_j)-M/2
-    # Note: This is the minimization version
-    return 1 / 2 * (np.diag(s @ np.triu(A) @ s.T) - M)
+    edges, weights, num_nodes = get_maxcut_edges(graph)
+    return get_maxcut_costs_from_edges(
+        edges, weights, num_nodes, chunk_size, method, num_threads, out
+    )
 
 
 def get_maxcut_graph(n: int, seed: int) -> nx.DiGraph():
@@ -92,6 +333,9 @@ def visualize_maxcut_graph(G: nx.Graph, solution: Any = None) -> Any:
             "Graph is not a networkx class (found type: %s)" % type(G).__name__
         )
 
+    # algorithmx is only needed in notebooks, do not import it with the module
+    import algorithmx
+
     canvas = algorithmx.jupyter_canvas()
 
     canvas.nodes(G.nodes).add()
@@ -0,0 +1,352 @@
+import json
+import os
+import tempfile
+import uuid
+import zipfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from qflow.utils.maxcut_dataset import _memmap_member
+
+# the columns of a trajectory and their dtypes
+TRAJECTORY_COLUMNS = {
+    "step": np.int64,
+    "energy": np.float64,
+    "grad_norm": np.float64,
+    "approx_ratio": np.float64,
+    "wall_time": np.float64,
+    "executions": np.int64,
+}
+# the value of a column that is not recorded
+MISSING = {np.dtype(np.int64): -1, np.dtype(np.float64): np.nan}
+
+SHARD_DIR = "shards"
+SEGMENT_INDEX = "segments.jsonl"
+RUN_INDEX = "runs.jsonl"
+
+
+def _append_lines(path: str, records: List[Dict[str, Any]]):
+    """Append json lines with a single write, so concurrent writers do not interleave."""
+    if not records:
+        return
+    data = "".join(json.dumps(record) + "\n" for record in records).encode()
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _read_lines(path: str) -> List[Dict[str, Any]]:
+    """Read json lines, a torn last line of a killed writer is skipped."""
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path) as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+class TrajectoryWriter:
+    """Append optimization trajectories to a store of columnar shards.
+
+    Rows are buffered in memory and written as one shard once `shard_size`
+    rows are pending, or on `flush` and `close`. A shard is an uncompressed
+    npz file with one member per column, written atomically, so it can be
+    memory mapped column by column. Shards are never modified, and several
+    processes may write to the same store at the same time.
+
+    A run is added to the run index only once all its rows are in shards,
+    i.e. the trajectories of runs that were interrupted before `finish_run`
+    are never visible to `TrajectoryStore`.
+
+    Args:
+        store_dir (str): The directory of the store.
+        shard_size (int, optional): The number of rows per shard. Defaults to 65536.
+
+    Example:
+    >>> with TrajectoryWriter("results") as writer:
+    ...     run_id = writer.start_run({"optimizer": "AdamOptimizer", "seed": 0})
+    ...     for step in range(steps):
+    ...         params, energy = optimizer.step_and_cost(cost_fn, params)
+    ...         writer.append(run_id, step=step, energy=energy)
+    ...     writer.finish_run(run_id)
+    """
+
+    def __init__(self, store_dir: str, shard_size: int = 65536):
+        self.store_dir = store_dir
+        self.shard_size = shard_size
+        os.makedirs(os.path.join(store_dir, SHARD_DIR), exist_ok=True)
+        self._metadata: Dict[str, Dict[str, Any]] = dict()
+        self._buffers: Dict[str, Dict[str, list]] = dict()
+        self._summaries: Dict[str, Dict[str, Any]] = dict()
+        self._finished: List[str] = []
+        self._num_pending = 0
+        # tags the index lines, segments of an interrupted writer with the
+        # same run id are never mixed into a run
+        self._writer_id = uuid.uuid4().hex
+
+    def start_run(
+        self, metadata: Optional[Dict[str, Any]] = None, run_id: Optional[str] = None
+    ) -> str:
+        """Start a run with json serializable metadata and return its id."""
+        run_id = run_id or uuid.uuid4().hex
+        if run_id in self._metadata:
+            raise ValueError(f"The run {run_id} was already started.")
+        self._metadata[run_id] = dict(metadata or dict())
+        self._buffers[run_id] = {name: [] for name in TRAJECTORY_COLUMNS}
+        self._summaries[run_id] = {"num_steps": 0}
+        return run_id
+
+    def append(self, run_id: str, **values):
+        """Append one row, columns that are not given are recorded as missing."""
+        self.extend(run_id, **{name: [value] for name, value in values.items()})
+
+    def extend(self, run_id: str, **columns):
+        """Append rows given as equally long column arrays.
+
+        Raises:
+            ValueError: If a column is unknown or the lengths differ.
+        """
+        unknown = set(columns) - set(TRAJECTORY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns {sorted(unknown)}.")
+        columns = {
+            name: np.asarray(value).reshape(-1) for name, value in columns.items()
+        }
+        lengths = {len(value) for value in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"The columns have different lengths {sorted(lengths)}.")
+        (length,) = lengths
+
+        buffer = self._buffers[run_id]
+        for name, dtype in TRAJECTORY_COLUMNS.items():
+            if name in columns:
+                value = np.real(columns[name]).astype(dtype)
+            else:
+                value = np.full(length, MISSING[np.dtype(dtype)], dtype=dtype)
+            buffer[name].append(value)
+
+        summary = self._summaries[run_id]
+        summary["num_steps"] += length
+        if "energy" in columns:
+            energy = np.real(columns["energy"]).astype(np.float64)
+            summary["final_energy"] = float(energy[-1])
+            summary["best_energy"] = float(
+                min(summary.get("best_energy", np.inf), np.min(energy))
+            )
+        for name in ("wall_time", "executions"):
+            if name in columns:
+                summary[name] = columns[name][-1].item()
+
+        self._num_pending += length
+        if self._num_pending >= self.shard_size:
+            self.flush()
+
+    def finish_run(self, run_id: str) -> Dict[str, Any]:
+        """Mark a run as complete, it is indexed with the next flush.
+
+        Returns:
+            Dict[str, Any]: The summary of the run, i.e. the number of steps,
+                the final and best energy and the last wall time and executions.
+        """
+        if run_id not in self._metadata or run_id in self._finished:
+            raise ValueError(f"The run {run_id} is not running.")
+        self._finished.append(run_id)
+        return dict(self._summaries[run_id])
+
+    def flush(self):
+        """Write the pending rows as one shard and index the finished runs."""
+        segments = []
+        if self._num_pending > 0:
+            name = f"{uuid.uuid4().hex}.npz"
+            columns = {column: [] for column in TRAJECTORY_COLUMNS}
+            start = 0
+            for run_id, buffer in self._buffers.items():
+                stop = start + sum(len(value) for value in buffer["step"])
+                if stop == start:
+                    continue
+                for column, values in buffer.items():
+                    columns[column].extend(values)
+                    values.clear()
+                segments.append(
+                    {
+                        "shard": name,
+                        "run_id": run_id,
+                        "writer": self._writer_id,
+                        "start": start,
+                        "stop": stop,
+                    }
+                )
+                start = stop
+            self._write_shard(name, {k: np.concatenate(v) for k, v in columns.items()})
+            self._num_pending = 0
+
+        runs = [
+            {
+                "run_id": run_id,
+                "writer": self._writer_id,
+                "metadata": self._metadata.pop(run_id),
+                "summary": self._summaries.pop(run_id),
+            }
+            for run_id in self._finished
+        ]
+        for run_id in self._finished:
+            del self._buffers[run_id]
+        self._finished = []
+
+        # shard, then segments, then runs: an indexed run is always complete
+        _append_lines(os.path.join(self.store_dir, SEGMENT_INDEX), segments)
+        _append_lines(os.path.join(self.store_dir, RUN_INDEX), runs)
+
+    def _write_shard(self, name: str, columns: Dict[str, np.ndarray]):
+        directory = os.path.join(self.store_dir, SHARD_DIR)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **columns)
+            os.replace(tmp_path, os.path.join(directory, name))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def close(self):
+        """Flush the pending rows, runs that were not finished are dropped."""
+        self.flush()
+
+    def __enter__(self) -> "TrajectoryWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TrajectoryStore:
+    """Read the runs and trajectories of a store written by `TrajectoryWriter`.
+
+    The run index is loaded once; queries over the run metadata use an
+    inverted index and do not touch the shards. Trajectory columns are read
+    only memory maps of the shards.
+
+    Args:
+        store_dir (str): The directory of the store.
+
+    Attributes:
+        runs (Dict[str, Dict[str, Any]]): Per run id, its metadata and summary.
+
+    Example:
+    >>> store = TrajectoryStore("results")
+    >>> run_ids = store.query(optimizer=["AdamOptimizer", "QNG2Optimizer"], seed=0)
+    >>> store.summaries(run_ids)["best_energy"]
+    >>> store.trajectory(run_ids[0])["energy"]
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self.runs = {
+            record["run_id"]: record
+            for record in _read_lines(os.path.join(store_dir, RUN_INDEX))
+        }
+        self._segments: Dict[str, List[Dict[str, Any]]] = dict()
+        for segment in _read_lines(os.path.join(store_dir, SEGMENT_INDEX)):
+            run = self.runs.get(segment["run_id"])
+            if run is not None and run["writer"] == segment["writer"]:
+                self._segments.setdefault(segment["run_id"], []).append(segment)
+        self._shards: Dict[str, Dict[str, np.ndarray]] = dict()
+        self._index: Dict[str, Dict[Any, List[str]]] = dict()
+
+    def __len__(self) -> int:
+        return len(self.runs)
+
+    def _lookup(self, key: str, value: Any) -> List[str]:
+        if key not in self._index:
+            index = dict()
+            for run_id, record in self.runs.items():
+                if key in record["metadata"]:
+                    index.setdefault(_hashable(record["metadata"][key]), []).append(
+                        run_id
+                    )
+            self._index[key] = index
+        return self._index[key].get(_hashable(value), [])
+
+    def query(self, **filters) -> List[str]:
+        """Return the ids of the runs whose metadata match all filters.
+
+        A filter value is matched by equality, a list, tuple or set by
+        membership and a callable is used as a predicate of the value.
+        """
+        run_ids = set(self.runs)
+        for key, value in filters.items():
+            if callable(value):
+                matches = {
+                    run_id
+                    for run_id in run_ids
+                    if key in self.runs[run_id]["metadata"]
+                    and value(self.runs[run_id]["metadata"][key])
+                }
+            elif isinstance(value, (list, tuple, set)):
+                matches = {run_id for v in value for run_id in self._lookup(key, v)}
+            else:
+                matches = set(self._lookup(key, value))
+            run_ids &= matches
+        return [run_id for run_id in self.runs if run_id in run_ids]
+
+    def summaries(self, run_ids: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """Return the run summaries as columns, missing values are NaN."""
+        run_ids = list(self.runs) if run_ids is None else run_ids
+        keys = sorted({key for r in run_ids for key in self.runs[r]["summary"]})
+        return {
+            key: np.array(
+                [self.runs[r]["summary"].get(key, np.nan) for r in run_ids],
+                dtype=np.float64,
+            )
+            for key in keys
+        }
+
+    def _shard(self, name: str) -> Dict[str, np.ndarray]:
+        if name not in self._shards:
+            path = os.path.join(self.store_dir, SHARD_DIR, name)
+            with zipfile.ZipFile(path) as zf:
+                self._shards[name] = {
+                    column: _memmap_member(path, zf, f"{column}.npy")
+                    for column in TRAJECTORY_COLUMNS
+                }
+        return self._shards[name]
+
+    def trajectory(self, run_id: str) -> Dict[str, np.ndarray]:
+        """Return the columns of a run.
+
+        If the run lies in a single shard, the columns are memory mapped,
+        otherwise its segments are concatenated.
+        """
+        if run_id not in self.runs:
+            raise KeyError(f"Unknown run {run_id}.")
+        parts = [
+            {
+                column: values[segment["start"] : segment["stop"]]
+                for column, values in self._shard(segment["shard"]).items()
+            }
+            for segment in self._segments.get(run_id, [])
+        ]
+        if len(parts) == 1:
+            return parts[0]
+        return {
+            column: np.concatenate(
+                [part[column] for part in parts] + [np.empty(0, dtype=dtype)]
+            )
+            for column, dtype in TRAJECTORY_COLUMNS.items()
+        }
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
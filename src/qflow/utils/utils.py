@@ -1,29 +1,58 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 # from beartype import beartype
 import numpy as np
-import pennylane as qml
 
+if TYPE_CHECKING:
+    import pennylane as qml
 
-def get_hamiltonian_matrix(H: qml.Hamiltonian):
+CACHE_DIR_ENV = "QFLOW_CACHE_DIR"
+
+
+def get_cache_root() -> str:
+    """Return the root directory of the on-disk caches.
+
+    The root can be set with the environment variable QFLOW_CACHE_DIR
+    (default: ~/.cache/qflow). Every cache uses its own subdirectory.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "qflow")
+    return cache_dir
+
+
+def get_hamiltonian_matrix(H: "qml.Hamiltonian"):
     """Print the Hamiltonian."""
+    # pennylane takes seconds to import, the bit utilities do not need it
+    import pennylane as qml
+
     return qml.utils.sparse_hamiltonian(H).toarray()
 
 
-def get_all_bitstrings_as_string(n: int) -> List:
+def get_all_bitstrings_as_string(n: int, indices: Optional[Any] = None) -> List:
     """Return a list of strings representing all the bitstrings up to n.
 
     Args:
         n_qubits (int): The length of each bitstring.
+        indices (Any, optional): Only return the bitstrings at these indices,
+            e.g. `np.argmax(probs)`. Defaults to all 2^n bitstrings.
 
     Returns:
         List: The list of all bitstrings as strings.
     """
-    bitstrings = get_all_bitstrings(n)
-    all_bitstrings_str = [
-        " ".join(str(b) for b in bitstring) for bitstring in bitstrings
-    ]
-    return all_bitstrings_str
+    view = BitstringView(n)
+    return view.as_strings(slice(None) if indices is None else indices)
 
 
 def get_approximation_ratio(E_optimized: float, E_min: float, E_max: float) -> float:
@@ -40,38 +69,229 @@ def get_approximation_ratio(E_optimized: float, E_min: float, E_max: float) -> f
     return (E_optimized - E_max) / (E_min - E_max)
 
 
+class BitstringView:
+    """A lazy, sliceable view of all 2^n_bits bitstrings.
+
+    Row i is the binary representation of i, with the most significant bit in
+    column 0, as in `get_all_bitstrings`. Bits are computed on demand from the
+    integer indices, so only the requested rows are materialized.
+
+    Args:
+        n_bits (int): The length of the bitstrings.
+
+    Example:
+    >>> view = BitstringView(3)
+    >>> view[5]
+    array([1, 0, 1], dtype=int8)
+    >>> view[[1, 6]]
+    array([[0, 0, 1],
+           [1, 1, 0]], dtype=int8)
+    """
+
+    # the rows are computed in chunks to keep the int64 intermediates small
+    _chunk_size = 2**14
+
+    def __init__(self, n_bits: int):
+        self.n_bits = n_bits
+        self._shifts = np.arange(n_bits - 1, -1, -1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return 2**self.n_bits
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(n_bits={self.n_bits})"
+
+    def indices(self, key: Any) -> np.ndarray:
+        """Convert an integer, slice or index array into an array of indices."""
+        if isinstance(key, slice):
+            return np.arange(*key.indices(len(self)), dtype=np.int64)
+        index = np.asarray(key, dtype=np.int64)
+        index = np.where(index < 0, index + len(self), index)
+        if np.any((index < 0) | (index >= len(self))):
+            raise IndexError(f"Index out of range for {len(self)} bitstrings.")
+        return index
+
+    def _fill(self, index: np.ndarray, out: np.ndarray) -> None:
+        """Write the rows of a 1-d chunk of indices into an int8 array."""
+        for column, shift in enumerate(self._shifts):
+            np.bitwise_and(index >> shift, 1, out=out[:, column], casting="unsafe")
+
+    def _rows(self, index: np.ndarray) -> np.ndarray:
+        # filled in chunks, the only full size array is the int8 output
+        out = np.empty(index.shape + (self.n_bits,), dtype=np.int8)
+        flat_index = index.reshape(-1)
+        flat_out = out.reshape(-1, self.n_bits)
+        for start in range(0, len(flat_index), self._chunk_size):
+            stop = start + self._chunk_size
+            self._fill(flat_index[start:stop], flat_out[start:stop])
+        return out
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if not isinstance(key, slice):
+            return self._rows(self.indices(key))
+        # the indices of a slice are generated per chunk as well
+        rows = range(*key.indices(len(self)))
+        out = np.empty((len(rows), self.n_bits), dtype=np.int8)
+        for start in range(0, len(rows), self._chunk_size):
+            chunk = rows[start : start + self._chunk_size]
+            index = np.arange(chunk.start, chunk.stop, chunk.step, dtype=np.int64)
+            self._fill(index, out[start : start + self._chunk_size])
+        return out
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for _, rows in self.chunks():
+            yield from rows
+
+    def chunks(self, chunk_size: int = 2**16) -> Iterator[Tuple[int, np.ndarray]]:
+        """Iterate over the rows in chunks.
+
+        Args:
+            chunk_size (int, optional): The number of rows per chunk. Defaults to 2**16.
+
+        Yields:
+            Tuple[int, np.ndarray]: The index of the first row and the rows.
+        """
+        for start in range(0, len(self), chunk_size):
+            yield start, self[start : start + chunk_size]
+
+    def hamming_weight(self, key: Any = slice(None)) -> np.ndarray:
+        """Return the number of ones of the selected bitstrings."""
+        return popcount(self.indices(key))
+
+    def parity(self, key: Any = slice(None), mask: Optional[int] = None) -> np.ndarray:
+        """Return the parity of the selected bitstrings.
+
+        Args:
+            key (Any, optional): The selected rows. Defaults to all rows.
+            mask (int, optional): Only count the bits set in this integer mask.
+                Defaults to all bits.
+
+        Returns:
+            np.ndarray: 1 for an odd number of ones, 0 otherwise.
+        """
+        index = self.indices(key)
+        if mask is not None:
+            index = index & mask
+        return parity(index)
+
+    def as_strings(self, key: Any = slice(None)) -> List[str]:
+        """Return the selected bitstrings as strings, e.g. "1 0 1"."""
+        rows = np.atleast_2d(self[key])
+        return [" ".join(str(b) for b in row) for row in rows]
+
+
+class SpinstringView(BitstringView):
+    """A lazy, sliceable view of all spinstrings, s = 1 - 2 * b.
+
+    See `BitstringView`.
+    """
+
+    def _fill(self, index: np.ndarray, out: np.ndarray) -> None:
+        super()._fill(index, out)
+        out *= -2
+        out += 1
+
+
 def get_all_bitstrings(n_bits: int) -> np.ndarray:
     """Get all bitstrings up to n_bits.
 
+    Use `BitstringView` to access single rows or chunks without materializing
+    all 2^n_bits rows.
+
     Args:
         n_bits (int): The length of the bitstring.
 
     Returns:
         bitstrings_binary (np.ndarray): An array of shape (n_permutations, n_bits).
     """
-    n_bitstrings = 2**n_bits
-    bitstrings = np.zeros(shape=(n_bitstrings, n_bits), dtype=np.int8)
-    tf = np.array([False, True])
-    for i in range(n_bits):
-        j = n_bits - i - 1
-        bitstrings[np.tile(np.repeat(tf, 2**j), 2**i), i] = 1
-
-    return bitstrings
+    return BitstringView(n_bits)[:]
 
 
 def get_all_spinstrings(n_bits: int) -> np.ndarray:
     """Get all spinstrings up to n_bits.
 
+    Use `SpinstringView` to access single rows or chunks without materializing
+    all 2^n_bits rows.
+
     Args:
         n_bits (int): The length of the spinstring.
 
     Returns:
         spinstrings_binary (np.ndarray): An array of shape (n_permutations, n_bits).
     """
-    bitstrings = get_all_bitstrings(n_bits)
-    spinstrings = 1 - 2 * bitstrings
+    return SpinstringView(n_bits)[:]
 
-    return spinstrings
+
+def get_hamming_weight_indices(n_bits: int, hamming_weight: int) -> np.ndarray:
+    """Get the indices of all bitstrings of length n_bits with a given Hamming weight.
+
+    Only the C(n_bits, hamming_weight) target indices are generated, using the
+    recursion indices(b + 1, w) = indices(b, w) + (indices(b, w - 1) | 2^b).
+    No 2^n_bits intermediate is built.
+
+    Args:
+        n_bits (int): The length of the bitstrings.
+        hamming_weight (int): The number of ones in the bitstrings.
+
+    Returns:
+        np.ndarray: The indices in ascending order.
+
+    Example:
+    >>> get_hamming_weight_indices(4, 2)
+    array([ 3,  5,  6,  9, 10, 12])
+    """
+    if hamming_weight < 0 or hamming_weight > n_bits:
+        return np.zeros(0, dtype=np.int64)
+
+    # indices[w] holds all indices of weight w over the bits seen so far
+    indices = {0: np.zeros(1, dtype=np.int64)}
+    for bit in range(n_bits):
+        remaining = n_bits - bit - 1
+        low = max(0, hamming_weight - remaining)
+        high = min(hamming_weight, bit + 1)
+        indices = {
+            w: np.concatenate(
+                (
+                    indices.get(w, np.zeros(0, dtype=np.int64)),
+                    indices.get(w - 1, np.zeros(0, dtype=np.int64)) | (1 << bit),
+                )
+            )
+            for w in range(low, high + 1)
+        }
+    return indices[hamming_weight]
+
+
+def popcount(x: np.ndarray) -> np.ndarray:
+    """Count the set bits of non-negative integers elementwise.
+
+    Args:
+        x (np.ndarray): Integers with at most 64 bits.
+
+    Returns:
+        np.ndarray: The number of set bits of each entry.
+    """
+    x = np.asarray(x, dtype=np.uint64)
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + (
+        (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((x * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+def parity(x: np.ndarray) -> np.ndarray:
+    """Return the parity (0 or 1) of the set bits of non-negative integers.
+
+    Args:
+        x (np.ndarray): Integers with at most 64 bits.
+
+    Returns:
+        np.ndarray: 1 where the number of set bits is odd, 0 otherwise.
+    """
+    x = np.asarray(x, dtype=np.uint64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        x = x ^ (x >> np.uint64(shift))
+    return (x & np.uint64(1)).astype(np.int8)
 
 
 def pairwise(iterable: range) -> List: